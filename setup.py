@@ -26,6 +26,9 @@ VERSION = None
 # What packages are required for this module to be executed?
 REQUIRED = ["lxml", "pytz"]
 
+# What packages are optional?
+EXTRAS = {"numpy": ["numpy"], "arrow": ["pyarrow"]}
+
 # The rest you shouldn't have to touch too much :)
 # ------------------------------------------------
 # Except, perhaps the License and Trove Classifiers!
@@ -98,6 +101,7 @@ setup(
     packages=find_packages("src"),
     package_dir={"": "src"},
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
     include_package_data=True,
     license="MIT",
     classifiers=[
@@ -7,5 +7,6 @@ ZoneAlerte class allows to fetch active weather alerts for a french department.
 
 from .vigilance_proxy import VigilanceMeteoFranceProxy, VigilanceMeteoError
 from .department_weather_alert import DepartmentWeatherAlert
+from .location import DepartmentResolver
 from .__version__ import __version__, VERSION
 
@@ -0,0 +1,379 @@
+# coding: utf-8
+"""Functions to extract the content of the Météo France weather alert bulletin."""
+import hashlib
+import sys
+from datetime import datetime
+
+from pytz import timezone
+
+from vigilancemeteo.constants import (
+    ALERT_COLOR_LIST,
+    ALERT_TYPE_LIST,
+    COASTAL_DEPARTMENT_LIST,
+    EQUIVALENCE_75,
+    VALID_DEPARTMENT_LIST,
+)
+
+# Manage differences beetween python 2.7 and 3.6
+if sys.version_info < (3, 0):
+    _string_types = basestring  # pylint: disable=undefined-variable
+else:
+    _string_types = str
+
+# Departments in the order of the rows of the color matrix. '20' is not a
+# department since 1976.
+MATRIX_DEPARTMENT_LIST = [dep for dep in VALID_DEPARTMENT_LIST if dep != "20"]
+_MATRIX_DEPARTMENT_SET = frozenset(MATRIX_DEPARTMENT_LIST)
+
+
+def extract_alerts(xml_tree):
+    """Return the active alerts of every zone described in the bulletin.
+
+    The result is a dictionary with the zone of the bulletin as key (department
+    or coastal zone like '2A10') and a tuple of (alert type, color) indices as
+    value. Indices start at 0 like ALERT_TYPE_LIST and ALERT_COLOR_LIST. The
+    tuples keep the order of the XML file.
+    """
+    alerts_table = {}
+    for alerts_group in xml_tree.xpath("/CV/DV"):
+        # Get the color of the alert group
+        color = int(alerts_group.get("coul")) - 1
+        alerts = tuple(
+            (int(active_alert.get("val")) - 1, color) for active_alert in alerts_group
+        )
+        zone = alerts_group.get("dep")
+        alerts_table[zone] = alerts_table.get(zone, ()) + alerts
+    return alerts_table
+
+
+def department_colors(alerts_table, department):
+    """Return the color index of each alert type for a department.
+
+    The alerts of the coastal zone are included for coastal departments.
+    """
+    colors = [0] * len(ALERT_TYPE_LIST)
+    zones = [department]
+    if department in COASTAL_DEPARTMENT_LIST:
+        zones.append(department + "10")
+    for zone in zones:
+        for alert_type, color in alerts_table.get(zone, ()):
+            colors[alert_type] = color
+    return colors
+
+
+def build_color_matrix(alerts_table):
+    """Return the color indices of all departments as a compact bytearray.
+
+    There is a row of len(ALERT_TYPE_LIST) bytes for each department of
+    MATRIX_DEPARTMENT_LIST. Departments of EQUIVALENCE_75 use the 75 alerts.
+    """
+    color_matrix = bytearray()
+    for department in MATRIX_DEPARTMENT_LIST:
+        if department in EQUIVALENCE_75:
+            department = "75"
+        color_matrix.extend(department_colors(alerts_table, department))
+    return color_matrix
+
+
+def build_alert_index(color_matrix):
+    """Return the departments at risk for each alert type and minimal color.
+
+    The result is a tuple with an item for each alert type of ALERT_TYPE_LIST.
+    Each item is a tuple with, for each color of ALERT_COLOR_LIST, the bitmask
+    of the rows of the color matrix (see build_color_matrix()) at this color or
+    a more critical one.
+    """
+    type_count = len(ALERT_TYPE_LIST)
+    index = [[0] * len(ALERT_COLOR_LIST) for _ in ALERT_TYPE_LIST]
+    for position, color in enumerate(color_matrix):
+        row, alert_type = divmod(position, type_count)
+        masks = index[alert_type]
+        for min_color in range(color + 1):
+            masks[min_color] |= 1 << row
+    return tuple(tuple(masks) for masks in index)
+
+
+def departments_from_mask(mask):
+    """Return the departments of a bitmask of the rows of the color matrix."""
+    departments = []
+    row = 0
+    while mask:
+        if mask & 1:
+            departments.append(MATRIX_DEPARTMENT_LIST[row])
+        mask >>= 1
+        row += 1
+    return departments
+
+
+def alerts_content_hash(alerts_table):
+    """Return a hash of the alerts extracted from a bulletin."""
+    content = repr(sorted(alerts_table.items())).encode("utf-8")
+    return hashlib.sha1(content).hexdigest()
+
+
+def _parse_date(string_date):
+    """Convert a bulletin date string in date and time with Europe/Paris timezone."""
+    annee = int(string_date[0:4])
+    mois = int(string_date[4:6])
+    jour = int(string_date[6:8])
+    heure = int(string_date[8:10])
+    minute = int(string_date[10:12])
+    seconde = int(string_date[12:14])
+    paris_timezone = timezone("Europe/Paris")
+    return paris_timezone.localize(datetime(annee, mois, jour, heure, minute, seconde))
+
+
+def extract_bulletin_date(xml_tree):
+    """Return the bulletin date & time with Europe/Paris timezone."""
+    return _parse_date(xml_tree.xpath("/CV/EV")[0].get("dateinsert"))
+
+
+class BulletinMetadata(object):
+    """Class to describe the metadata of a weather alert bulletin.
+
+    The raw values are captured from the XML tree when the bulletin is parsed.
+    They are converted on first access only and the result is memoized, so the
+    XML tree doesn't have to be kept.
+
+    Public attributes:
+    - forecast_date = end of validity of the bulletin ('dateprevue')
+    - run_date = date of the forecast run ('daterun')
+    - forecast_range = validity range in hours ('echeance')
+    - version = version of the bulletin ('noversion')
+    - flood_departments = departments with flood information ('crueint')
+    - advice = behaviour advice text ('VCONSEIL')
+    - comment = weather comment text ('VCOMMENTAIRE')
+    """
+
+    __slots__ = ("_attributes", "_cache")
+
+    def __init__(self, attributes):
+        """Class instance constructor.
+
+        'attributes' is a dictionary of the raw string values.
+        """
+        self._attributes = attributes
+        self._cache = {}
+
+    @classmethod
+    def from_xml_tree(cls, xml_tree):
+        """Capture the raw metadata of a bulletin XML tree."""
+        attributes = dict(xml_tree.xpath("/CV/EV")[0].attrib)
+        # Element.get() returns plain strings unlike XPath "smart" strings which
+        # keep a reference to the XML tree.
+        for tag in ["VCONSEIL", "VCOMMENTAIRE"]:
+            elements = xml_tree.xpath("/CV/EV/" + tag)
+            if elements:
+                attributes[tag] = elements[0].get("texte")
+        return cls(attributes)
+
+    def _get(self, name, convert):
+        """Return the converted value of a raw attribute (None if missing)."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            raw_value = self._attributes.get(name)
+            value = convert(raw_value) if raw_value is not None else None
+            self._cache[name] = value
+            return value
+
+    @property
+    def forecast_date(self):
+        """Getter for the end of validity date of the bulletin"""
+        return self._get("dateprevue", _parse_date)
+
+    @property
+    def run_date(self):
+        """Getter for the date of the forecast run"""
+        return self._get("daterun", _parse_date)
+
+    @property
+    def forecast_range(self):
+        """Getter for the validity range of the bulletin in hours"""
+        return self._get("echeance", int)
+
+    @property
+    def version(self):
+        """Getter for the version of the bulletin"""
+        return self._get("noversion", int)
+
+    @property
+    def flood_departments(self):
+        """Getter for the tuple of departments with flood information"""
+        return self._get(
+            "crueint", lambda value: tuple(dep for dep in value.split(",") if dep)
+        )
+
+    @property
+    def advice(self):
+        """Getter for the behaviour advice text"""
+        return self._get("VCONSEIL", lambda value: value)
+
+    @property
+    def comment(self):
+        """Getter for the weather comment text"""
+        return self._get("VCOMMENTAIRE", lambda value: value)
+
+
+class BulletinAlerts(object):
+    """Class to describe the alerts of a weather alert bulletin.
+
+    Objects are immutable and shared by all the snapshots with the same alerts.
+    Values derived from the alerts are computed once and memoized.
+
+    Public attributes:
+    - content_hash = hash of the alerts (see alerts_content_hash())
+    - color_matrix = color indices of all departments (see build_color_matrix())
+    - alert_index = departments at risk for each alert type and minimal color
+      (see build_alert_index())
+
+    Public Methods:
+    - get_alert_list(department): return a new alert list of a department
+      (alert type as key and color as value).
+    - get_departments_at_risk(alert_types, min_color): return the departments
+      with an alert of one of the types at min_color or a more critical one.
+    - get_zone_colors(zone): return the color index of each alert type for a
+      zone of the bulletin (department or coastal zone like '2A10').
+    - cached(name, function): return function(self), computed only once.
+    """
+
+    __slots__ = ("_alerts_table", "content_hash", "_cache")
+
+    def __init__(self, alerts_table):
+        """Class instance constructor.
+
+        'alerts_table' is the result of extract_alerts().
+        """
+        object.__setattr__(self, "_alerts_table", alerts_table)
+        object.__setattr__(self, "content_hash", alerts_content_hash(alerts_table))
+        object.__setattr__(self, "_cache", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BulletinAlerts objects are immutable")
+
+    def cached(self, name, function):
+        """Return function(self), computed on first call only."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            return self._cache.setdefault(name, function(self))
+
+    def get_alert_list(self, department):
+        """Return the alert list of a department.
+
+        For all alert types, a status (Vert, Jaune, Orange, Rouge) is returned.
+        Departments of EQUIVALENCE_75 are not in the bulletin: they get the 75
+        alerts, like in the color matrix. The memoized value is an immutable tuple of (alert type, status) pairs
+        and each call returns a new dict: callers can modify, copy or pickle
+        it. The pairs are memoized for the departments of
+        MATRIX_DEPARTMENT_LIST only, so unknown values can't grow the cache of
+        a snapshot.
+        """
+
+        def build_alert_items(alerts):
+            """Build the (alert type, status) pairs of the department."""
+            zone = "75" if department in EQUIVALENCE_75 else department
+            colors = department_colors(alerts._alerts_table, zone)
+            return tuple(
+                (alert_type, ALERT_COLOR_LIST[color])
+                for alert_type, color in zip(ALERT_TYPE_LIST, colors)
+            )
+
+        if department not in _MATRIX_DEPARTMENT_SET:
+            return dict(build_alert_items(self))
+        return dict(self.cached(("alert_list", department), build_alert_items))
+
+    def get_zone_colors(self, zone):
+        """Return the color index of each alert type for a zone of the bulletin.
+
+        Unlike get_alert_list(), the alerts of a coastal zone (department
+        followed by '10') are not merged with the alerts of the department.
+        """
+        colors = [0] * len(ALERT_TYPE_LIST)
+        for alert_type, color in self._alerts_table.get(zone, ()):
+            colors[alert_type] = color
+        return colors
+
+    def get_departments_at_risk(self, alert_types=None, min_color="Orange"):
+        """Return the departments at risk, in MATRIX_DEPARTMENT_LIST order.
+
+        A department is at risk if an alert of one of 'alert_types' (an alert
+        type or an iterable of alert types, all types by default) is at
+        'min_color' or a more critical color. The result is a tuple computed
+        once per query.
+        """
+        if alert_types is None:
+            alert_types = ALERT_TYPE_LIST
+        elif isinstance(alert_types, _string_types):
+            alert_types = [alert_types]
+        else:
+            alert_types = list(alert_types)
+        key = ("departments_at_risk", frozenset(alert_types), min_color)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        if min_color not in ALERT_COLOR_LIST:
+            raise ValueError(
+                "min_color parameter have to be in {}. Used value: {}".format(
+                    ALERT_COLOR_LIST, min_color
+                )
+            )
+        color = ALERT_COLOR_LIST.index(min_color)
+        mask = 0
+        for alert_type in alert_types:
+            if alert_type not in ALERT_TYPE_LIST:
+                raise ValueError(
+                    "alert_types parameter have to be in {}. Used value: {}".format(
+                        ALERT_TYPE_LIST, alert_type
+                    )
+                )
+            mask |= self.alert_index[ALERT_TYPE_LIST.index(alert_type)][color]
+        return self._cache.setdefault(key, tuple(departments_from_mask(mask)))
+
+    @property
+    def color_matrix(self):
+        """Color indices of all departments (see build_color_matrix())."""
+        return self.cached(
+            "color_matrix", lambda alerts: build_color_matrix(alerts._alerts_table)
+        )
+
+    @property
+    def alert_index(self):
+        """Departments at risk for each alert type (see build_alert_index())."""
+        return self.cached(
+            "alert_index", lambda alerts: build_alert_index(alerts.color_matrix)
+        )
+
+
+class BulletinSnapshot(object):
+    """Class to describe a published version of a weather alert bulletin.
+
+    Objects are immutable. The proxy publishes a new snapshot for each bulletin
+    and DepartmentWeatherAlert instances share a reference to it.
+
+    Public attributes:
+    - checksum = checksum of the bulletin
+    - bulletin_date = date of the bulletin (with timezone)
+    - metadata = metadata of the bulletin (BulletinMetadata)
+    - alerts = alerts of the bulletin (BulletinAlerts)
+    """
+
+    __slots__ = ("checksum", "bulletin_date", "metadata", "alerts")
+
+    def __init__(self, checksum, bulletin_date, metadata, alerts):
+        """Class instance constructor."""
+        object.__setattr__(self, "checksum", checksum)
+        object.__setattr__(self, "bulletin_date", bulletin_date)
+        object.__setattr__(self, "metadata", metadata)
+        object.__setattr__(self, "alerts", alerts)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BulletinSnapshot objects are immutable")
+
+    def __repr__(self):
+        """Instance representation"""
+        return "BulletinSnapshot(checksum='{}', bulletin_date='{}')".format(
+            self.checksum, self.bulletin_date
+        )
@@ -153,11 +153,53 @@ COASTAL_DEPARTMENT_LIST = [
 # Department equivalent to 75
 EQUIVALENCE_75 = ["92", "93", "94"]
 
+# Postal code prefixes of Corsica departments (postal codes start with 20)
+CORSICA_POSTAL_CODE_PREFIXES = {
+    "200": "2A",
+    "201": "2A",
+    "202": "2B",
+    "203": "2B",
+    "204": "2B",
+    "205": "2B",
+    "206": "2B",
+}
+
+# INSEE code of Andorre (foreign country codes start with 99)
+INSEE_CODE_ANDORRE = "99130"
+
+# Departments of each of the 13 regions of metropolitan France
+REGION_DEPARTMENTS = {
+    "Auvergne-Rhône-Alpes": [
+        "01", "03", "07", "15", "26", "38", "42", "43", "63", "69", "73", "74",
+    ],
+    "Bourgogne-Franche-Comté": ["21", "25", "39", "58", "70", "71", "89", "90"],
+    "Bretagne": ["22", "29", "35", "56"],
+    "Centre-Val de Loire": ["18", "28", "36", "37", "41", "45"],
+    "Corse": ["2A", "2B"],
+    "Grand Est": ["08", "10", "51", "52", "54", "55", "57", "67", "68", "88"],
+    "Hauts-de-France": ["02", "59", "60", "62", "80"],
+    "Île-de-France": ["75", "77", "78", "91", "92", "93", "94", "95"],
+    "Normandie": ["14", "27", "50", "61", "76"],
+    "Nouvelle-Aquitaine": [
+        "16", "17", "19", "23", "24", "33", "40", "47", "64", "79", "86", "87",
+    ],
+    "Occitanie": [
+        "09", "11", "12", "30", "31", "32", "34", "46", "48", "65", "66", "81", "82",
+    ],
+    "Pays de la Loire": ["44", "49", "53", "72", "85"],
+    "Provence-Alpes-Côte d'Azur": ["04", "05", "06", "13", "83", "84"],
+}
+
+# Bulletins
+BULLETIN_TODAY = "today"
+BULLETIN_TOMORROW = "tomorrow"
+
 # Status
 UPDATE_STATUS_CHECKSUM_CACHED_60S = "checksum_cached_60s"
 UPDATE_STATUS_SAME_CHECKSUM = "same_checksum"
 UPDATE_STATUS_CHECKSUM_UPDATED = "checksum_updated"
 UPDATE_STATUS_XML_UPDATED = "xml_updated"
+UPDATE_STATUS_SAME_CONTENT = "same_content"
 UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID = "previous_bulletin"
 UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED = "bulletin_expired"
 
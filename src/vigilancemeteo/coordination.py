@@ -0,0 +1,127 @@
+# coding: utf-8
+"""Implement a class to share the polling of Météo France between processes."""
+import os
+import tempfile
+import time
+
+from vigilancemeteo.fork import reinit_after_fork
+from vigilancemeteo.sources import BulletinSource
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+CHECKSUM_FILE_NAME = "vigilance_controle.txt"
+ZIP_FILE_NAME = "vigilance.zip"
+LOCK_FILE_NAME = "leader.lock"
+
+
+class PollingCoordinator(object):
+    """Class to elect the process polling Météo France among the processes of a host.
+
+    The processes share a directory. The process holding the lock file of the
+    directory is the leader: it polls the sources and publishes the files it
+    downloads in the directory. The other processes are followers: they read
+    the files published by the leader. The leader rewrites the checksum file on
+    each successful poll, so its age tells if the leader still polls. The lock
+    is released by the system when the leader dies, so a follower takes over
+    on its next poll. Forked processes are followers.
+
+    Public attributes:
+    - directory = directory shared by the processes
+    - leader = True if the process is the leader
+
+    Public Methods:
+    - try_lead(): return True if the process is (or becomes) the leader.
+    - release(): stop being the leader.
+    - source(): return the BulletinSource of the files published by the leader.
+    - published_age(): return the age of the checksum file published by the
+      leader.
+    - publish(files): publish the files atomically in the directory.
+    """
+
+    def __init__(self, directory):
+        """Class instance constructor."""
+        if fcntl is None:
+            raise IOError("Error: file locks are not available on this platform")
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self._lock_file = None
+        reinit_after_fork(self)
+
+    def _after_fork_in_child(self):
+        """Don't inherit the leadership in a forked process.
+
+        The lock belongs to the parent: closing the copy of the file in the
+        child doesn't release it.
+        """
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    @property
+    def leader(self):
+        """True if the process is the leader."""
+        return self._lock_file is not None
+
+    def try_lead(self):
+        """Return True if the process is the leader, trying to become it if not."""
+        if self._lock_file is None:
+            lock_file = open(os.path.join(self.directory, LOCK_FILE_NAME), "a")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (OSError, IOError):
+                # Another process is the leader
+                lock_file.close()
+            else:
+                self._lock_file = lock_file
+        return self.leader
+
+    def release(self):
+        """Stop being the leader."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def source(self, xml_file_names, zip_file_name=ZIP_FILE_NAME):
+        """Return the BulletinSource of the files published by the leader.
+
+        'xml_file_names' is a dictionary with the file name of each bulletin.
+        """
+        url = "file:" + os.path.abspath(self.directory) + "/"
+        return BulletinSource(
+            "leader",
+            url + CHECKSUM_FILE_NAME,
+            dict(
+                (bulletin, os.path.join(self.directory, file_name))
+                for bulletin, file_name in xml_file_names.items()
+            ),
+            url + zip_file_name,
+        )
+
+    def published_age(self):
+        """Return the age in seconds of the checksum file published by the leader.
+
+        None if the leader published nothing yet.
+        """
+        try:
+            return time.time() - os.path.getmtime(
+                os.path.join(self.directory, CHECKSUM_FILE_NAME)
+            )
+        except OSError:
+            return None
+
+    def publish(self, files):
+        """Publish files atomically in the directory.
+
+        'files' is a list of (file name, content as bytes) tuples. Files are
+        written in the list order, so the checksum file should be the last one.
+        """
+        for file_name, content in files:
+            descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(descriptor, "wb") as temporary_file:
+                temporary_file.write(content)
+            os.chmod(temporary_path, 0o644)
+            os.rename(temporary_path, os.path.join(self.directory, file_name))
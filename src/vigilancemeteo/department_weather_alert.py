@@ -19,6 +19,8 @@ class DepartmentWeatherAlert(object):
     - alerts_list: return the list of all alert types.
     - proxy: return the client (Class VigilanceMeteoFranceProxy) used by the 
       object
+    - snapshot: return the bulletin snapshot (Class BulletinSnapshot) shared with
+      the proxy. Alerts and bulletin date always come from the same bulletin.
 
     Methods from DepartmentWeatherAlert class:
     - update_department_status(): update alerts list by feching latest info from
@@ -28,18 +30,23 @@ class DepartmentWeatherAlert(object):
       the string return change: 'text' (default) or 'html'
     """
 
-    def __init__(self, department, vmf_proxy=None):
+    __slots__ = ("_department", "_viglance_MF_proxy", "_snapshot", "_bulletin")
+
+    def __init__(self, department, vmf_proxy=None, bulletin=None):
         """Class instance constructor.
 
-        2 arguments expected:
+        3 arguments expected:
          - The department (Required) number as a 2 character String. Can be between 01 and 95,
            2A, 2B or 99 (for Andorre).
          - a VigilanceMeteoFranceProxy object (Optional) to manage de communication with the
            Météo France online source.
+         - the name of the bulletin (Optional) to use (BULLETIN_TODAY or
+           BULLETIN_TOMORROW). By default the first bulletin of the proxy.
         """
 
         # Variables init
-        self._alerts_list = {}
+        self._snapshot = None
+        self._bulletin = bulletin
         self._department = None
         # If no VigilanceMeteoFranceProxy set in the parameter create a new one.
         if vmf_proxy is not None:
@@ -58,9 +65,9 @@ class DepartmentWeatherAlert(object):
         website and update the variable 'alerts_list'.
         """
         try:
-            self._alerts_list = self._viglance_MF_proxy.get_alert_list(self.department)
+            self._snapshot = self._viglance_MF_proxy.get_snapshot(self._bulletin)
         except VigilanceMeteoError:
-            self._alerts_list = {}
+            self._snapshot = None
 
     def __repr__(self):
         """"instance representation"""
@@ -158,12 +165,21 @@ class DepartmentWeatherAlert(object):
     @property
     def bulletin_date(self):
         """Accessor and setter for bulletin update date"""
-        return self._viglance_MF_proxy.bulletin_date
+        if self._snapshot is None:
+            return None
+        return self._snapshot.bulletin_date
 
     @property
     def alerts_list(self):
-        """Accessor and setter for weather alerts list"""
-        return self._alerts_list
+        """Accessor and setter for weather alerts list (a copy owned by the caller)"""
+        if self._snapshot is None:
+            return {}
+        return self._snapshot.alerts.get_alert_list(self._department)
+
+    @property
+    def snapshot(self):
+        """Accessor for the bulletin snapshot shared with the proxy"""
+        return self._snapshot
 
     @property
     def department(self):
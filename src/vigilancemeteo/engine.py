@@ -0,0 +1,278 @@
+# coding: utf-8
+"""Implement the state machine of the proxy, without any network or clock access.
+
+The engine is fed with the checksum text and the data sources downloaded by a
+front end (the blocking VigilanceMeteoFranceProxy, an event loop, a replay of
+recorded files...) and with the current time. It parses the bulletins, decides
+what has to be downloaded and updates the status.
+"""
+import hashlib
+import io
+import re
+import zipfile
+from datetime import timedelta
+
+from lxml import etree
+
+from vigilancemeteo.bulletin import (
+    BulletinAlerts,
+    BulletinMetadata,
+    BulletinSnapshot,
+    extract_alerts,
+    extract_bulletin_date,
+)
+from vigilancemeteo.constants import (
+    BULLETIN_TODAY,
+    UPDATE_STATUS_CHECKSUM_CACHED_60S,
+    UPDATE_STATUS_CHECKSUM_UPDATED,
+    UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED,
+    UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID,
+    UPDATE_STATUS_SAME_CHECKSUM,
+    UPDATE_STATUS_SAME_CONTENT,
+    UPDATE_STATUS_XML_UPDATED,
+)
+
+
+class VigilanceMeteoError(Exception):
+    """Error class, used when fetching or parsing vigilance.meteofrance.com website."""
+
+
+def parse_checksum(text):
+    """Return the checksum and the advertised size of the compressed data source.
+
+    'text' is the content of the checksum file (vigilance_controle.txt). The
+    checksum is None if the file is not valid, the size is None if missing.
+    """
+    checksum = re.search(r"\n(.+?)\s", text)
+    payload_size = re.search(r"\n\S+\s+(\d+)\s", text)
+    return (
+        checksum.group(1) if checksum is not None else None,
+        int(payload_size.group(1)) if payload_size is not None else None,
+    )
+
+
+class BulletinEngine(object):
+    """Class to manage the state of the weather alert bulletins.
+
+    The engine does no input/output and doesn't read the clock: 'now' is a
+    timezone aware datetime given by the caller. A front end updates the
+    bulletins with:
+    1. checksum_due(now): if False, call checksum_cached() and stop.
+    2. download the checksum file, then call checksum_received(text, now), or
+       checksum_unreachable(now) if the download failed.
+    3. if checksum_received() returned True, download the data sources of the
+       bulletins of pending_bulletins() and call payloads_received(payloads, now).
+
+    A bulletin is pending until its snapshot has the latest checksum: a bulletin
+    whose download failed is downloaded again on the next due poll, even if the
+    checksum didn't change.
+
+    Public attributes:
+    - status = current status (possible value in constants.py)
+    - checksum = checksum of the latest bulletin
+    - checksum_text = content of the latest checksum file
+    - payload_size = size of the compressed data source advertised in the
+      latest checksum file (None if not advertised)
+    - latest_check_date = date of the latest download of the checksum file
+    - bulletin_date = date of the first bulletin (with timezone)
+    - snapshots = latest published snapshot of each bulletin
+    - xml_trees = XML tree of each bulletin (None if keep_xml_tree is False)
+    """
+
+    # Delay before downloading again the checksum file
+    CHECKSUM_CACHE_DELAY = timedelta(seconds=60)
+
+    # Delay after which a bulletin is expired
+    BULLETIN_VALIDITY = timedelta(days=1)
+
+    def __init__(
+        self, bulletins=None, compressed=False, zip_members=None, keep_xml_tree=True
+    ):
+        """Class instance constructor.
+
+        'bulletins' is the list of the names of the bulletins (BULLETIN_TODAY by
+        default). The first one decides if the engine is in error.
+        If 'compressed' is True, data sources are compressed data sources
+        (vigilance.zip) and 'zip_members' is a dictionary with the name of each
+        bulletin inside the archive.
+        """
+        self._bulletins = list(bulletins) if bulletins else [BULLETIN_TODAY]
+        self._compressed = compressed
+        self._zip_members = zip_members or {}
+        self._keep_xml_tree = keep_xml_tree
+        self._payload_hashes = {}
+        self.status = None
+        self.checksum = None
+        self.checksum_text = None
+        self.payload_size = None
+        self.latest_check_date = None
+        self.bulletin_date = None
+        self.snapshots = {}
+        self.xml_trees = {}
+
+    @property
+    def bulletins(self):
+        """Names of the bulletins managed by the engine"""
+        return list(self._bulletins)
+
+    def checksum_due(self, now):
+        """Return True if the checksum file has to be downloaded."""
+        return (
+            self.latest_check_date is None
+            or now - self.latest_check_date > self.CHECKSUM_CACHE_DELAY
+        )
+
+    def checksum_cached(self):
+        """Record that the checksum file was downloaded less than 60s ago."""
+        self.status = UPDATE_STATUS_CHECKSUM_CACHED_60S
+
+    def _is_valid(self, now):
+        """Return True if the latest bulletin is old of less than 24 hours."""
+        return (
+            self.bulletin_date is not None
+            and now - self.bulletin_date < self.BULLETIN_VALIDITY
+        )
+
+    def checksum_unreachable(self, now):
+        """Record that the checksum file couldn't be downloaded.
+
+        Raise a VigilanceMeteoError if the bulletin has expired.
+        """
+        if self._is_valid(now):
+            # If the bulletin is old of less than 24 hours. It's OK to keep it.
+            self.status = UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID
+            return
+        self.status = UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED
+        raise VigilanceMeteoError(
+            "Error: 'vigilance_controle.txt' unreachable and weather alert bulletin has expired"
+        )
+
+    def pending_bulletins(self):
+        """Return the bulletins without a snapshot of the latest checksum."""
+        return [
+            bulletin
+            for bulletin in self._bulletins
+            if bulletin not in self.snapshots
+            or self.snapshots[bulletin].checksum != self.checksum
+        ]
+
+    def checksum_received(self, text, now):
+        """Record a new checksum file.
+
+        Return True if data sources have to be downloaded: new checksum, or
+        bulletins whose previous download failed (see pending_bulletins()).
+        """
+        checksum, payload_size = parse_checksum(text)
+        self.latest_check_date = now
+        self.checksum_text = text
+        self.payload_size = payload_size
+        if checksum == self.checksum:
+            self.status = UPDATE_STATUS_SAME_CHECKSUM
+            return bool(self.pending_bulletins())
+        self.checksum = checksum
+        self.status = UPDATE_STATUS_CHECKSUM_UPDATED
+        return True
+
+    def payloads_received(self, payloads, now):
+        """Publish the data sources of the bulletins.
+
+        'payloads' is a dictionary with the bulletin name as key and the data
+        source (bytes) or the exception raised by its download as value, for
+        the pending bulletins at least. The first bulletin decides the status:
+        if its download failed with an IOError, the previous bulletin is kept
+        while it's valid, else a VigilanceMeteoError is raised. Other exceptions
+        are raised as is. The other bulletins keep their previous snapshot if
+        they failed. The bulletins which failed stay pending.
+        """
+        primary_payload = payloads.get(self._bulletins[0])
+        if primary_payload is None:
+            # Only the other bulletins are downloaded again: status unchanged
+            pass
+        elif isinstance(primary_payload, (OSError, IOError)):
+            # Didn't succeed to download the xml file
+            if self._is_valid(now):
+                # If the bulletin is old of less than 24 hours, it's OK to keep it.
+                self.status = UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID
+            else:
+                # If the bulletin is older than 24 hours, it raises an Error
+                self.status = UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED
+                # Delete lasest check date to be sure every other future call
+                # won't use the cached data
+                self.latest_check_date = None
+                raise VigilanceMeteoError(
+                    "Error: 'NXFR33_LFPX_.xml' unreachable and weather alert bulletin has expired"
+                )
+        elif isinstance(primary_payload, Exception):
+            raise primary_payload
+        else:
+            self.status = self.publish(self._bulletins[0], primary_payload)
+            self.bulletin_date = self.snapshots[self._bulletins[0]].bulletin_date
+
+        for bulletin in self._bulletins[1:]:
+            if bulletin in payloads and not isinstance(payloads[bulletin], Exception):
+                try:
+                    self.publish(bulletin, payloads[bulletin])
+                except (OSError, IOError, etree.XMLSyntaxError):
+                    pass
+
+    def publish(self, bulletin, payload):
+        """Parse the data source of a bulletin and publish its new snapshot.
+
+        Return the status of the update of the bulletin.
+        """
+        previous_snapshot = self.snapshots.get(bulletin)
+
+        # A new checksum doesn't mean a new bulletin. Nothing to parse if
+        # the data source is the same as the previous one.
+        payload_hash = hashlib.sha1(payload).hexdigest()
+        if payload_hash == self._payload_hashes.get(bulletin):
+            self.snapshots[bulletin] = BulletinSnapshot(
+                self.checksum,
+                previous_snapshot.bulletin_date,
+                previous_snapshot.metadata,
+                previous_snapshot.alerts,
+            )
+            return UPDATE_STATUS_SAME_CONTENT
+
+        # Parse the new xml source
+        xml_tree = self.parse_payload(payload, bulletin)
+        bulletin_date = extract_bulletin_date(xml_tree)
+        metadata = BulletinMetadata.from_xml_tree(xml_tree)
+        alerts = BulletinAlerts(extract_alerts(xml_tree))
+
+        # Keep the previous alerts if they didn't change
+        if (
+            previous_snapshot is not None
+            and alerts.content_hash == previous_snapshot.alerts.content_hash
+        ):
+            alerts = previous_snapshot.alerts
+            status = UPDATE_STATUS_SAME_CONTENT
+        else:
+            status = UPDATE_STATUS_XML_UPDATED
+
+        # Publish the new snapshot
+        self._payload_hashes[bulletin] = payload_hash
+        self.xml_trees[bulletin] = xml_tree if self._keep_xml_tree else None
+        self.snapshots[bulletin] = BulletinSnapshot(
+            self.checksum, bulletin_date, metadata, alerts
+        )
+        return status
+
+    def parse_payload(self, payload, bulletin=BULLETIN_TODAY):
+        """Return the XML tree of a bulletin in a data source.
+
+        With the compressed data source, the XML member is decompressed straight
+        into the parser.
+        """
+        if not self._compressed:
+            return etree.parse(io.BytesIO(payload))  # pylint disable=c-extension-no-member
+
+        with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+            try:
+                xml_file = archive.open(self._zip_members[bulletin])
+            except KeyError as error:
+                raise IOError("Error: 'vigilance.zip' is not valid ({})".format(error))
+            try:
+                return etree.parse(xml_file)  # pylint disable=c-extension-no-member
+            finally:
+                xml_file.close()
@@ -0,0 +1,126 @@
+# coding: utf-8
+"""Functions to export the alerts of bulletins as typed columns for analytics.
+
+The columns are contiguous buffers with one row per (bulletin, department,
+alert type):
+- 'department': index of the department in MATRIX_DEPARTMENT_LIST (uint8)
+- 'alert_type': index of the alert type in ALERT_TYPE_LIST (uint8)
+- 'color': index of the color in ALERT_COLOR_LIST (uint8)
+- 'bulletin_date': date of the bulletin in seconds since epoch, UTC (int64)
+
+NumPy and pyarrow are optional: they are imported only when used, and wrap the
+buffers without copying them.
+"""
+import calendar
+import sys
+from array import array
+
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import ALERT_TYPE_LIST
+
+# Manage differences beetween python 2.7 and 3.6 ('q' typecode is python 3.3+)
+if sys.version_info < (3, 3):
+    _INT64_TYPECODE = "l"
+else:
+    _INT64_TYPECODE = "q"
+
+# Names of the columns in the export order
+COLUMNS = ["department", "alert_type", "color", "bulletin_date"]
+
+# Output formats of export_alerts()
+OUTPUT_ARRAY = "array"
+OUTPUT_NUMPY = "numpy"
+OUTPUT_ARROW = "arrow"
+
+# Department and alert type columns of one bulletin (same order as the rows of
+# the color matrix)
+_BULLETIN_DEPARTMENTS = bytearray(
+    row for row in range(len(MATRIX_DEPARTMENT_LIST)) for _ in ALERT_TYPE_LIST
+)
+_BULLETIN_ALERT_TYPES = bytearray(range(len(ALERT_TYPE_LIST))) * len(
+    MATRIX_DEPARTMENT_LIST
+)
+
+
+def _timestamp(snapshot):
+    """Return the bulletin date of a snapshot in seconds since epoch."""
+    if snapshot.bulletin_date is None:
+        raise ValueError("Error: {} has no bulletin date".format(snapshot))
+    return calendar.timegm(snapshot.bulletin_date.utctimetuple())
+
+
+def _build_columns(snapshots):
+    """Return the columns of the snapshots as buffers of the standard library."""
+    colors = bytearray()
+    timestamps = array(_INT64_TYPECODE)
+    for snapshot in snapshots:
+        colors += snapshot.alerts.color_matrix
+        timestamps.extend([_timestamp(snapshot)] * len(_BULLETIN_DEPARTMENTS))
+    return {
+        "department": _BULLETIN_DEPARTMENTS * len(snapshots),
+        "alert_type": _BULLETIN_ALERT_TYPES * len(snapshots),
+        "color": colors,
+        "bulletin_date": timestamps,
+    }
+
+
+def _to_numpy(columns):
+    """Wrap the columns in NumPy arrays without copy."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    return {
+        "department": numpy.frombuffer(columns["department"], dtype=numpy.uint8),
+        "alert_type": numpy.frombuffer(columns["alert_type"], dtype=numpy.uint8),
+        "color": numpy.frombuffer(columns["color"], dtype=numpy.uint8),
+        "bulletin_date": numpy.frombuffer(
+            columns["bulletin_date"], dtype="datetime64[s]"
+        ),
+    }
+
+
+def _to_arrow(columns):
+    """Wrap the columns in a pyarrow Table without copy."""
+    import pyarrow  # pylint: disable=import-outside-toplevel
+
+    length = len(columns["color"])
+    types = {
+        "department": pyarrow.uint8(),
+        "alert_type": pyarrow.uint8(),
+        "color": pyarrow.uint8(),
+        "bulletin_date": pyarrow.timestamp("s", tz="UTC"),
+    }
+    return pyarrow.Table.from_arrays(
+        [
+            pyarrow.Array.from_buffers(
+                types[name], length, [None, pyarrow.py_buffer(columns[name])]
+            )
+            for name in COLUMNS
+        ],
+        names=COLUMNS,
+    )
+
+
+def export_alerts(snapshots, output=OUTPUT_ARRAY):
+    """Return the alerts of one or several bulletin snapshots as typed columns.
+
+    'output' can be:
+    - OUTPUT_ARRAY: dictionary of bytearray (uint8) and array.array (int64)
+      columns, without dependency
+    - OUTPUT_NUMPY: dictionary of NumPy arrays ('bulletin_date' as
+      datetime64[s])
+    - OUTPUT_ARROW: pyarrow Table ('bulletin_date' as timestamp[s, UTC])
+    """
+    if not isinstance(snapshots, (list, tuple)):
+        snapshots = [snapshots]
+    if output not in [OUTPUT_ARRAY, OUTPUT_NUMPY, OUTPUT_ARROW]:
+        raise ValueError(
+            "output of export_alerts() only accept '{}', '{}' or '{}' values. "
+            "Used value: {}".format(OUTPUT_ARRAY, OUTPUT_NUMPY, OUTPUT_ARROW, output)
+        )
+
+    columns = _build_columns(snapshots)
+    if output == OUTPUT_NUMPY:
+        return _to_numpy(columns)
+    if output == OUTPUT_ARROW:
+        return _to_arrow(columns)
+    return columns
@@ -0,0 +1,38 @@
+# coding: utf-8
+"""Functions to reinitialize the objects of the module in forked processes.
+
+Locks held by another thread when the process forks stay locked forever in the
+child. The objects registered with reinit_after_fork() get new locks in the
+child processes (python 3.7+, os.register_at_fork()).
+"""
+import gc
+import os
+import weakref
+
+_instances = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    """Reinitialize the registered objects in the child process."""
+    for instance in list(_instances):
+        instance._after_fork_in_child()  # pylint: disable=protected-access
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def reinit_after_fork(instance):
+    """Call instance._after_fork_in_child() in the child processes after fork."""
+    _instances.add(instance)
+
+
+def freeze():
+    """Move all the current objects to the permanent generation of the GC.
+
+    The garbage collector doesn't visit them anymore, so the memory pages of the
+    objects loaded before fork stay shared with the children (python 3.7+).
+    """
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
@@ -0,0 +1,2442 @@
+# coding: utf-8
+"""Simplified geometry of the departments, used by the location and the map.
+
+The module is large: it is only imported when the geometry is needed.
+
+The geometry is derived from Natural Earth 1:10m countries (public domain) for
+the outline of France and Andorre, and from the towns of the
+countries-states-cities database (Open Database License, see NOTICE) for the
+borders between departments: each department is the union of the Voronoi cells
+of its towns, clipped to the outline. The borders between departments are
+precise to a few kilometers.
+"""
+
+# Simplified outline (latitude, longitude) of Andorre.
+ANDORRE_OUTLINE = [
+    (42.503, 1.707), (42.491, 1.686), (42.497, 1.654), (42.466, 1.640),
+    (42.456, 1.607), (42.450, 1.544), (42.434, 1.528), (42.429, 1.508),
+    (42.435, 1.448), (42.441, 1.436), (42.453, 1.436), (42.487, 1.408),
+    (42.504, 1.450), (42.520, 1.447), (42.531, 1.429), (42.529, 1.406),
+    (42.541, 1.410), (42.562, 1.426), (42.570, 1.418), (42.579, 1.419),
+    (42.595, 1.429), (42.602, 1.451), (42.641, 1.467), (42.640, 1.498),
+    (42.649, 1.543), (42.618, 1.608), (42.610, 1.722), (42.590, 1.713),
+    (42.577, 1.753), (42.563, 1.765), (42.562, 1.740), (42.549, 1.722),
+    (42.528, 1.711),
+]
+
+# Simplified polygons (latitude, longitude) of each department, as in GeoJSON:
+# a list of polygons (islands included, largest first), each one an outer ring
+# followed by its holes (enclaves). Neighbouring departments share the same
+# border vertices.
+DEPARTMENT_POLYGONS = {
+    "01": [
+        [
+            [
+                (46.147, 4.760), (46.187, 4.776), (46.214, 4.815), (46.217, 4.831),
+                (46.276, 4.808), (46.294, 4.812), (46.326, 4.859), (46.356, 4.866),
+                (46.402, 4.908), (46.485, 4.810), (46.502, 4.937), (46.494, 4.976),
+                (46.474, 5.000), (46.489, 5.155), (46.438, 5.170), (46.415, 5.251),
+                (46.408, 5.258), (46.411, 5.453), (46.364, 5.458), (46.305, 5.527),
+                (46.386, 5.661), (46.377, 5.693), (46.330, 5.746), (46.287, 5.828),
+                (46.285, 5.844), (46.359, 5.960), (46.391, 5.979), (46.409, 6.019),
+                (46.413, 6.070), (46.396, 6.108), (46.359, 6.136), (46.309, 6.104),
+                (46.246, 6.090), (46.243, 6.043), (46.212, 5.959), (46.200, 5.955),
+                (46.171, 5.983), (46.148, 5.970), (46.148, 5.959), (46.076, 5.899),
+                (46.034, 5.827), (46.025, 5.734), (45.959, 5.726), (45.926, 5.764),
+                (45.903, 5.827), (45.865, 5.848), (45.786, 5.772), (45.769, 5.785),
+                (45.687, 5.648), (45.715, 5.594), (45.785, 5.575), (45.793, 5.564),
+                (45.769, 5.459), (45.808, 5.425), (45.826, 5.432), (45.848, 5.411),
+                (45.845, 5.339), (45.848, 5.288), (45.802, 5.242), (45.777, 5.255),
+                (45.765, 5.205), (45.796, 5.176), (45.798, 5.154), (45.812, 5.143),
+                (45.811, 5.119), (45.824, 5.083), (45.813, 5.047), (45.790, 5.012),
+                (45.805, 4.921), (45.840, 4.913), (45.854, 4.925), (45.896, 4.891),
+                (45.910, 4.860), (45.897, 4.817), (45.930, 4.790), (45.926, 4.749),
+                (45.972, 4.735), (46.000, 4.747), (46.010, 4.733), (46.039, 4.738),
+                (46.051, 4.766), (46.088, 4.729), (46.097, 4.745), (46.142, 4.768),
+            ],
+        ],
+    ],
+    "02": [
+        [
+            [
+                (49.111, 3.173), (49.194, 3.045), (49.200, 3.051), (49.292, 3.019),
+                (49.331, 3.087), (49.361, 3.073), (49.461, 3.090), (49.561, 3.085),
+                (49.579, 3.103), (49.604, 3.102), (49.662, 3.141), (49.696, 3.112),
+                (49.769, 3.156), (49.835, 3.024), (49.888, 3.053), (49.943, 3.219),
+                (50.007, 3.221), (50.023, 3.362), (50.001, 3.382), (50.015, 3.431),
+                (50.001, 3.526), (50.006, 3.528), (50.068, 3.610), (50.076, 3.629),
+                (50.067, 3.650), (50.069, 3.734), (50.074, 3.761), (50.038, 3.860),
+                (50.061, 3.918), (50.055, 3.950), (49.981, 3.974), (49.954, 4.004),
+                (49.963, 4.034), (49.954, 4.112), (49.965, 4.162), (49.954, 4.217),
+                (49.814, 4.183), (49.752, 4.349), (49.691, 4.391), (49.668, 4.352),
+                (49.593, 4.102), (49.576, 4.077), (49.545, 4.069), (49.473, 4.117),
+                (49.420, 4.072), (49.395, 4.022), (49.391, 3.958), (49.441, 3.859),
+                (49.419, 3.740), (49.417, 3.674), (49.389, 3.640), (49.268, 3.582),
+                (49.197, 3.678), (49.174, 3.659), (49.123, 3.548), (48.967, 3.614),
+                (48.960, 3.521), (48.941, 3.468), (48.918, 3.434), (48.920, 3.405),
+                (48.909, 3.275), (48.996, 3.236), (48.990, 3.190), (49.023, 3.111),
+                (49.035, 3.111), (49.104, 3.193),
+            ],
+        ],
+    ],
+    "03": [
+        [
+            [
+                (46.180, 2.614), (46.239, 2.538), (46.247, 2.492), (46.262, 2.455),
+                (46.291, 2.355), (46.303, 2.357), (46.461, 2.327), (46.510, 2.396),
+                (46.521, 2.398), (46.602, 2.454), (46.637, 2.584), (46.636, 2.598),
+                (46.822, 2.752), (46.772, 2.807), (46.787, 3.008), (46.716, 3.061),
+                (46.681, 3.062), (46.639, 3.169), (46.690, 3.261), (46.653, 3.406),
+                (46.643, 3.415), (46.648, 3.574), (46.732, 3.667), (46.581, 3.735),
+                (46.563, 3.872), (46.522, 3.857), (46.479, 3.953), (46.437, 3.985),
+                (46.376, 3.918), (46.344, 3.935), (46.277, 3.893), (46.255, 3.776),
+                (46.165, 3.718), (46.121, 3.769), (46.047, 3.793), (46.010, 3.787),
+                (45.978, 3.727), (45.973, 3.661), (45.983, 3.612), (46.017, 3.568),
+                (46.012, 3.446), (46.066, 3.427), (46.080, 3.408), (46.048, 3.349),
+                (46.056, 3.281), (46.063, 3.276), (46.060, 3.128), (46.048, 3.109),
+                (46.048, 2.993), (46.063, 2.959), (46.089, 2.942), (46.154, 2.966),
+                (46.221, 2.943), (46.250, 2.863), (46.229, 2.801), (46.205, 2.766),
+                (46.180, 2.709),
+            ],
+        ],
+    ],
+    "04": [
+        [
+            [
+                (43.743, 5.753), (43.782, 5.700), (43.828, 5.678), (43.832, 5.647),
+                (43.809, 5.574), (43.808, 5.520), (43.822, 5.504), (43.931, 5.515),
+                (43.975, 5.550), (43.999, 5.560), (44.027, 5.596), (44.138, 5.678),
+                (44.152, 5.673), (44.322, 6.022), (44.303, 6.124), (44.432, 6.224),
+                (44.465, 6.400), (44.439, 6.486), (44.493, 6.616), (44.536, 6.672),
+                (44.569, 6.885), (44.547, 6.846), (44.534, 6.836), (44.503, 6.839),
+                (44.475, 6.861), (44.436, 6.918), (44.414, 6.877), (44.372, 6.866),
+                (44.362, 6.871), (44.304, 6.771), (44.176, 6.641), (44.112, 6.794),
+                (43.836, 6.770), (43.822, 6.726), (43.771, 6.679), (43.735, 6.555),
+                (43.730, 6.491), (43.738, 6.369), (43.774, 6.311), (43.752, 6.246),
+                (43.727, 6.025), (43.691, 5.994), (43.713, 5.876), (43.768, 5.822),
+            ],
+        ],
+    ],
+    "05": [
+        [
+            [
+                (44.152, 5.673), (44.256, 5.551), (44.277, 5.547), (44.469, 5.409),
+                (44.520, 5.402), (44.590, 5.542), (44.653, 5.606), (44.680, 5.831),
+                (44.696, 5.872), (44.817, 5.974), (44.852, 6.029), (44.840, 6.219),
+                (44.897, 6.298), (45.002, 6.319), (45.044, 6.333), (45.092, 6.577),
+                (45.072, 6.637), (45.050, 6.640), (45.029, 6.662), (45.027, 6.697),
+                (45.013, 6.723), (44.985, 6.730), (44.929, 6.728), (44.908, 6.745),
+                (44.888, 6.778), (44.859, 6.847), (44.856, 6.866), (44.862, 6.933),
+                (44.847, 6.983), (44.822, 7.007), (44.794, 6.998), (44.739, 7.019),
+                (44.685, 7.055), (44.692, 6.983), (44.667, 6.941), (44.647, 6.934),
+                (44.625, 6.946), (44.618, 6.932), (44.569, 6.885), (44.536, 6.672),
+                (44.493, 6.616), (44.439, 6.486), (44.465, 6.400), (44.432, 6.224),
+                (44.303, 6.124), (44.322, 6.022),
+            ],
+        ],
+    ],
+    "06": [
+        [
+            [
+                (43.771, 6.679), (43.822, 6.726), (43.836, 6.770), (44.112, 6.794),
+                (44.176, 6.641), (44.304, 6.771), (44.362, 6.871), (44.340, 6.896),
+                (44.302, 6.921), (44.277, 6.959), (44.249, 6.973), (44.238, 6.996),
+                (44.243, 7.033), (44.207, 7.145), (44.160, 7.251), (44.147, 7.309),
+                (44.124, 7.341), (44.123, 7.381), (44.159, 7.555), (44.161, 7.584),
+                (44.180, 7.625), (44.176, 7.656), (44.144, 7.642), (44.109, 7.676),
+                (44.085, 7.692), (44.067, 7.690), (44.040, 7.653), (43.994, 7.631),
+                (43.944, 7.557), (43.921, 7.537), (43.886, 7.493), (43.866, 7.478),
+                (43.792, 7.502), (43.784, 7.476), (43.765, 7.476), (43.743, 7.437),
+                (43.764, 7.407), (43.746, 7.373), (43.723, 7.366), (43.708, 7.342),
+                (43.686, 7.331), (43.692, 7.257), (43.674, 7.229), (43.663, 7.232),
+                (43.644, 7.204), (43.657, 7.197), (43.655, 7.152), (43.641, 7.137),
+                (43.606, 7.126), (43.554, 7.139), (43.548, 7.126), (43.565, 7.113),
+                (43.569, 7.088), (43.536, 7.037), (43.548, 7.031), (43.547, 6.976),
+                (43.527, 6.945), (43.500, 6.954), (43.473, 6.925), (43.449, 6.920),
+                (43.430, 6.895), (43.471, 6.852), (43.524, 6.880), (43.549, 6.877),
+                (43.570, 6.909), (43.616, 6.880), (43.604, 6.820), (43.622, 6.810),
+                (43.638, 6.770), (43.665, 6.729), (43.712, 6.704), (43.741, 6.699),
+            ],
+        ],
+    ],
+    "07": [
+        [
+            [
+                (44.363, 4.018), (44.399, 4.016), (44.483, 4.101), (44.566, 4.108),
+                (44.581, 4.090), (44.641, 4.060), (44.726, 4.046), (44.785, 4.063),
+                (44.836, 4.187), (44.939, 4.207), (44.988, 4.300), (44.995, 4.303),
+                (45.101, 4.424), (45.116, 4.456), (45.125, 4.454), (45.169, 4.491),
+                (45.200, 4.493), (45.259, 4.553), (45.263, 4.583), (45.301, 4.601),
+                (45.310, 4.672), (45.325, 4.673), (45.346, 4.718), (45.342, 4.756),
+                (45.291, 4.785), (45.263, 4.771), (45.234, 4.823), (45.214, 4.793),
+                (45.191, 4.831), (45.143, 4.742), (45.128, 4.738), (45.126, 4.841),
+                (45.120, 4.862), (45.087, 4.845), (45.052, 4.845), (45.032, 4.859),
+                (44.990, 4.715), (44.984, 4.716), (44.989, 4.869), (44.982, 4.892),
+                (44.950, 4.870), (44.933, 4.893), (44.903, 4.886), (44.874, 4.852),
+                (44.854, 4.865), (44.834, 4.846), (44.813, 4.853), (44.800, 4.820),
+                (44.769, 4.785), (44.731, 4.780), (44.700, 4.731), (44.665, 4.823),
+                (44.644, 4.817), (44.634, 4.799), (44.629, 4.755), (44.597, 4.747),
+                (44.595, 4.722), (44.564, 4.704), (44.556, 4.717), (44.525, 4.725),
+                (44.514, 4.690), (44.466, 4.712), (44.439, 4.610), (44.411, 4.671),
+                (44.344, 4.676), (44.313, 4.651), (44.286, 4.657), (44.276, 4.627),
+                (44.283, 4.596), (44.314, 4.581), (44.364, 4.504), (44.309, 4.423),
+                (44.297, 4.354), (44.353, 4.264), (44.337, 4.190),
+            ],
+        ],
+    ],
+    "08": [
+        [
+            [
+                (49.954, 4.217), (49.960, 4.278), (49.932, 4.435), (49.936, 4.465),
+                (49.980, 4.604), (49.989, 4.657), (50.016, 4.673), (50.084, 4.682),
+                (50.153, 4.789), (50.161, 4.816), (50.146, 4.820), (50.148, 4.863),
+                (50.140, 4.872), (50.084, 4.863), (50.091, 4.846), (50.064, 4.827),
+                (50.036, 4.827), (49.974, 4.788), (49.944, 4.797), (49.932, 4.845),
+                (49.913, 4.860), (49.892, 4.859), (49.848, 4.837), (49.832, 4.849),
+                (49.794, 4.849), (49.787, 4.858), (49.786, 4.907), (49.796, 4.950),
+                (49.791, 4.989), (49.767, 5.026), (49.753, 5.082), (49.705, 5.136),
+                (49.683, 5.192), (49.691, 5.259), (49.666, 5.295), (49.631, 5.282),
+                (49.594, 5.252), (49.588, 5.224), (49.591, 5.160), (49.610, 5.127),
+                (49.572, 5.053), (49.566, 4.914), (49.552, 4.873), (49.529, 4.843),
+                (49.449, 4.888), (49.355, 4.860), (49.337, 4.849), (49.235, 4.713),
+                (49.285, 4.543), (49.345, 4.510), (49.387, 4.449), (49.397, 4.354),
+                (49.437, 4.266), (49.448, 4.199), (49.473, 4.117), (49.545, 4.069),
+                (49.576, 4.077), (49.593, 4.102), (49.668, 4.352), (49.691, 4.391),
+                (49.752, 4.349), (49.814, 4.183),
+            ],
+        ],
+    ],
+    "09": [
+        [
+            [
+                (43.281, 1.794), (43.182, 1.652), (43.170, 1.667), (43.120, 1.767),
+                (43.188, 1.898), (43.180, 1.974), (43.099, 2.047), (43.026, 1.925),
+                (42.955, 1.941), (42.903, 2.061), (42.775, 2.032), (42.690, 2.113),
+                (42.568, 1.839), (42.547, 1.721), (42.562, 1.740), (42.563, 1.765),
+                (42.577, 1.753), (42.590, 1.713), (42.610, 1.722), (42.618, 1.608),
+                (42.649, 1.543), (42.640, 1.498), (42.641, 1.467), (42.602, 1.451),
+                (42.595, 1.429), (42.644, 1.398), (42.687, 1.361), (42.694, 1.338),
+                (42.709, 1.343), (42.713, 1.319), (42.714, 1.196), (42.706, 1.163),
+                (42.716, 1.134), (42.760, 1.107), (42.776, 1.068), (42.780, 0.983),
+                (42.793, 0.940), (42.796, 0.937), (42.949, 0.965), (42.983, 0.968),
+                (43.104, 1.110), (43.111, 1.158), (43.076, 1.377), (43.118, 1.398),
+                (43.160, 1.488), (43.269, 1.532), (43.278, 1.569), (43.250, 1.623),
+                (43.314, 1.728),
+            ],
+        ],
+        [
+            [
+                (43.295, 1.295), (43.318, 1.396), (43.305, 1.423), (43.173, 1.374),
+                (43.249, 1.279), (43.259, 1.275),
+            ],
+        ],
+    ],
+    "10": [
+        [
+            [
+                (48.405, 3.405), (48.470, 3.400), (48.557, 3.453), (48.579, 3.442),
+                (48.659, 3.521), (48.655, 3.631), (48.625, 3.682), (48.585, 3.671),
+                (48.532, 3.757), (48.533, 3.839), (48.617, 3.915), (48.612, 3.997),
+                (48.642, 4.044), (48.822, 4.197), (48.805, 4.274), (48.769, 4.374),
+                (48.687, 4.401), (48.600, 4.418), (48.552, 4.358), (48.505, 4.342),
+                (48.443, 4.409), (48.422, 4.633), (48.317, 4.624), (48.308, 4.713),
+                (48.289, 4.742), (48.244, 4.773), (48.199, 4.779), (48.177, 4.748),
+                (48.122, 4.815), (48.107, 4.801), (48.122, 4.697), (48.142, 4.648),
+                (48.135, 4.584), (48.096, 4.557), (47.946, 4.628), (47.879, 4.405),
+                (47.848, 4.362), (47.856, 4.332), (47.886, 4.264), (47.941, 4.203),
+                (47.959, 4.053), (48.004, 3.852), (48.147, 3.854), (48.113, 3.646),
+                (48.133, 3.551), (48.196, 3.533), (48.320, 3.588), (48.369, 3.554),
+            ],
+        ],
+    ],
+    "11": [
+        [
+            [
+                (42.690, 2.113), (42.775, 2.032), (42.903, 2.061), (42.955, 1.941),
+                (43.026, 1.925), (43.099, 2.047), (43.180, 1.974), (43.188, 1.898),
+                (43.120, 1.767), (43.170, 1.667), (43.182, 1.652), (43.281, 1.794),
+                (43.339, 1.875), (43.379, 1.901), (43.392, 1.957), (43.381, 2.022),
+                (43.368, 2.095), (43.371, 2.143), (43.400, 2.167), (43.441, 2.234),
+                (43.428, 2.335), (43.401, 2.413), (43.392, 2.422), (43.407, 2.564),
+                (43.383, 2.630), (43.392, 2.714), (43.382, 2.760), (43.400, 2.819),
+                (43.378, 2.884), (43.355, 2.900), (43.317, 2.954), (43.320, 2.995),
+                (43.293, 3.025), (43.284, 3.062), (43.268, 3.081), (43.260, 3.133),
+                (43.216, 3.189), (43.190, 3.212), (43.165, 3.179), (43.135, 3.154),
+                (43.106, 3.114), (43.027, 3.070), (42.943, 3.039), (42.927, 3.055),
+                (42.850, 3.048), (42.848, 3.007), (42.916, 2.910), (42.942, 2.807),
+                (42.942, 2.772), (42.955, 2.694), (42.955, 2.665), (42.997, 2.515),
+                (42.844, 2.343), (42.751, 2.303), (42.686, 2.139),
+            ],
+            [
+                (43.264, 2.798), (43.292, 2.805), (43.382, 2.760), (43.275, 2.696),
+                (43.233, 2.704), (43.246, 2.780),
+            ],
+        ],
+    ],
+    "12": [
+        [
+            [
+                (44.355, 1.848), (44.390, 1.898), (44.518, 1.972), (44.528, 1.964),
+                (44.628, 2.108), (44.609, 2.150), (44.659, 2.271), (44.673, 2.381),
+                (44.732, 2.402), (44.764, 2.457), (44.785, 2.560), (44.835, 2.595),
+                (44.893, 2.698), (44.837, 2.878), (44.781, 2.903), (44.740, 2.925),
+                (44.591, 2.911), (44.592, 2.985), (44.514, 3.043), (44.483, 3.004),
+                (44.447, 3.030), (44.388, 2.990), (44.380, 3.051), (44.291, 3.156),
+                (44.282, 3.115), (44.319, 3.044), (44.222, 2.939), (44.178, 2.959),
+                (44.160, 3.100), (44.101, 3.227), (44.098, 3.289), (44.023, 3.386),
+                (43.905, 3.364), (43.851, 3.168), (43.850, 3.112), (43.709, 2.978),
+                (43.676, 2.901), (43.738, 2.821), (43.815, 2.526), (43.881, 2.551),
+                (43.921, 2.494), (44.100, 2.454), (44.115, 2.415), (44.097, 2.305),
+                (44.165, 2.259), (44.196, 2.117), (44.144, 2.042), (44.141, 2.025),
+                (44.173, 1.903), (44.290, 1.908),
+            ],
+        ],
+    ],
+    "13": [
+        [
+            [
+                (43.926, 4.774), (43.923, 4.832), (43.911, 4.844), (43.904, 4.883),
+                (43.909, 4.907), (43.876, 4.932), (43.881, 5.013), (43.851, 4.998),
+                (43.811, 5.030), (43.773, 5.073), (43.781, 5.131), (43.770, 5.137),
+                (43.718, 5.243), (43.734, 5.256), (43.730, 5.339), (43.700, 5.358),
+                (43.687, 5.391), (43.688, 5.461), (43.660, 5.487), (43.676, 5.552),
+                (43.685, 5.626), (43.692, 5.643), (43.669, 5.737), (43.598, 5.763),
+                (43.487, 5.686), (43.451, 5.772), (43.430, 5.767), (43.409, 5.659),
+                (43.357, 5.680), (43.333, 5.658), (43.309, 5.678), (43.295, 5.779),
+                (43.263, 5.785), (43.245, 5.749), (43.235, 5.683), (43.208, 5.676),
+                (43.186, 5.654), (43.187, 5.634), (43.160, 5.612), (43.169, 5.573),
+                (43.207, 5.538), (43.208, 5.440), (43.212, 5.395), (43.208, 5.370),
+                (43.216, 5.347), (43.270, 5.369), (43.280, 5.357), (43.334, 5.339),
+                (43.355, 5.294), (43.328, 5.238), (43.329, 5.163), (43.326, 5.125),
+                (43.328, 5.065), (43.335, 5.034), (43.382, 5.006), (43.409, 5.026),
+                (43.422, 5.057), (43.422, 5.146), (43.428, 5.174), (43.458, 5.214),
+                (43.480, 5.226), (43.504, 5.223), (43.482, 5.166), (43.486, 5.140),
+                (43.504, 5.118), (43.533, 5.106), (43.538, 5.054), (43.559, 5.029),
+                (43.518, 5.009), (43.499, 5.015), (43.477, 5.050), (43.452, 5.062),
+                (43.429, 5.051), (43.417, 5.028), (43.417, 4.983), (43.440, 4.928),
+                (43.421, 4.868), (43.401, 4.850), (43.365, 4.868), (43.367, 4.901),
+                (43.342, 4.856), (43.382, 4.833), (43.399, 4.792), (43.422, 4.758),
+                (43.449, 4.742), (43.524, 4.742), (43.572, 4.712), (43.573, 4.695),
+                (43.528, 4.729), (43.456, 4.729), (43.423, 4.743), (43.367, 4.823),
+                (43.346, 4.820), (43.348, 4.666), (43.360, 4.592), (43.371, 4.566),
+                (43.388, 4.566), (43.404, 4.586), (43.430, 4.580), (43.456, 4.513),
+                (43.448, 4.409), (43.457, 4.258), (43.463, 4.262), (43.598, 4.448),
+                (43.595, 4.458), (43.709, 4.661), (43.752, 4.636), (43.835, 4.660),
+                (43.871, 4.657), (43.883, 4.717), (43.918, 4.709), (43.932, 4.729),
+            ],
+        ],
+    ],
+    "14": [
+        [
+            [
+                (49.360, -1.167), (49.363, -1.152), (49.345, -1.123), (49.349, -1.103),
+                (49.379, -1.106), (49.397, -1.072), (49.392, -0.940), (49.363, -0.822),
+                (49.356, -0.651), (49.346, -0.583), (49.359, -0.547), (49.343, -0.479),
+                (49.343, -0.411), (49.325, -0.363), (49.317, -0.313), (49.280, -0.219),
+                (49.295, -0.194), (49.320, -0.034), (49.335, 0.013), (49.359, 0.072),
+                (49.384, 0.096), (49.415, 0.162), (49.445, 0.363), (49.423, 0.396),
+                (49.401, 0.388), (49.342, 0.263), (49.324, 0.261), (49.285, 0.292),
+                (49.239, 0.270), (49.210, 0.429), (49.193, 0.438), (49.127, 0.358),
+                (49.081, 0.418), (49.071, 0.482), (48.931, 0.461), (48.910, 0.361),
+                (48.946, 0.330), (48.969, 0.183), (48.945, 0.103), (48.916, 0.082),
+                (48.913, -0.060), (48.832, -0.098), (48.834, -0.247), (48.850, -0.293),
+                (48.812, -0.367), (48.837, -0.439), (48.872, -0.494), (48.815, -0.615),
+                (48.797, -0.665), (48.812, -0.714), (48.817, -0.774), (48.804, -0.791),
+                (48.755, -0.833), (48.786, -0.954), (48.744, -1.044), (48.793, -1.128),
+                (48.865, -1.135), (48.900, -1.094), (48.906, -0.967), (48.915, -0.942),
+                (48.983, -0.905), (48.998, -0.908), (49.060, -0.863), (49.081, -0.881),
+                (49.101, -0.880), (49.164, -0.897), (49.186, -0.978), (49.244, -1.012),
+                (49.247, -1.145),
+            ],
+        ],
+    ],
+    "15": [
+        [
+            [
+                (44.976, 2.015), (44.984, 2.016), (45.033, 2.067), (45.057, 2.158),
+                (45.244, 2.169), (45.279, 2.143), (45.324, 2.205), (45.420, 2.234),
+                (45.428, 2.246), (45.457, 2.373), (45.389, 2.438), (45.339, 2.532),
+                (45.412, 2.531), (45.473, 2.401), (45.529, 2.459), (45.527, 2.592),
+                (45.494, 2.667), (45.464, 2.723), (45.459, 2.782), (45.373, 2.964),
+                (45.373, 3.040), (45.369, 3.074), (45.326, 3.212), (45.279, 3.288),
+                (45.249, 3.302), (45.148, 3.316), (45.112, 3.278), (45.075, 3.291),
+                (45.022, 3.242), (44.955, 3.121), (44.953, 3.095), (44.899, 3.053),
+                (44.817, 3.028), (44.794, 2.994), (44.781, 2.903), (44.837, 2.878),
+                (44.893, 2.698), (44.835, 2.595), (44.785, 2.560), (44.764, 2.457),
+                (44.732, 2.402), (44.673, 2.381), (44.659, 2.271), (44.729, 2.063),
+                (44.790, 2.071), (44.840, 2.101), (44.934, 2.026),
+            ],
+        ],
+    ],
+    "16": [
+        [
+            [
+                (45.980, -0.152), (45.991, -0.091), (46.079, 0.030), (46.069, 0.124),
+                (46.104, 0.206), (46.072, 0.287), (46.077, 0.345), (46.067, 0.383),
+                (46.070, 0.517), (46.058, 0.531), (46.080, 0.831), (46.091, 0.851),
+                (46.031, 0.967), (45.940, 0.945), (45.909, 0.842), (45.869, 0.838),
+                (45.852, 0.773), (45.786, 0.705), (45.778, 0.632), (45.762, 0.605),
+                (45.704, 0.624), (45.592, 0.569), (45.557, 0.508), (45.549, 0.445),
+                (45.429, 0.331), (45.383, 0.342), (45.300, 0.190), (45.210, 0.043),
+                (45.211, 0.039), (45.231, -0.065), (45.290, -0.097), (45.342, -0.086),
+                (45.342, -0.251), (45.422, -0.329), (45.472, -0.295), (45.519, -0.305),
+                (45.544, -0.345), (45.566, -0.344), (45.657, -0.408), (45.685, -0.386),
+                (45.709, -0.382), (45.738, -0.423), (45.819, -0.368), (45.802, -0.307),
+                (45.799, -0.255), (45.887, -0.155), (45.960, -0.167),
+            ],
+        ],
+    ],
+    "17": [
+        [
+            [
+                (46.312, -0.791), (46.216, -0.744), (46.198, -0.757), (46.103, -0.585),
+                (46.072, -0.488), (46.119, -0.361), (46.034, -0.189), (45.980, -0.152),
+                (45.960, -0.167), (45.887, -0.155), (45.799, -0.255), (45.802, -0.307),
+                (45.819, -0.368), (45.738, -0.423), (45.709, -0.382), (45.685, -0.386),
+                (45.657, -0.408), (45.566, -0.344), (45.544, -0.345), (45.519, -0.305),
+                (45.472, -0.295), (45.422, -0.329), (45.342, -0.251), (45.342, -0.086),
+                (45.290, -0.097), (45.231, -0.065), (45.211, 0.039), (45.125, -0.013),
+                (45.147, -0.105), (45.124, -0.117), (45.087, -0.194), (45.084, -0.236),
+                (45.091, -0.258), (45.148, -0.273), (45.212, -0.354), (45.214, -0.408),
+                (45.264, -0.461), (45.335, -0.482), (45.321, -0.545), (45.359, -0.719),
+                (45.424, -0.753), (45.477, -0.795), (45.515, -0.842), (45.587, -0.984),
+                (45.610, -0.991), (45.623, -1.030), (45.660, -1.084), (45.679, -1.149),
+                (45.710, -1.194), (45.710, -1.247), (45.792, -1.230), (45.807, -1.164),
+                (45.806, -1.144), (45.753, -1.081), (45.740, -1.057), (45.717, -0.987),
+                (45.735, -1.010), (45.786, -1.099), (45.808, -1.125), (45.868, -1.152),
+                (45.902, -1.097), (45.904, -1.073), (45.937, -1.076), (45.951, -1.090),
+                (45.964, -1.069), (45.985, -1.097), (46.018, -1.111), (46.008, -1.090),
+                (46.016, -1.060), (46.039, -1.049), (46.057, -1.084), (46.102, -1.097),
+                (46.116, -1.129), (46.128, -1.117), (46.144, -1.152), (46.153, -1.151),
+                (46.159, -1.200), (46.184, -1.204), (46.197, -1.185), (46.229, -1.180),
+                (46.259, -1.111), (46.272, -1.103), (46.303, -1.111), (46.324, -1.132),
+                (46.326, -1.174), (46.333, -1.169), (46.342, -1.061), (46.361, -0.950),
+                (46.320, -0.913),
+            ],
+        ],
+        [
+            [
+                (45.814, -1.209), (45.820, -1.227), (45.882, -1.260), (45.928, -1.319),
+                (45.939, -1.340), (45.976, -1.378), (45.995, -1.372), (46.053, -1.405),
+                (46.038, -1.340), (45.998, -1.274), (46.002, -1.248), (45.992, -1.234),
+                (45.935, -1.224), (45.916, -1.185), (45.899, -1.176), (45.856, -1.184),
+            ],
+        ],
+        [
+            [
+                (46.252, -1.556), (46.262, -1.498), (46.250, -1.468), (46.238, -1.474),
+                (46.246, -1.508), (46.224, -1.491), (46.225, -1.464), (46.238, -1.411),
+                (46.224, -1.425), (46.218, -1.409), (46.207, -1.308), (46.181, -1.266),
+                (46.162, -1.254), (46.156, -1.281), (46.167, -1.336), (46.211, -1.433),
+                (46.203, -1.489), (46.208, -1.504),
+            ],
+        ],
+        [
+            [
+                (45.442, -0.905), (45.378, -0.823), (45.410, -0.890),
+            ],
+        ],
+    ],
+    "18": [
+        [
+            [
+                (47.212, 1.765), (47.221, 1.804), (47.196, 1.914), (47.218, 1.973),
+                (47.260, 1.996), (47.281, 2.147), (47.364, 2.147), (47.369, 2.152),
+                (47.414, 2.322), (47.480, 2.305), (47.534, 2.151), (47.575, 2.139),
+                (47.592, 2.145), (47.672, 2.211), (47.571, 2.351), (47.607, 2.422),
+                (47.576, 2.507), (47.581, 2.535), (47.522, 2.650), (47.483, 2.667),
+                (47.500, 2.740), (47.525, 2.778), (47.530, 2.839), (47.494, 2.892),
+                (47.484, 2.981), (47.479, 2.984), (47.448, 2.916), (47.377, 2.878),
+                (47.346, 2.931), (47.324, 2.909), (47.251, 2.850), (47.250, 3.041),
+                (47.125, 2.901), (47.114, 3.005), (47.103, 3.021), (47.037, 3.063),
+                (46.995, 3.049), (46.946, 3.097), (46.916, 3.089), (46.879, 3.026),
+                (46.855, 3.038), (46.787, 3.008), (46.772, 2.807), (46.822, 2.752),
+                (46.636, 2.598), (46.637, 2.584), (46.602, 2.454), (46.521, 2.398),
+                (46.510, 2.396), (46.461, 2.327), (46.450, 2.066), (46.607, 2.098),
+                (46.653, 2.117), (46.722, 2.006), (46.800, 2.001), (46.823, 2.022),
+                (46.867, 2.124), (46.881, 2.125), (46.966, 2.059), (47.040, 2.081),
+                (47.068, 2.156), (47.120, 2.119), (47.124, 2.034), (47.088, 1.929),
+                (47.084, 1.926), (47.140, 1.706), (47.165, 1.710),
+            ],
+        ],
+    ],
+    "19": [
+        [
+            [
+                (45.448, 1.288), (45.456, 1.325), (45.529, 1.451), (45.515, 1.505),
+                (45.529, 1.588), (45.630, 1.616), (45.663, 1.697), (45.655, 1.814),
+                (45.741, 1.951), (45.759, 2.005), (45.747, 2.035), (45.658, 2.091),
+                (45.615, 2.217), (45.638, 2.391), (45.529, 2.459), (45.473, 2.401),
+                (45.412, 2.531), (45.339, 2.532), (45.389, 2.438), (45.457, 2.373),
+                (45.428, 2.246), (45.420, 2.234), (45.324, 2.205), (45.279, 2.143),
+                (45.244, 2.169), (45.057, 2.158), (45.033, 2.067), (44.984, 2.016),
+                (44.976, 2.015), (44.946, 1.802), (44.946, 1.779), (45.013, 1.752),
+                (44.997, 1.637), (45.029, 1.514), (45.014, 1.483), (45.055, 1.346),
+                (45.129, 1.359), (45.144, 1.260), (45.211, 1.242), (45.233, 1.275),
+                (45.323, 1.211), (45.376, 1.297),
+            ],
+        ],
+    ],
+    "21": [
+        [
+            [
+                (47.107, 4.182), (47.214, 4.019), (47.355, 4.026), (47.421, 4.119),
+                (47.556, 4.123), (47.594, 4.100), (47.750, 4.436), (47.848, 4.362),
+                (47.879, 4.405), (47.946, 4.628), (47.924, 4.687), (47.818, 4.748),
+                (47.710, 4.692), (47.676, 4.662), (47.540, 4.763), (47.533, 4.774),
+                (47.542, 4.847), (47.586, 4.947), (47.599, 5.021), (47.601, 5.073),
+                (47.636, 5.146), (47.631, 5.185), (47.516, 5.258), (47.502, 5.283),
+                (47.510, 5.324), (47.511, 5.409), (47.504, 5.417), (47.393, 5.456),
+                (47.361, 5.514), (47.256, 5.479), (47.232, 5.482), (47.186, 5.529),
+                (47.173, 5.501), (47.132, 5.351), (47.086, 5.338), (47.036, 5.231),
+                (46.981, 5.254), (46.954, 5.233), (46.916, 5.139), (47.000, 5.000),
+                (46.990, 4.973), (46.966, 4.947), (46.957, 4.806), (46.948, 4.792),
+                (46.919, 4.793), (46.920, 4.685), (46.899, 4.667), (46.899, 4.629),
+                (46.927, 4.553), (47.071, 4.633), (47.053, 4.455), (47.120, 4.253),
+            ],
+        ],
+    ],
+    "22": [
+        [
+            [
+                (48.199, -3.517), (48.237, -3.493), (48.331, -3.504), (48.342, -3.502),
+                (48.375, -3.543), (48.418, -3.572), (48.481, -3.475), (48.490, -3.478),
+                (48.578, -3.545), (48.593, -3.572), (48.589, -3.600), (48.611, -3.662),
+                (48.667, -3.677), (48.683, -3.603), (48.688, -3.571), (48.733, -3.580),
+                (48.739, -3.528), (48.774, -3.577), (48.791, -3.582), (48.808, -3.543),
+                (48.842, -3.515), (48.836, -3.468), (48.821, -3.420), (48.808, -3.433),
+                (48.807, -3.398), (48.822, -3.372), (48.848, -3.260), (48.872, -3.230),
+                (48.855, -3.207), (48.794, -3.221), (48.816, -3.209), (48.862, -3.145),
+                (48.874, -3.116), (48.871, -3.091), (48.836, -3.091), (48.828, -3.077),
+                (48.794, -3.098), (48.767, -3.125), (48.760, -3.118), (48.824, -3.066),
+                (48.827, -3.018), (48.808, -3.008), (48.794, -3.042), (48.774, -3.004),
+                (48.767, -2.933), (48.733, -2.947), (48.716, -2.914), (48.695, -2.892),
+                (48.658, -2.827), (48.615, -2.811), (48.599, -2.813), (48.579, -2.771),
+                (48.561, -2.714), (48.534, -2.734), (48.530, -2.713), (48.509, -2.682),
+                (48.540, -2.676), (48.539, -2.636), (48.558, -2.601), (48.582, -2.577),
+                (48.626, -2.474), (48.643, -2.460), (48.650, -2.487), (48.659, -2.443),
+                (48.643, -2.412), (48.663, -2.356), (48.687, -2.312), (48.678, -2.282),
+                (48.650, -2.302), (48.630, -2.330), (48.620, -2.313), (48.650, -2.251),
+                (48.621, -2.241), (48.604, -2.219), (48.582, -2.214), (48.593, -2.196),
+                (48.616, -2.193), (48.589, -2.183), (48.589, -2.159), (48.602, -2.172),
+                (48.619, -2.150), (48.599, -2.098), (48.559, -2.093), (48.554, -1.987),
+                (48.536, -1.976), (48.514, -1.980), (48.534, -1.939), (48.545, -1.964),
+                (48.532, -1.932), (48.496, -1.934), (48.477, -1.916), (48.442, -1.953),
+                (48.420, -1.929), (48.394, -1.945), (48.364, -1.930), (48.331, -1.935),
+                (48.306, -1.919), (48.260, -2.007), (48.326, -2.087), (48.274, -2.112),
+                (48.262, -2.189), (48.230, -2.193), (48.194, -2.305), (48.151, -2.327),
+                (48.134, -2.357), (48.194, -2.506), (48.143, -2.536), (48.075, -2.493),
+                (48.061, -2.503), (48.058, -2.621), (48.135, -2.669), (48.124, -2.737),
+                (48.164, -2.808), (48.146, -2.900), (48.164, -2.975), (48.164, -3.030),
+                (48.196, -3.087), (48.147, -3.185), (48.161, -3.242), (48.164, -3.278),
+                (48.188, -3.341), (48.179, -3.483),
+            ],
+        ],
+    ],
+    "23": [
+        [
+            [
+                (46.354, 1.473), (46.338, 1.574), (46.391, 1.687), (46.395, 1.700),
+                (46.353, 1.772), (46.450, 2.066), (46.461, 2.327), (46.303, 2.357),
+                (46.291, 2.355), (46.262, 2.455), (46.247, 2.492), (46.239, 2.538),
+                (46.180, 2.614), (46.105, 2.565), (45.998, 2.660), (45.982, 2.660),
+                (45.878, 2.587), (45.829, 2.487), (45.801, 2.495), (45.638, 2.391),
+                (45.615, 2.217), (45.658, 2.091), (45.747, 2.035), (45.759, 2.005),
+                (45.896, 1.957), (45.881, 1.714), (46.035, 1.613), (46.038, 1.560),
+                (46.050, 1.540), (46.131, 1.508), (46.174, 1.355), (46.200, 1.327),
+                (46.256, 1.433), (46.296, 1.437),
+            ],
+        ],
+    ],
+    "24": [
+        [
+            [
+                (44.737, 0.296), (44.741, 0.303), (44.834, 0.288), (44.844, 0.247),
+                (44.862, 0.208), (44.820, 0.208), (44.762, 0.177), (44.795, 0.109),
+                (44.794, 0.042), (44.854, 0.000), (44.921, 0.000), (44.935, 0.033),
+                (45.069, 0.033), (45.087, 0.062), (45.125, -0.013), (45.211, 0.039),
+                (45.210, 0.043), (45.300, 0.190), (45.383, 0.342), (45.429, 0.331),
+                (45.549, 0.445), (45.557, 0.508), (45.592, 0.569), (45.704, 0.624),
+                (45.633, 0.805), (45.599, 0.843), (45.598, 0.965), (45.574, 1.038),
+                (45.548, 1.054), (45.528, 1.127), (45.462, 1.148), (45.456, 1.170),
+                (45.460, 1.260), (45.448, 1.288), (45.376, 1.297), (45.323, 1.211),
+                (45.233, 1.275), (45.211, 1.242), (45.144, 1.260), (45.129, 1.359),
+                (45.055, 1.346), (45.014, 1.483), (44.989, 1.457), (44.850, 1.370),
+                (44.829, 1.383), (44.778, 1.306), (44.750, 1.283), (44.714, 1.124),
+                (44.639, 1.066), (44.633, 1.043), (44.640, 0.949), (44.688, 0.895),
+                (44.708, 0.682), (44.750, 0.625), (44.710, 0.505), (44.618, 0.488),
+                (44.661, 0.290),
+            ],
+        ],
+    ],
+    "25": [
+        [
+            [
+                (47.222, 5.716), (47.239, 5.805), (47.270, 5.845), (47.338, 5.857),
+                (47.386, 5.935), (47.395, 5.942), (47.358, 6.113), (47.363, 6.138),
+                (47.424, 6.223), (47.496, 6.193), (47.507, 6.206), (47.566, 6.301),
+                (47.473, 6.476), (47.477, 6.494), (47.503, 6.539), (47.579, 6.559),
+                (47.611, 6.644), (47.535, 6.726), (47.536, 6.750), (47.566, 6.805),
+                (47.552, 6.821), (47.546, 6.891), (47.519, 6.926), (47.507, 6.956),
+                (47.493, 6.901), (47.451, 6.938), (47.437, 6.972), (47.425, 6.926),
+                (47.406, 6.925), (47.396, 6.899), (47.354, 6.867), (47.362, 6.986),
+                (47.368, 7.004), (47.340, 7.044), (47.291, 6.959), (47.245, 6.956),
+                (47.211, 6.888), (47.170, 6.840), (47.128, 6.775), (47.121, 6.745),
+                (47.104, 6.746), (47.085, 6.699), (47.062, 6.676), (47.044, 6.688),
+                (47.021, 6.665), (46.987, 6.599), (46.963, 6.491), (46.944, 6.443),
+                (46.909, 6.428), (46.883, 6.445), (46.858, 6.447), (46.807, 6.419),
+                (46.786, 6.433), (46.761, 6.429), (46.734, 6.374), (46.707, 6.338),
+                (46.680, 6.266), (46.662, 6.236), (46.694, 6.174), (46.695, 6.138),
+                (46.853, 5.986), (46.879, 6.003), (47.023, 5.995), (47.022, 5.879),
+                (46.984, 5.700), (47.060, 5.650), (47.088, 5.711), (47.091, 5.794),
+                (47.135, 5.829),
+            ],
+        ],
+    ],
+    "26": [
+        [
+            [
+                (45.291, 4.785), (45.298, 4.794), (45.312, 4.874), (45.324, 4.876),
+                (45.370, 5.064), (45.354, 5.065), (45.256, 5.132), (45.227, 5.133),
+                (45.182, 5.090), (45.162, 5.102), (45.133, 5.139), (45.123, 5.140),
+                (45.025, 5.200), (45.043, 5.230), (45.050, 5.303), (45.022, 5.453),
+                (44.983, 5.469), (44.899, 5.463), (44.874, 5.518), (44.860, 5.535),
+                (44.653, 5.606), (44.590, 5.542), (44.520, 5.402), (44.469, 5.409),
+                (44.277, 5.547), (44.256, 5.551), (44.175, 5.316), (44.193, 5.252),
+                (44.239, 5.181), (44.260, 5.172), (44.284, 5.031), (44.283, 5.021),
+                (44.342, 5.000), (44.388, 5.071), (44.432, 5.086), (44.412, 4.968),
+                (44.420, 4.949), (44.391, 4.880), (44.352, 4.917), (44.318, 4.887),
+                (44.277, 5.013), (44.249, 4.993), (44.238, 4.963), (44.278, 4.886),
+                (44.263, 4.856), (44.220, 4.858), (44.217, 4.841), (44.249, 4.774),
+                (44.272, 4.797), (44.292, 4.794), (44.315, 4.739), (44.340, 4.712),
+                (44.344, 4.676), (44.411, 4.671), (44.439, 4.610), (44.466, 4.712),
+                (44.514, 4.690), (44.525, 4.725), (44.556, 4.717), (44.564, 4.704),
+                (44.595, 4.722), (44.597, 4.747), (44.629, 4.755), (44.634, 4.799),
+                (44.644, 4.817), (44.665, 4.823), (44.700, 4.731), (44.731, 4.780),
+                (44.769, 4.785), (44.800, 4.820), (44.813, 4.853), (44.834, 4.846),
+                (44.854, 4.865), (44.874, 4.852), (44.903, 4.886), (44.933, 4.893),
+                (44.950, 4.870), (44.982, 4.892), (44.989, 4.869), (44.984, 4.716),
+                (44.990, 4.715), (45.032, 4.859), (45.052, 4.845), (45.087, 4.845),
+                (45.120, 4.862), (45.126, 4.841), (45.128, 4.738), (45.143, 4.742),
+                (45.191, 4.831), (45.214, 4.793), (45.234, 4.823), (45.263, 4.771),
+            ],
+        ],
+    ],
+    "27": [
+        [
+            [
+                (49.423, 0.396), (49.425, 0.467), (49.488, 0.498), (49.495, 0.535),
+                (49.470, 0.559), (49.411, 0.541), (49.401, 0.595), (49.401, 0.638),
+                (49.428, 0.670), (49.424, 0.716), (49.432, 0.767), (49.393, 0.832),
+                (49.393, 0.845), (49.420, 0.894), (49.403, 0.934), (49.343, 0.916),
+                (49.330, 0.875), (49.304, 0.906), (49.307, 0.928), (49.328, 0.957),
+                (49.328, 0.973), (49.301, 0.979), (49.281, 0.971), (49.269, 1.003),
+                (49.246, 1.027), (49.270, 1.094), (49.301, 1.063), (49.316, 1.066),
+                (49.314, 1.123), (49.326, 1.128), (49.337, 1.161), (49.336, 1.203),
+                (49.349, 1.224), (49.353, 1.258), (49.368, 1.303), (49.447, 1.302),
+                (49.487, 1.408), (49.407, 1.467), (49.372, 1.518), (49.405, 1.632),
+                (49.402, 1.644), (49.358, 1.672), (49.316, 1.753), (49.320, 1.794),
+                (49.219, 1.813), (49.218, 1.767), (49.199, 1.685), (49.150, 1.676),
+                (49.098, 1.714), (49.069, 1.674), (49.070, 1.586), (49.122, 1.534),
+                (49.048, 1.487), (49.033, 1.468), (48.998, 1.498), (48.957, 1.482),
+                (48.916, 1.495), (48.892, 1.529), (48.870, 1.450), (48.857, 1.424),
+                (48.873, 1.378), (48.819, 1.416), (48.860, 1.331), (48.797, 1.386),
+                (48.781, 1.353), (48.803, 1.295), (48.725, 1.268), (48.808, 1.246),
+                (48.766, 1.206), (48.702, 1.176), (48.733, 1.133), (48.714, 1.000),
+                (48.641, 0.949), (48.629, 0.904), (48.655, 0.817), (48.655, 0.788),
+                (48.688, 0.720), (48.772, 0.733), (48.848, 0.606), (48.896, 0.616),
+                (48.920, 0.574), (48.931, 0.461), (49.071, 0.482), (49.081, 0.418),
+                (49.127, 0.358), (49.193, 0.438), (49.210, 0.429), (49.239, 0.270),
+                (49.285, 0.292), (49.324, 0.261), (49.342, 0.263), (49.401, 0.388),
+            ],
+        ],
+    ],
+    "28": [
+        [
+            [
+                (48.076, 0.878), (48.107, 0.855), (48.143, 0.790), (48.254, 0.840),
+                (48.277, 0.776), (48.360, 0.729), (48.371, 0.768), (48.355, 0.862),
+                (48.384, 0.932), (48.385, 0.963), (48.396, 0.991), (48.510, 0.912),
+                (48.525, 0.921), (48.629, 0.904), (48.641, 0.949), (48.714, 1.000),
+                (48.733, 1.133), (48.702, 1.176), (48.766, 1.206), (48.808, 1.246),
+                (48.725, 1.268), (48.803, 1.295), (48.781, 1.353), (48.797, 1.386),
+                (48.860, 1.331), (48.819, 1.416), (48.873, 1.378), (48.857, 1.424),
+                (48.870, 1.450), (48.892, 1.529), (48.854, 1.567), (48.844, 1.555),
+                (48.730, 1.540), (48.724, 1.559), (48.677, 1.638), (48.675, 1.696),
+                (48.641, 1.712), (48.569, 1.782), (48.562, 1.773), (48.487, 1.811),
+                (48.479, 1.824), (48.469, 1.886), (48.420, 1.928), (48.320, 1.820),
+                (48.263, 1.930), (48.257, 1.953), (48.181, 1.990), (48.153, 1.974),
+                (48.134, 1.927), (48.143, 1.875), (48.132, 1.794), (48.102, 1.774),
+                (48.088, 1.520), (48.054, 1.516), (48.016, 1.427), (48.000, 1.407),
+                (47.932, 1.344), (47.950, 1.285), (47.952, 1.168), (47.981, 1.135),
+                (48.040, 1.168), (48.089, 1.027), (48.057, 0.954),
+            ],
+        ],
+    ],
+    "29": [
+        [
+            [
+                (48.199, -3.517), (48.206, -3.577), (48.187, -3.642), (48.116, -3.726),
+                (48.111, -3.714), (47.984, -3.637), (47.972, -3.625), (47.988, -3.488),
+                (47.949, -3.464), (47.943, -3.396), (47.894, -3.383), (47.869, -3.426),
+                (47.830, -3.441), (47.821, -3.476), (47.830, -3.520), (47.824, -3.536),
+                (47.799, -3.538), (47.775, -3.560), (47.779, -3.617), (47.794, -3.649),
+                (47.797, -3.706), (47.813, -3.723), (47.794, -3.775), (47.803, -3.790),
+                (47.801, -3.852), (47.843, -3.890), (47.855, -3.886), (47.862, -3.913),
+                (47.888, -3.935), (47.903, -3.988), (47.883, -3.979), (47.851, -4.009),
+                (47.869, -4.002), (47.855, -4.037), (47.871, -4.065), (47.880, -4.107),
+                (47.908, -4.129), (47.897, -4.137), (47.875, -4.111), (47.855, -4.153),
+                (47.877, -4.172), (47.862, -4.188), (47.842, -4.180), (47.834, -4.153),
+                (47.813, -4.185), (47.802, -4.225), (47.807, -4.372), (47.829, -4.373),
+                (47.838, -4.348), (47.863, -4.347), (47.916, -4.372), (47.976, -4.435),
+                (48.026, -4.533), (48.006, -4.572), (48.026, -4.602), (48.026, -4.653),
+                (48.041, -4.728), (48.075, -4.697), (48.067, -4.684), (48.116, -4.362),
+                (48.104, -4.305), (48.108, -4.290), (48.144, -4.276), (48.167, -4.294),
+                (48.196, -4.302), (48.206, -4.316), (48.212, -4.358), (48.232, -4.379),
+                (48.226, -4.404), (48.249, -4.458), (48.243, -4.485), (48.183, -4.532),
+                (48.177, -4.557), (48.205, -4.544), (48.232, -4.564), (48.253, -4.547),
+                (48.263, -4.554), (48.267, -4.626), (48.287, -4.626), (48.290, -4.575),
+                (48.308, -4.577), (48.339, -4.559), (48.342, -4.530), (48.305, -4.543),
+                (48.296, -4.516), (48.300, -4.427), (48.289, -4.402), (48.297, -4.330),
+                (48.300, -4.263), (48.288, -4.269), (48.300, -4.187), (48.306, -4.219),
+                (48.322, -4.235), (48.315, -4.270), (48.325, -4.276), (48.322, -4.325),
+                (48.363, -4.269), (48.348, -4.325), (48.353, -4.353), (48.335, -4.407),
+                (48.342, -4.454), (48.388, -4.397), (48.432, -4.290), (48.411, -4.359),
+                (48.404, -4.427), (48.368, -4.521), (48.348, -4.619), (48.363, -4.691),
+                (48.342, -4.704), (48.342, -4.755), (48.356, -4.777), (48.376, -4.783),
+                (48.378, -4.765), (48.417, -4.783), (48.455, -4.780), (48.479, -4.749),
+                (48.491, -4.775), (48.520, -4.765), (48.568, -4.722), (48.582, -4.642),
+                (48.566, -4.590), (48.568, -4.577), (48.603, -4.608), (48.609, -4.595),
+                (48.601, -4.549), (48.630, -4.564), (48.630, -4.485), (48.643, -4.407),
+                (48.658, -4.427), (48.661, -4.398), (48.679, -4.343), (48.678, -4.317),
+                (48.664, -4.299), (48.642, -4.307), (48.658, -4.242), (48.650, -4.207),
+                (48.671, -4.208), (48.691, -4.174), (48.699, -4.131), (48.685, -4.070),
+                (48.696, -4.053), (48.712, -4.057), (48.733, -3.974), (48.691, -3.968),
+                (48.679, -3.951), (48.658, -3.955), (48.681, -3.912), (48.654, -3.894),
+                (48.630, -3.852), (48.650, -3.844), (48.685, -3.858), (48.671, -3.837),
+                (48.707, -3.837), (48.712, -3.817), (48.733, -3.810), (48.717, -3.778),
+                (48.719, -3.732), (48.698, -3.674), (48.705, -3.638), (48.688, -3.639),
+                (48.683, -3.603), (48.667, -3.677), (48.611, -3.662), (48.589, -3.600),
+                (48.593, -3.572), (48.578, -3.545), (48.490, -3.478), (48.481, -3.475),
+                (48.418, -3.572), (48.375, -3.543), (48.342, -3.502), (48.331, -3.504),
+                (48.237, -3.493),
+            ],
+        ],
+        [
+            [
+                (48.465, -5.037), (48.447, -5.088), (48.463, -5.107), (48.465, -5.133),
+                (48.485, -5.069),
+            ],
+        ],
+    ],
+    "2A": [
+        [
+            [
+                (41.886, 9.399), (41.848, 9.394), (41.780, 9.403), (41.706, 9.402),
+                (41.674, 9.367), (41.674, 9.381), (41.645, 9.373), (41.640, 9.345),
+                (41.620, 9.347), (41.626, 9.292), (41.598, 9.279), (41.592, 9.292),
+                (41.604, 9.345), (41.595, 9.354), (41.569, 9.341), (41.553, 9.300),
+                (41.533, 9.282), (41.531, 9.265), (41.503, 9.265), (41.492, 9.279),
+                (41.469, 9.271), (41.450, 9.228), (41.407, 9.211), (41.428, 9.250),
+                (41.373, 9.223), (41.369, 9.194), (41.386, 9.169), (41.404, 9.096),
+                (41.429, 9.107), (41.435, 9.121), (41.462, 9.067), (41.479, 9.068),
+                (41.462, 9.039), (41.476, 9.039), (41.469, 9.018), (41.483, 9.001),
+                (41.489, 8.936), (41.523, 8.874), (41.531, 8.840), (41.544, 8.853),
+                (41.561, 8.792), (41.581, 8.796), (41.592, 8.778), (41.639, 8.802),
+                (41.633, 8.819), (41.651, 8.873), (41.671, 8.886), (41.695, 8.923),
+                (41.709, 8.836), (41.713, 8.789), (41.722, 8.776), (41.742, 8.785),
+                (41.743, 8.760), (41.729, 8.696), (41.742, 8.703), (41.750, 8.655),
+                (41.764, 8.709), (41.782, 8.722), (41.805, 8.709), (41.810, 8.752),
+                (41.824, 8.785), (41.846, 8.751), (41.859, 8.792), (41.873, 8.778),
+                (41.901, 8.803), (41.929, 8.781), (41.933, 8.744), (41.914, 8.689),
+                (41.912, 8.648), (41.901, 8.614), (41.914, 8.607), (41.944, 8.614),
+                (41.969, 8.586), (41.979, 8.655), (41.996, 8.669), (42.003, 8.656),
+                (42.026, 8.684), (42.044, 8.743), (42.057, 8.745), (42.072, 8.723),
+                (42.109, 8.699), (42.105, 8.661), (42.130, 8.630), (42.133, 8.586),
+                (42.147, 8.594), (42.155, 8.569), (42.175, 8.594), (42.185, 8.578),
+                (42.220, 8.574), (42.233, 8.545), (42.242, 8.549), (42.243, 8.586),
+                (42.255, 8.611), (42.260, 8.651), (42.281, 8.689), (42.305, 8.635),
+                (42.319, 8.625), (42.322, 8.600), (42.339, 8.635), (42.350, 8.616),
+                (42.341, 8.668), (42.371, 8.765), (42.321, 8.802), (42.315, 8.822),
+                (42.277, 8.845), (42.239, 8.904), (42.242, 9.004), (42.194, 9.053),
+                (42.142, 9.074), (42.114, 9.127), (42.052, 9.146), (42.040, 9.145),
+                (42.022, 9.204), (41.965, 9.225), (41.952, 9.173), (41.926, 9.157),
+                (41.880, 9.207), (41.839, 9.218), (41.832, 9.238),
+            ],
+        ],
+        [
+            [
+                (42.362, 8.551), (42.352, 8.607), (42.339, 8.552),
+            ],
+        ],
+    ],
+    "2B": [
+        [
+            [
+                (42.350, 8.616), (42.352, 8.607), (42.362, 8.551), (42.387, 8.552),
+                (42.388, 8.599), (42.420, 8.619), (42.423, 8.651), (42.472, 8.677),
+                (42.477, 8.660), (42.510, 8.667), (42.531, 8.717), (42.562, 8.716),
+                (42.572, 8.740), (42.558, 8.771), (42.572, 8.799), (42.600, 8.813),
+                (42.632, 8.907), (42.650, 9.018), (42.662, 9.050), (42.682, 9.053),
+                (42.726, 9.107), (42.735, 9.141), (42.733, 9.185), (42.723, 9.237),
+                (42.702, 9.271), (42.675, 9.292), (42.720, 9.328), (42.749, 9.343),
+                (42.771, 9.333), (42.808, 9.335), (42.839, 9.306), (42.867, 9.333),
+                (42.904, 9.330), (42.929, 9.360), (42.991, 9.342), (43.012, 9.363),
+                (43.017, 9.422), (42.990, 9.464), (42.964, 9.454), (42.942, 9.470),
+                (42.924, 9.466), (42.832, 9.484), (42.802, 9.483), (42.709, 9.450),
+                (42.654, 9.450), (42.606, 9.457), (42.574, 9.485), (42.565, 9.512),
+                (42.613, 9.490), (42.581, 9.519), (42.544, 9.532), (42.456, 9.533),
+                (42.435, 9.546), (42.374, 9.532), (42.295, 9.560), (42.170, 9.552),
+                (42.147, 9.560), (42.113, 9.553), (42.085, 9.519), (42.048, 9.492),
+                (41.953, 9.403), (41.886, 9.399), (41.832, 9.238), (41.839, 9.218),
+                (41.880, 9.207), (41.926, 9.157), (41.952, 9.173), (41.965, 9.225),
+                (42.022, 9.204), (42.040, 9.145), (42.052, 9.146), (42.114, 9.127),
+                (42.142, 9.074), (42.194, 9.053), (42.242, 9.004), (42.239, 8.904),
+                (42.277, 8.845), (42.315, 8.822), (42.321, 8.802), (42.371, 8.765),
+                (42.341, 8.668),
+            ],
+        ],
+        [
+            [
+                (42.620, 9.482), (42.619, 9.477), (42.647, 9.457),
+            ],
+        ],
+    ],
+    "30": [
+        [
+            [
+                (43.905, 3.364), (44.023, 3.386), (44.054, 3.463), (44.111, 3.519),
+                (44.123, 3.537), (44.133, 3.673), (44.112, 3.725), (44.086, 3.756),
+                (44.095, 3.788), (44.121, 3.819), (44.152, 3.910), (44.141, 3.969),
+                (44.163, 3.985), (44.222, 3.952), (44.288, 4.004), (44.310, 3.995),
+                (44.363, 4.018), (44.337, 4.190), (44.353, 4.264), (44.297, 4.354),
+                (44.309, 4.423), (44.364, 4.504), (44.314, 4.581), (44.283, 4.596),
+                (44.276, 4.627), (44.286, 4.657), (44.272, 4.694), (44.227, 4.670),
+                (44.214, 4.689), (44.167, 4.696), (44.141, 4.727), (44.117, 4.711),
+                (44.097, 4.712), (44.089, 4.731), (44.087, 4.803), (44.042, 4.808),
+                (44.026, 4.837), (43.996, 4.827), (43.966, 4.829), (43.954, 4.786),
+                (43.926, 4.774), (43.932, 4.729), (43.918, 4.709), (43.883, 4.717),
+                (43.871, 4.657), (43.835, 4.660), (43.752, 4.636), (43.709, 4.661),
+                (43.595, 4.458), (43.598, 4.448), (43.463, 4.262), (43.457, 4.258),
+                (43.460, 4.206), (43.472, 4.160), (43.487, 4.133), (43.510, 4.117),
+                (43.533, 4.133), (43.551, 4.107), (43.577, 4.137), (43.613, 4.148),
+                (43.616, 4.194), (43.628, 4.228), (43.658, 4.212), (43.691, 4.173),
+                (43.704, 4.132), (43.740, 4.157), (43.748, 4.112), (43.766, 4.114),
+                (43.785, 4.006), (43.807, 3.982), (43.838, 4.010), (43.899, 3.940),
+                (43.914, 3.883), (43.901, 3.830), (43.923, 3.803), (43.956, 3.782),
+                (43.954, 3.751), (43.961, 3.661), (43.871, 3.594), (43.846, 3.565),
+                (43.839, 3.543), (43.848, 3.467),
+            ],
+        ],
+    ],
+    "31": [
+        [
+            [
+                (43.339, 0.514), (43.387, 0.699), (43.446, 0.721), (43.478, 0.751),
+                (43.388, 0.978), (43.439, 1.011), (43.467, 1.037), (43.534, 1.037),
+                (43.543, 1.075), (43.543, 1.118), (43.584, 1.194), (43.626, 1.183),
+                (43.638, 1.142), (43.694, 1.088), (43.714, 1.032), (43.775, 1.026),
+                (43.823, 1.100), (43.798, 1.212), (43.804, 1.233), (43.799, 1.333),
+                (43.816, 1.358), (43.857, 1.338), (43.877, 1.375), (43.861, 1.422),
+                (43.859, 1.456), (43.931, 1.508), (43.884, 1.631), (43.814, 1.666),
+                (43.736, 1.651), (43.716, 1.676), (43.707, 1.725), (43.618, 1.774),
+                (43.611, 1.858), (43.588, 1.898), (43.517, 1.936), (43.514, 2.047),
+                (43.381, 2.022), (43.392, 1.957), (43.379, 1.901), (43.339, 1.875),
+                (43.281, 1.794), (43.314, 1.728), (43.250, 1.623), (43.278, 1.569),
+                (43.269, 1.532), (43.160, 1.488), (43.118, 1.398), (43.076, 1.377),
+                (43.111, 1.158), (43.104, 1.110), (42.983, 0.968), (42.949, 0.965),
+                (42.796, 0.937), (42.793, 0.940), (42.784, 0.921), (42.804, 0.886),
+                (42.832, 0.813), (42.832, 0.776), (42.845, 0.724), (42.845, 0.679),
+                (42.838, 0.656), (42.803, 0.654), (42.775, 0.640), (42.763, 0.651),
+                (42.745, 0.633), (42.741, 0.648), (42.715, 0.666), (42.699, 0.665),
+                (42.684, 0.644), (42.688, 0.608), (42.684, 0.433), (42.928, 0.483),
+                (42.937, 0.464), (43.048, 0.476), (43.104, 0.474), (43.208, 0.522),
+                (43.234, 0.488),
+            ],
+            [
+                (43.295, 1.295), (43.318, 1.396), (43.305, 1.423), (43.173, 1.374),
+                (43.249, 1.279), (43.259, 1.275),
+            ],
+        ],
+    ],
+    "32": [
+        [
+            [
+                (43.976, 0.161), (43.971, 0.248), (44.051, 0.394), (44.052, 0.416),
+                (44.008, 0.509), (44.012, 0.526), (43.985, 0.764), (43.922, 0.774),
+                (43.864, 0.826), (43.841, 0.831), (43.775, 1.026), (43.714, 1.032),
+                (43.694, 1.088), (43.638, 1.142), (43.626, 1.183), (43.584, 1.194),
+                (43.543, 1.118), (43.543, 1.075), (43.534, 1.037), (43.467, 1.037),
+                (43.439, 1.011), (43.388, 0.978), (43.478, 0.751), (43.446, 0.721),
+                (43.387, 0.699), (43.339, 0.514), (43.412, 0.443), (43.359, 0.258),
+                (43.454, 0.204), (43.456, 0.135), (43.536, 0.061), (43.541, -0.079),
+                (43.553, -0.084), (43.625, -0.194), (43.643, -0.185), (43.730, -0.280),
+                (43.753, -0.244), (43.824, -0.258), (43.871, -0.172), (43.956, -0.206),
+                (44.040, -0.144), (43.917, 0.035), (43.953, 0.140),
+            ],
+        ],
+    ],
+    "33": [
+        [
+            [
+                (45.378, -0.823), (45.326, -0.766), (45.239, -0.739), (45.146, -0.720),
+                (45.076, -0.682), (45.045, -0.648), (45.018, -0.610), (45.005, -0.578),
+                (44.985, -0.561), (44.939, -0.561), (44.902, -0.548), (44.895, -0.535),
+                (44.950, -0.548), (44.977, -0.539), (44.998, -0.550), (45.025, -0.596),
+                (45.020, -0.539), (44.998, -0.494), (45.029, -0.519), (45.053, -0.602),
+                (45.073, -0.638), (45.131, -0.669), (45.322, -0.707), (45.359, -0.719),
+                (45.321, -0.545), (45.335, -0.482), (45.264, -0.461), (45.214, -0.408),
+                (45.212, -0.354), (45.148, -0.273), (45.091, -0.258), (45.084, -0.236),
+                (45.087, -0.194), (45.124, -0.117), (45.147, -0.105), (45.125, -0.013),
+                (45.087, 0.062), (45.069, 0.033), (44.935, 0.033), (44.921, 0.000),
+                (44.854, 0.000), (44.794, 0.042), (44.795, 0.109), (44.762, 0.177),
+                (44.820, 0.208), (44.862, 0.208), (44.844, 0.247), (44.834, 0.288),
+                (44.741, 0.303), (44.737, 0.296), (44.753, 0.187), (44.698, 0.113),
+                (44.596, 0.167), (44.588, 0.056), (44.580, 0.049), (44.516, -0.064),
+                (44.478, -0.088), (44.442, 0.042), (44.396, 0.071), (44.264, -0.082),
+                (44.165, -0.067), (44.144, -0.117), (44.185, -0.479), (44.257, -0.524),
+                (44.406, -0.590), (44.404, -0.844), (44.440, -0.923), (44.450, -0.924),
+                (44.528, -0.975), (44.553, -1.020), (44.559, -1.094), (44.525, -1.251),
+                (44.556, -1.257), (44.584, -1.231), (44.648, -1.206), (44.665, -1.187),
+                (44.666, -1.161), (44.655, -1.100), (44.669, -1.045), (44.685, -1.044),
+                (44.703, -1.069), (44.717, -1.065), (44.768, -1.141), (44.779, -1.165),
+                (44.707, -1.234), (44.627, -1.260), (45.121, -1.199), (45.279, -1.158),
+                (45.490, -1.140), (45.505, -1.134), (45.569, -1.085), (45.565, -1.056),
+                (45.527, -1.059), (45.507, -1.040), (45.471, -0.973), (45.442, -0.905),
+                (45.410, -0.890),
+            ],
+        ],
+    ],
+    "34": [
+        [
+            [
+                (43.392, 2.714), (43.532, 2.696), (43.563, 2.592), (43.644, 2.615),
+                (43.674, 2.900), (43.676, 2.901), (43.709, 2.978), (43.850, 3.112),
+                (43.851, 3.168), (43.905, 3.364), (43.848, 3.467), (43.839, 3.543),
+                (43.846, 3.565), (43.871, 3.594), (43.961, 3.661), (43.954, 3.751),
+                (43.956, 3.782), (43.923, 3.803), (43.901, 3.830), (43.914, 3.883),
+                (43.899, 3.940), (43.838, 4.010), (43.807, 3.982), (43.785, 4.006),
+                (43.766, 4.114), (43.748, 4.112), (43.740, 4.157), (43.704, 4.132),
+                (43.691, 4.173), (43.658, 4.212), (43.628, 4.228), (43.616, 4.194),
+                (43.613, 4.148), (43.577, 4.137), (43.551, 4.107), (43.556, 4.047),
+                (43.551, 3.991), (43.533, 3.939), (43.413, 3.740), (43.375, 3.622),
+                (43.355, 3.590), (43.281, 3.513), (43.274, 3.492), (43.289, 3.452),
+                (43.284, 3.385), (43.263, 3.318), (43.219, 3.244), (43.190, 3.212),
+                (43.216, 3.189), (43.260, 3.133), (43.268, 3.081), (43.284, 3.062),
+                (43.293, 3.025), (43.320, 2.995), (43.317, 2.954), (43.355, 2.900),
+                (43.378, 2.884), (43.400, 2.819), (43.382, 2.760),
+            ],
+        ],
+        [
+            [
+                (43.264, 2.798), (43.292, 2.805), (43.382, 2.760), (43.275, 2.696),
+                (43.233, 2.704), (43.246, 2.780),
+            ],
+        ],
+    ],
+    "35": [
+        [
+            [
+                (48.151, -2.327), (48.194, -2.305), (48.230, -2.193), (48.262, -2.189),
+                (48.274, -2.112), (48.326, -2.087), (48.260, -2.007), (48.306, -1.919),
+                (48.331, -1.935), (48.364, -1.930), (48.394, -1.945), (48.420, -1.929),
+                (48.442, -1.953), (48.477, -1.916), (48.496, -1.934), (48.532, -1.932),
+                (48.545, -1.964), (48.589, -1.980), (48.601, -2.000), (48.643, -2.029),
+                (48.660, -2.018), (48.674, -1.988), (48.691, -1.977), (48.699, -1.946),
+                (48.712, -1.844), (48.691, -1.836), (48.664, -1.861), (48.641, -1.861),
+                (48.624, -1.838), (48.616, -1.796), (48.615, -1.723), (48.623, -1.644),
+                (48.643, -1.580), (48.638, -1.493), (48.567, -1.554), (48.505, -1.509),
+                (48.515, -1.425), (48.494, -1.407), (48.484, -1.296), (48.563, -1.267),
+                (48.564, -1.250), (48.502, -1.180), (48.519, -1.132), (48.503, -1.078),
+                (48.436, -1.081), (48.414, -1.056), (48.403, -1.064), (48.294, -1.026),
+                (48.234, -1.106), (48.186, -1.103), (48.076, -1.066), (48.071, -1.004),
+                (48.000, -0.960), (47.964, -1.013), (47.967, -1.113), (47.902, -1.147),
+                (47.880, -1.153), (47.850, -1.212), (47.806, -1.221), (47.788, -1.243),
+                (47.780, -1.363), (47.832, -1.403), (47.835, -1.479), (47.775, -1.531),
+                (47.789, -1.615), (47.717, -1.659), (47.675, -1.741), (47.678, -1.782),
+                (47.725, -1.871), (47.687, -1.900), (47.669, -2.032), (47.674, -2.053),
+                (47.626, -2.090), (47.652, -2.111), (47.677, -2.070), (47.696, -2.108),
+                (47.730, -2.111), (47.739, -2.092), (47.791, -2.114), (47.837, -2.043),
+                (47.858, -2.066), (47.932, -2.054), (47.953, -2.105), (47.996, -2.142),
+                (47.994, -2.238), (48.019, -2.265), (48.075, -2.199),
+            ],
+        ],
+        [
+            [
+                (48.619, -2.150), (48.636, -2.145), (48.647, -2.100), (48.650, -2.052),
+                (48.599, -2.022), (48.589, -2.001), (48.575, -2.008), (48.554, -1.987),
+                (48.559, -2.093), (48.599, -2.098),
+            ],
+        ],
+    ],
+    "36": [
+        [
+            [
+                (46.721, 0.861), (46.794, 0.958), (46.847, 1.000), (46.960, 1.005),
+                (46.974, 0.990), (47.090, 1.163), (47.095, 1.190), (47.184, 1.266),
+                (47.178, 1.323), (47.202, 1.474), (47.219, 1.531), (47.222, 1.578),
+                (47.282, 1.612), (47.239, 1.742), (47.212, 1.765), (47.165, 1.710),
+                (47.140, 1.706), (47.084, 1.926), (47.088, 1.929), (47.124, 2.034),
+                (47.120, 2.119), (47.068, 2.156), (47.040, 2.081), (46.966, 2.059),
+                (46.881, 2.125), (46.867, 2.124), (46.823, 2.022), (46.800, 2.001),
+                (46.722, 2.006), (46.653, 2.117), (46.607, 2.098), (46.450, 2.066),
+                (46.353, 1.772), (46.395, 1.700), (46.391, 1.687), (46.338, 1.574),
+                (46.354, 1.473), (46.402, 1.424), (46.336, 1.192), (46.346, 1.157),
+                (46.424, 1.107), (46.446, 1.054), (46.523, 0.983), (46.575, 0.865),
+                (46.607, 0.857),
+            ],
+        ],
+    ],
+    "37": [
+        [
+            [
+                (47.569, 0.206), (47.606, 0.252), (47.609, 0.375), (47.636, 0.393),
+                (47.666, 0.479), (47.655, 0.547), (47.667, 0.580), (47.674, 0.648),
+                (47.669, 0.711), (47.673, 0.745), (47.657, 0.776), (47.674, 0.898),
+                (47.605, 1.025), (47.577, 1.028), (47.551, 1.044), (47.465, 1.127),
+                (47.418, 1.138), (47.387, 1.085), (47.336, 1.091), (47.260, 1.086),
+                (47.255, 1.130), (47.223, 1.230), (47.184, 1.266), (47.095, 1.190),
+                (47.090, 1.163), (46.974, 0.990), (46.960, 1.005), (46.847, 1.000),
+                (46.794, 0.958), (46.721, 0.861), (46.740, 0.842), (46.843, 0.844),
+                (46.854, 0.830), (46.851, 0.739), (46.838, 0.688), (46.861, 0.667),
+                (46.926, 0.667), (46.951, 0.649), (46.998, 0.657), (46.998, 0.466),
+                (46.991, 0.464), (46.914, 0.243), (46.928, 0.208), (47.040, 0.202),
+                (47.101, 0.132), (47.207, 0.091), (47.262, 0.089), (47.269, 0.080),
+                (47.338, 0.124), (47.360, 0.193), (47.370, 0.250), (47.497, 0.236),
+            ],
+        ],
+    ],
+    "38": [
+        [
+            [
+                (45.291, 4.785), (45.342, 4.756), (45.355, 4.778), (45.374, 4.772),
+                (45.392, 4.739), (45.421, 4.759), (45.459, 4.706), (45.457, 4.806),
+                (45.491, 4.846), (45.489, 4.868), (45.514, 4.893), (45.555, 4.880),
+                (45.537, 4.828), (45.562, 4.818), (45.568, 4.779), (45.591, 4.793),
+                (45.582, 4.843), (45.602, 4.863), (45.614, 4.907), (45.606, 4.938),
+                (45.631, 5.034), (45.658, 5.051), (45.674, 5.091), (45.691, 5.087),
+                (45.720, 5.152), (45.734, 5.129), (45.736, 5.087), (45.768, 5.092),
+                (45.789, 5.073), (45.811, 5.119), (45.812, 5.143), (45.798, 5.154),
+                (45.796, 5.176), (45.765, 5.205), (45.777, 5.255), (45.802, 5.242),
+                (45.848, 5.288), (45.845, 5.339), (45.848, 5.411), (45.826, 5.432),
+                (45.808, 5.425), (45.769, 5.459), (45.793, 5.564), (45.785, 5.575),
+                (45.715, 5.594), (45.687, 5.648), (45.643, 5.626), (45.629, 5.611),
+                (45.583, 5.626), (45.587, 5.665), (45.579, 5.688), (45.562, 5.675),
+                (45.541, 5.628), (45.501, 5.634), (45.494, 5.667), (45.471, 5.691),
+                (45.468, 5.713), (45.432, 5.730), (45.454, 5.866), (45.461, 5.866),
+                (45.460, 5.916), (45.481, 6.008), (45.463, 6.064), (45.436, 6.078),
+                (45.404, 6.171), (45.359, 6.173), (45.319, 6.155), (45.290, 6.154),
+                (45.247, 6.169), (45.209, 6.164), (45.158, 6.228), (45.044, 6.333),
+                (45.002, 6.319), (44.897, 6.298), (44.840, 6.219), (44.852, 6.029),
+                (44.817, 5.974), (44.696, 5.872), (44.680, 5.831), (44.653, 5.606),
+                (44.860, 5.535), (44.874, 5.518), (44.899, 5.463), (44.983, 5.469),
+                (45.022, 5.453), (45.050, 5.303), (45.043, 5.230), (45.025, 5.200),
+                (45.123, 5.140), (45.133, 5.139), (45.162, 5.102), (45.182, 5.090),
+                (45.227, 5.133), (45.256, 5.132), (45.354, 5.065), (45.370, 5.064),
+                (45.324, 4.876), (45.312, 4.874), (45.298, 4.794),
+            ],
+        ],
+    ],
+    "39": [
+        [
+            [
+                (46.415, 5.251), (46.484, 5.317), (46.431, 5.462), (46.470, 5.509),
+                (46.510, 5.499), (46.517, 5.311), (46.557, 5.282), (46.624, 5.360),
+                (46.636, 5.386), (46.665, 5.387), (46.720, 5.348), (46.816, 5.354),
+                (46.837, 5.383), (46.954, 5.233), (46.981, 5.254), (47.036, 5.231),
+                (47.086, 5.338), (47.132, 5.351), (47.173, 5.501), (47.186, 5.529),
+                (47.234, 5.676), (47.222, 5.716), (47.135, 5.829), (47.091, 5.794),
+                (47.088, 5.711), (47.060, 5.650), (46.984, 5.700), (47.022, 5.879),
+                (47.023, 5.995), (46.879, 6.003), (46.853, 5.986), (46.695, 6.138),
+                (46.694, 6.174), (46.662, 6.236), (46.596, 6.132), (46.570, 6.122),
+                (46.552, 6.146), (46.521, 6.110), (46.471, 6.064), (46.413, 6.070),
+                (46.409, 6.019), (46.391, 5.979), (46.359, 5.960), (46.285, 5.844),
+                (46.287, 5.828), (46.330, 5.746), (46.377, 5.693), (46.386, 5.661),
+                (46.305, 5.527), (46.364, 5.458), (46.411, 5.453), (46.408, 5.258),
+            ],
+        ],
+    ],
+    "40": [
+        [
+            [
+                (43.539, -1.514), (43.580, -1.477), (43.612, -1.470), (43.668, -1.446),
+                (43.832, -1.405), (43.890, -1.381), (44.019, -1.346), (44.302, -1.282),
+                (44.442, -1.254), (44.505, -1.247), (44.525, -1.251), (44.559, -1.094),
+                (44.553, -1.020), (44.528, -0.975), (44.450, -0.924), (44.440, -0.923),
+                (44.404, -0.844), (44.406, -0.590), (44.257, -0.524), (44.185, -0.479),
+                (44.144, -0.117), (44.165, -0.067), (44.153, 0.045), (44.137, 0.067),
+                (43.976, 0.161), (43.953, 0.140), (43.917, 0.035), (44.040, -0.144),
+                (43.956, -0.206), (43.871, -0.172), (43.824, -0.258), (43.753, -0.244),
+                (43.730, -0.280), (43.643, -0.185), (43.625, -0.194), (43.553, -0.084),
+                (43.541, -0.079), (43.441, -0.142), (43.444, -0.172), (43.485, -0.288),
+                (43.624, -0.219), (43.632, -0.355), (43.521, -0.440), (43.562, -0.577),
+                (43.563, -0.613), (43.530, -0.672), (43.548, -0.820), (43.563, -0.834),
+                (43.545, -0.943), (43.505, -0.972), (43.483, -1.032), (43.501, -1.049),
+                (43.527, -1.187), (43.537, -1.205), (43.529, -1.233), (43.537, -1.290),
+                (43.512, -1.368), (43.513, -1.418), (43.531, -1.426),
+            ],
+        ],
+    ],
+    "41": [
+        [
+            [
+                (47.673, 0.745), (47.727, 0.743), (47.756, 0.752), (47.807, 0.828),
+                (47.823, 0.833), (47.878, 0.745), (47.916, 0.800), (47.981, 0.798),
+                (47.990, 0.791), (48.076, 0.878), (48.057, 0.954), (48.089, 1.027),
+                (48.040, 1.168), (47.981, 1.135), (47.952, 1.168), (47.950, 1.285),
+                (47.932, 1.344), (48.000, 1.407), (48.016, 1.427), (48.054, 1.516),
+                (47.972, 1.533), (47.888, 1.611), (47.867, 1.607), (47.846, 1.578),
+                (47.810, 1.477), (47.747, 1.544), (47.730, 1.660), (47.705, 1.692),
+                (47.662, 1.676), (47.608, 1.767), (47.610, 1.796), (47.671, 1.873),
+                (47.658, 1.959), (47.652, 1.969), (47.706, 2.157), (47.681, 2.212),
+                (47.672, 2.211), (47.592, 2.145), (47.575, 2.139), (47.534, 2.151),
+                (47.480, 2.305), (47.414, 2.322), (47.369, 2.152), (47.364, 2.147),
+                (47.281, 2.147), (47.260, 1.996), (47.218, 1.973), (47.196, 1.914),
+                (47.221, 1.804), (47.212, 1.765), (47.239, 1.742), (47.282, 1.612),
+                (47.222, 1.578), (47.219, 1.531), (47.202, 1.474), (47.178, 1.323),
+                (47.184, 1.266), (47.223, 1.230), (47.255, 1.130), (47.260, 1.086),
+                (47.336, 1.091), (47.387, 1.085), (47.418, 1.138), (47.465, 1.127),
+                (47.551, 1.044), (47.577, 1.028), (47.605, 1.025), (47.674, 0.898),
+                (47.657, 0.776),
+            ],
+        ],
+    ],
+    "42": [
+        [
+            [
+                (45.978, 3.727), (46.010, 3.787), (46.047, 3.793), (46.121, 3.769),
+                (46.165, 3.718), (46.255, 3.776), (46.277, 3.893), (46.203, 3.980),
+                (46.219, 4.096), (46.227, 4.120), (46.262, 4.174), (46.234, 4.251),
+                (46.181, 4.282), (46.198, 4.472), (46.145, 4.466), (46.129, 4.443),
+                (46.132, 4.339), (46.143, 4.284), (46.109, 4.250), (46.072, 4.269),
+                (46.033, 4.235), (45.994, 4.278), (45.967, 4.269), (45.935, 4.283),
+                (45.911, 4.328), (45.913, 4.349), (45.858, 4.417), (45.827, 4.420),
+                (45.815, 4.405), (45.765, 4.403), (45.735, 4.314), (45.706, 4.308),
+                (45.679, 4.349), (45.676, 4.417), (45.665, 4.428), (45.597, 4.416),
+                (45.584, 4.445), (45.576, 4.536), (45.580, 4.545), (45.564, 4.615),
+                (45.554, 4.638), (45.556, 4.665), (45.498, 4.709), (45.477, 4.687),
+                (45.459, 4.706), (45.421, 4.759), (45.392, 4.739), (45.374, 4.772),
+                (45.355, 4.778), (45.342, 4.756), (45.346, 4.718), (45.325, 4.673),
+                (45.310, 4.672), (45.301, 4.601), (45.263, 4.583), (45.259, 4.553),
+                (45.200, 4.493), (45.260, 4.441), (45.255, 4.355), (45.274, 4.327),
+                (45.309, 4.318), (45.351, 4.364), (45.362, 4.364), (45.376, 4.235),
+                (45.394, 4.223), (45.364, 4.117), (45.368, 4.106), (45.356, 4.033),
+                (45.303, 3.975), (45.406, 3.834), (45.444, 3.842), (45.500, 3.890),
+                (45.511, 3.909), (45.643, 3.894), (45.714, 3.814), (45.719, 3.691),
+                (45.771, 3.662), (45.784, 3.662), (45.830, 3.694), (45.874, 3.781),
+            ],
+        ],
+    ],
+    "43": [
+        [
+            [
+                (45.075, 3.291), (45.112, 3.278), (45.148, 3.316), (45.249, 3.302),
+                (45.279, 3.288), (45.326, 3.212), (45.369, 3.074), (45.429, 3.292),
+                (45.389, 3.356), (45.378, 3.467), (45.391, 3.527), (45.337, 3.568),
+                (45.331, 3.578), (45.362, 3.772), (45.406, 3.834), (45.303, 3.975),
+                (45.356, 4.033), (45.368, 4.106), (45.364, 4.117), (45.394, 4.223),
+                (45.376, 4.235), (45.362, 4.364), (45.351, 4.364), (45.309, 4.318),
+                (45.274, 4.327), (45.255, 4.355), (45.260, 4.441), (45.200, 4.493),
+                (45.169, 4.491), (45.125, 4.454), (45.116, 4.456), (45.101, 4.424),
+                (44.995, 4.303), (44.988, 4.300), (44.939, 4.207), (44.836, 4.187),
+                (44.785, 4.063), (44.847, 3.876), (44.849, 3.843), (44.886, 3.750),
+                (44.900, 3.700), (44.902, 3.481), (44.906, 3.472), (45.018, 3.453),
+            ],
+        ],
+    ],
+    "44": [
+        [
+            [
+                (47.626, -2.090), (47.674, -2.053), (47.669, -2.032), (47.687, -1.900),
+                (47.725, -1.871), (47.678, -1.782), (47.675, -1.741), (47.717, -1.659),
+                (47.789, -1.615), (47.775, -1.531), (47.835, -1.479), (47.832, -1.403),
+                (47.780, -1.363), (47.788, -1.243), (47.691, -1.237), (47.653, -1.189),
+                (47.638, -1.178), (47.634, -1.105), (47.513, -1.066), (47.516, -1.008),
+                (47.467, -0.966), (47.449, -0.981), (47.411, -0.984), (47.384, -0.978),
+                (47.357, -1.081), (47.360, -1.130), (47.351, -1.190), (47.355, -1.236),
+                (47.364, -1.247), (47.325, -1.292), (47.336, -1.318), (47.299, -1.344),
+                (47.290, -1.311), (47.307, -1.277), (47.301, -1.246), (47.253, -1.273),
+                (47.248, -1.192), (47.232, -1.143), (47.167, -1.143), (47.156, -1.214),
+                (47.115, -1.239), (47.072, -1.204), (47.068, -1.144), (47.023, -1.155),
+                (47.037, -1.227), (47.064, -1.213), (47.073, -1.271), (47.029, -1.304),
+                (47.035, -1.338), (47.019, -1.378), (46.962, -1.388), (46.943, -1.461),
+                (46.965, -1.482), (46.995, -1.472), (47.020, -1.499), (46.991, -1.558),
+                (46.959, -1.541), (46.924, -1.572), (46.889, -1.529), (46.815, -1.587),
+                (46.813, -1.623), (46.820, -1.647), (46.874, -1.651), (46.905, -1.723),
+                (46.898, -1.740), (46.902, -1.780), (46.947, -1.820), (46.986, -1.894),
+                (46.984, -1.923), (46.995, -1.938), (47.018, -2.014), (47.035, -1.991),
+                (47.052, -1.993), (47.092, -2.030), (47.115, -2.090), (47.129, -2.205),
+                (47.142, -2.241), (47.161, -2.205), (47.168, -2.165), (47.204, -2.159),
+                (47.235, -2.172), (47.280, -2.152), (47.287, -2.128), (47.293, -2.036),
+                (47.300, -2.015), (47.289, -1.999), (47.279, -1.948), (47.284, -1.917),
+                (47.273, -1.898), (47.266, -1.919), (47.246, -1.878), (47.240, -1.836),
+                (47.212, -1.781), (47.211, -1.727), (47.226, -1.788), (47.260, -1.836),
+                (47.294, -1.906), (47.302, -1.958), (47.320, -2.010), (47.313, -2.148),
+                (47.300, -2.180), (47.273, -2.206), (47.267, -2.236), (47.246, -2.278),
+                (47.252, -2.316), (47.286, -2.371), (47.286, -2.405), (47.266, -2.419),
+                (47.267, -2.448), (47.300, -2.542), (47.305, -2.519), (47.291, -2.476),
+                (47.307, -2.436), (47.348, -2.481), (47.321, -2.502), (47.350, -2.503),
+                (47.365, -2.515), (47.383, -2.556), (47.416, -2.477), (47.404, -2.429),
+                (47.424, -2.392), (47.431, -2.448), (47.447, -2.443), (47.473, -2.408),
+                (47.454, -2.363), (47.499, -2.229), (47.515, -2.214), (47.511, -2.110),
+                (47.587, -2.120), (47.609, -2.086),
+            ],
+        ],
+    ],
+    "45": [
+        [
+            [
+                (48.054, 1.516), (48.088, 1.520), (48.102, 1.774), (48.132, 1.794),
+                (48.143, 1.875), (48.134, 1.927), (48.153, 1.974), (48.181, 1.990),
+                (48.257, 1.953), (48.267, 2.044), (48.243, 2.125), (48.323, 2.158),
+                (48.374, 2.238), (48.376, 2.256), (48.345, 2.293), (48.338, 2.341),
+                (48.351, 2.429), (48.311, 2.489), (48.270, 2.501), (48.240, 2.573),
+                (48.196, 2.595), (48.178, 2.585), (48.168, 2.405), (48.115, 2.424),
+                (48.093, 2.491), (48.143, 2.588), (48.093, 2.642), (48.094, 2.681),
+                (48.132, 2.731), (48.156, 2.734), (48.183, 2.804), (48.141, 2.832),
+                (48.097, 2.950), (48.110, 2.969), (48.117, 3.011), (48.108, 3.081),
+                (48.039, 3.177), (47.988, 3.174), (47.957, 3.198), (47.889, 3.025),
+                (47.845, 2.977), (47.784, 2.953), (47.744, 2.855), (47.628, 2.903),
+                (47.610, 2.949), (47.596, 2.959), (47.530, 2.839), (47.525, 2.778),
+                (47.500, 2.740), (47.483, 2.667), (47.522, 2.650), (47.581, 2.535),
+                (47.576, 2.507), (47.607, 2.422), (47.571, 2.351), (47.672, 2.211),
+                (47.681, 2.212), (47.706, 2.157), (47.652, 1.969), (47.658, 1.959),
+                (47.671, 1.873), (47.610, 1.796), (47.608, 1.767), (47.662, 1.676),
+                (47.705, 1.692), (47.730, 1.660), (47.747, 1.544), (47.810, 1.477),
+                (47.846, 1.578), (47.867, 1.607), (47.888, 1.611), (47.972, 1.533),
+            ],
+        ],
+    ],
+    "46": [
+        [
+            [
+                (44.417, 1.094), (44.521, 1.051), (44.633, 1.043), (44.639, 1.066),
+                (44.714, 1.124), (44.750, 1.283), (44.778, 1.306), (44.829, 1.383),
+                (44.850, 1.370), (44.989, 1.457), (45.014, 1.483), (45.029, 1.514),
+                (44.997, 1.637), (45.013, 1.752), (44.946, 1.779), (44.946, 1.802),
+                (44.976, 2.015), (44.934, 2.026), (44.840, 2.101), (44.790, 2.071),
+                (44.729, 2.063), (44.659, 2.271), (44.609, 2.150), (44.628, 2.108),
+                (44.528, 1.964), (44.518, 1.972), (44.390, 1.898), (44.355, 1.848),
+                (44.370, 1.738), (44.272, 1.643), (44.262, 1.596), (44.308, 1.451),
+                (44.229, 1.409), (44.231, 1.293), (44.281, 1.267), (44.283, 1.209),
+                (44.321, 1.112), (44.410, 1.114),
+            ],
+        ],
+    ],
+    "47": [
+        [
+            [
+                (43.976, 0.161), (44.137, 0.067), (44.153, 0.045), (44.165, -0.067),
+                (44.264, -0.082), (44.396, 0.071), (44.442, 0.042), (44.478, -0.088),
+                (44.516, -0.064), (44.580, 0.049), (44.588, 0.056), (44.596, 0.167),
+                (44.698, 0.113), (44.753, 0.187), (44.737, 0.296), (44.661, 0.290),
+                (44.618, 0.488), (44.710, 0.505), (44.750, 0.625), (44.708, 0.682),
+                (44.688, 0.895), (44.640, 0.949), (44.633, 1.043), (44.521, 1.051),
+                (44.417, 1.094), (44.405, 0.974), (44.396, 0.944), (44.303, 0.894),
+                (44.229, 0.929), (44.205, 0.802), (44.131, 0.744), (44.094, 0.739),
+                (44.041, 0.778), (44.003, 0.779), (43.985, 0.764), (44.012, 0.526),
+                (44.008, 0.509), (44.052, 0.416), (44.051, 0.394), (43.971, 0.248),
+            ],
+        ],
+    ],
+    "48": [
+        [
+            [
+                (44.781, 2.903), (44.794, 2.994), (44.817, 3.028), (44.899, 3.053),
+                (44.953, 3.095), (44.955, 3.121), (45.022, 3.242), (45.075, 3.291),
+                (45.018, 3.453), (44.906, 3.472), (44.902, 3.481), (44.900, 3.700),
+                (44.886, 3.750), (44.849, 3.843), (44.847, 3.876), (44.785, 4.063),
+                (44.726, 4.046), (44.641, 4.060), (44.581, 4.090), (44.566, 4.108),
+                (44.483, 4.101), (44.399, 4.016), (44.363, 4.018), (44.310, 3.995),
+                (44.288, 4.004), (44.222, 3.952), (44.163, 3.985), (44.141, 3.969),
+                (44.152, 3.910), (44.121, 3.819), (44.095, 3.788), (44.086, 3.756),
+                (44.112, 3.725), (44.133, 3.673), (44.123, 3.537), (44.111, 3.519),
+                (44.054, 3.463), (44.023, 3.386), (44.098, 3.289), (44.101, 3.227),
+                (44.160, 3.100), (44.178, 2.959), (44.222, 2.939), (44.319, 3.044),
+                (44.282, 3.115), (44.291, 3.156), (44.380, 3.051), (44.388, 2.990),
+                (44.447, 3.030), (44.483, 3.004), (44.514, 3.043), (44.592, 2.985),
+                (44.591, 2.911), (44.740, 2.925),
+            ],
+        ],
+    ],
+    "49": [
+        [
+            [
+                (47.023, -1.155), (47.068, -1.144), (47.072, -1.204), (47.115, -1.239),
+                (47.156, -1.214), (47.167, -1.143), (47.232, -1.143), (47.248, -1.192),
+                (47.253, -1.273), (47.301, -1.246), (47.307, -1.277), (47.290, -1.311),
+                (47.299, -1.344), (47.336, -1.318), (47.325, -1.292), (47.364, -1.247),
+                (47.355, -1.236), (47.351, -1.190), (47.360, -1.130), (47.357, -1.081),
+                (47.384, -0.978), (47.411, -0.984), (47.449, -0.981), (47.467, -0.966),
+                (47.516, -1.008), (47.513, -1.066), (47.634, -1.105), (47.638, -1.178),
+                (47.653, -1.189), (47.691, -1.237), (47.788, -1.243), (47.806, -1.221),
+                (47.766, -1.121), (47.767, -1.105), (47.748, -1.052), (47.755, -0.992),
+                (47.779, -0.958), (47.788, -0.884), (47.778, -0.873), (47.712, -0.740),
+                (47.716, -0.677), (47.768, -0.610), (47.849, -0.557), (47.860, -0.487),
+                (47.852, -0.471), (47.814, -0.429), (47.799, -0.394), (47.751, -0.368),
+                (47.731, -0.332), (47.718, -0.283), (47.740, -0.234), (47.615, -0.165),
+                (47.623, -0.108), (47.612, 0.006), (47.599, 0.022), (47.581, 0.116),
+                (47.569, 0.206), (47.497, 0.236), (47.370, 0.250), (47.360, 0.193),
+                (47.338, 0.124), (47.269, 0.080), (47.262, 0.089), (47.207, 0.091),
+                (47.101, 0.132), (47.091, 0.013), (47.073, -0.031), (47.066, -0.130),
+                (47.078, -0.187), (47.120, -0.300), (47.079, -0.336), (47.065, -0.455),
+                (47.066, -0.487), (47.049, -0.557), (47.025, -0.569), (46.967, -0.660),
+                (46.998, -0.710), (47.002, -0.796), (46.973, -0.805), (46.960, -0.823),
+                (46.992, -0.898), (47.009, -0.902), (47.013, -0.995), (47.019, -1.000),
+                (46.998, -1.079), (47.027, -1.088),
+            ],
+        ],
+    ],
+    "50": [
+        [
+            [
+                (49.360, -1.167), (49.247, -1.145), (49.244, -1.012), (49.186, -0.978),
+                (49.164, -0.897), (49.101, -0.880), (49.081, -0.881), (49.060, -0.863),
+                (48.998, -0.908), (48.983, -0.905), (48.915, -0.942), (48.906, -0.967),
+                (48.900, -1.094), (48.865, -1.135), (48.793, -1.128), (48.744, -1.044),
+                (48.786, -0.954), (48.755, -0.833), (48.680, -0.825), (48.647, -0.735),
+                (48.538, -0.753), (48.524, -0.746), (48.494, -0.757), (48.468, -0.872),
+                (48.545, -0.976), (48.503, -1.078), (48.519, -1.132), (48.502, -1.180),
+                (48.564, -1.250), (48.563, -1.267), (48.484, -1.296), (48.494, -1.407),
+                (48.515, -1.425), (48.505, -1.509), (48.567, -1.554), (48.638, -1.493),
+                (48.652, -1.393), (48.643, -1.357), (48.661, -1.372), (48.671, -1.433),
+                (48.663, -1.443), (48.683, -1.456), (48.702, -1.508), (48.725, -1.516),
+                (48.747, -1.554), (48.771, -1.562), (48.822, -1.567), (48.838, -1.579),
+                (48.842, -1.603), (48.874, -1.572), (48.922, -1.564), (48.924, -1.548),
+                (48.944, -1.542), (48.958, -1.563), (49.030, -1.546), (49.033, -1.568),
+                (49.013, -1.579), (49.037, -1.597), (49.082, -1.589), (49.103, -1.608),
+                (49.128, -1.596), (49.144, -1.569), (49.144, -1.589), (49.178, -1.604),
+                (49.216, -1.610), (49.225, -1.603), (49.219, -1.548), (49.225, -1.548),
+                (49.238, -1.617), (49.219, -1.625), (49.232, -1.641), (49.288, -1.658),
+                (49.302, -1.687), (49.329, -1.707), (49.329, -1.686), (49.356, -1.699),
+                (49.339, -1.715), (49.370, -1.776), (49.384, -1.768), (49.377, -1.807),
+                (49.397, -1.820), (49.445, -1.816), (49.494, -1.844), (49.531, -1.885),
+                (49.545, -1.878), (49.572, -1.844), (49.620, -1.840), (49.662, -1.869),
+                (49.678, -1.946), (49.724, -1.935), (49.726, -1.908), (49.713, -1.867),
+                (49.715, -1.839), (49.691, -1.812), (49.680, -1.708), (49.652, -1.597),
+                (49.664, -1.573), (49.658, -1.540), (49.663, -1.511), (49.702, -1.456),
+                (49.713, -1.391), (49.698, -1.271), (49.641, -1.232), (49.624, -1.228),
+                (49.612, -1.253), (49.589, -1.264), (49.582, -1.301), (49.558, -1.306),
+                (49.493, -1.262), (49.430, -1.185), (49.415, -1.176), (49.382, -1.174),
+                (49.366, -1.185),
+            ],
+        ],
+    ],
+    "51": [
+        [
+            [
+                (48.918, 3.434), (48.941, 3.468), (48.960, 3.521), (48.967, 3.614),
+                (49.123, 3.548), (49.174, 3.659), (49.197, 3.678), (49.268, 3.582),
+                (49.389, 3.640), (49.417, 3.674), (49.419, 3.740), (49.441, 3.859),
+                (49.391, 3.958), (49.395, 4.022), (49.420, 4.072), (49.473, 4.117),
+                (49.448, 4.199), (49.437, 4.266), (49.397, 4.354), (49.387, 4.449),
+                (49.345, 4.510), (49.285, 4.543), (49.235, 4.713), (49.182, 4.732),
+                (49.139, 4.901), (49.105, 4.941), (49.092, 4.946), (49.016, 4.922),
+                (49.001, 4.889), (48.990, 4.735), (48.959, 4.724), (48.872, 4.669),
+                (48.846, 4.772), (48.812, 4.833), (48.775, 4.875), (48.795, 4.907),
+                (48.793, 4.924), (48.756, 4.915), (48.727, 4.898), (48.709, 4.834),
+                (48.744, 4.712), (48.727, 4.701), (48.590, 4.646), (48.579, 4.621),
+                (48.600, 4.418), (48.687, 4.401), (48.769, 4.374), (48.805, 4.274),
+                (48.822, 4.197), (48.642, 4.044), (48.612, 3.997), (48.617, 3.915),
+                (48.533, 3.839), (48.532, 3.757), (48.585, 3.671), (48.625, 3.682),
+                (48.655, 3.631), (48.659, 3.521), (48.742, 3.427), (48.797, 3.447),
+            ],
+        ],
+    ],
+    "52": [
+        [
+            [
+                (48.600, 4.418), (48.579, 4.621), (48.590, 4.646), (48.727, 4.701),
+                (48.744, 4.712), (48.709, 4.834), (48.727, 4.898), (48.705, 4.927),
+                (48.677, 4.942), (48.680, 4.985), (48.657, 5.013), (48.630, 4.988),
+                (48.602, 5.069), (48.553, 5.133), (48.551, 5.181), (48.558, 5.191),
+                (48.549, 5.226), (48.510, 5.250), (48.499, 5.272), (48.502, 5.329),
+                (48.490, 5.332), (48.477, 5.362), (48.477, 5.388), (48.440, 5.374),
+                (48.429, 5.437), (48.396, 5.456), (48.377, 5.522), (48.333, 5.520),
+                (48.294, 5.550), (48.288, 5.672), (48.280, 5.763), (48.174, 5.749),
+                (48.148, 5.757), (48.081, 5.695), (48.032, 5.749), (48.007, 5.797),
+                (48.010, 5.883), (48.018, 5.923), (47.934, 6.065), (47.928, 6.064),
+                (47.866, 5.845), (47.807, 5.809), (47.756, 5.804), (47.721, 5.828),
+                (47.636, 5.808), (47.626, 5.654), (47.622, 5.635), (47.641, 5.596),
+                (47.662, 5.524), (47.654, 5.462), (47.644, 5.431), (47.629, 5.416),
+                (47.511, 5.409), (47.510, 5.324), (47.502, 5.283), (47.516, 5.258),
+                (47.631, 5.185), (47.636, 5.146), (47.601, 5.073), (47.599, 5.021),
+                (47.586, 4.947), (47.542, 4.847), (47.533, 4.774), (47.540, 4.763),
+                (47.676, 4.662), (47.710, 4.692), (47.818, 4.748), (47.924, 4.687),
+                (47.946, 4.628), (48.096, 4.557), (48.135, 4.584), (48.142, 4.648),
+                (48.122, 4.697), (48.107, 4.801), (48.122, 4.815), (48.177, 4.748),
+                (48.199, 4.779), (48.244, 4.773), (48.289, 4.742), (48.308, 4.713),
+                (48.317, 4.624), (48.422, 4.633), (48.443, 4.409), (48.505, 4.342),
+                (48.552, 4.358),
+            ],
+        ],
+    ],
+    "53": [
+        [
+            [
+                (48.503, -1.078), (48.545, -0.976), (48.468, -0.872), (48.494, -0.757),
+                (48.451, -0.717), (48.445, -0.581), (48.477, -0.551), (48.487, -0.477),
+                (48.452, -0.411), (48.493, -0.302), (48.585, -0.136), (48.582, -0.111),
+                (48.448, -0.123), (48.405, -0.027), (48.367, -0.007), (48.356, -0.008),
+                (48.304, -0.112), (48.278, -0.116), (48.217, -0.246), (48.185, -0.266),
+                (48.098, -0.249), (48.080, -0.271), (48.061, -0.317), (47.994, -0.360),
+                (47.962, -0.435), (47.860, -0.487), (47.849, -0.557), (47.768, -0.610),
+                (47.716, -0.677), (47.712, -0.740), (47.778, -0.873), (47.788, -0.884),
+                (47.779, -0.958), (47.755, -0.992), (47.748, -1.052), (47.767, -1.105),
+                (47.766, -1.121), (47.806, -1.221), (47.850, -1.212), (47.880, -1.153),
+                (47.902, -1.147), (47.967, -1.113), (47.964, -1.013), (48.000, -0.960),
+                (48.071, -1.004), (48.076, -1.066), (48.186, -1.103), (48.234, -1.106),
+                (48.294, -1.026), (48.403, -1.064), (48.414, -1.056), (48.436, -1.081),
+            ],
+        ],
+    ],
+    "54": [
+        [
+            [
+                (49.001, 5.887), (49.016, 5.996), (48.977, 6.117), (48.942, 6.151),
+                (48.948, 6.212), (48.876, 6.382), (48.846, 6.368), (48.781, 6.431),
+                (48.728, 6.455), (48.692, 6.661), (48.655, 6.742), (48.677, 6.790),
+                (48.613, 7.017), (48.531, 7.082), (48.494, 7.054), (48.446, 6.931),
+                (48.459, 6.828), (48.392, 6.777), (48.382, 6.763), (48.400, 6.679),
+                (48.433, 6.608), (48.391, 6.500), (48.420, 6.429), (48.403, 6.268),
+                (48.399, 6.201), (48.403, 6.193), (48.374, 5.930), (48.372, 5.926),
+                (48.416, 5.844), (48.497, 5.798), (48.537, 5.797), (48.569, 5.767),
+                (48.616, 5.776), (48.641, 5.762), (48.660, 5.735), (48.757, 5.749),
+                (48.784, 5.847), (48.833, 5.889), (48.917, 5.885), (48.947, 5.896),
+            ],
+        ],
+        [
+            [
+                (49.521, 5.556), (49.514, 5.602), (49.536, 5.620), (49.544, 5.645),
+                (49.531, 5.710), (49.548, 5.757), (49.538, 5.791), (49.511, 5.822),
+                (49.492, 5.865), (49.482, 5.928), (49.473, 5.942), (49.444, 5.952),
+                (49.402, 5.902), (49.397, 5.912), (49.355, 5.933), (49.352, 5.949),
+                (49.325, 5.978), (49.302, 5.974), (49.281, 6.006), (49.263, 6.001),
+                (49.229, 6.051), (49.224, 6.008), (49.208, 6.004), (49.193, 5.973),
+                (49.166, 6.005), (49.109, 6.000), (49.070, 5.890), (49.096, 5.872),
+                (49.123, 5.832), (49.141, 5.794), (49.167, 5.777), (49.199, 5.779),
+                (49.222, 5.791), (49.238, 5.759), (49.301, 5.761), (49.339, 5.723),
+                (49.384, 5.709), (49.409, 5.659), (49.430, 5.658), (49.425, 5.570),
+                (49.467, 5.517),
+            ],
+        ],
+    ],
+    "55": [
+        [
+            [
+                (48.727, 4.898), (48.756, 4.915), (48.793, 4.924), (48.795, 4.907),
+                (48.775, 4.875), (48.812, 4.833), (48.846, 4.772), (48.872, 4.669),
+                (48.959, 4.724), (48.990, 4.735), (49.001, 4.889), (49.016, 4.922),
+                (49.092, 4.946), (49.105, 4.941), (49.139, 4.901), (49.182, 4.732),
+                (49.235, 4.713), (49.337, 4.849), (49.355, 4.860), (49.449, 4.888),
+                (49.529, 4.843), (49.552, 4.873), (49.566, 4.914), (49.572, 5.053),
+                (49.610, 5.127), (49.591, 5.160), (49.588, 5.224), (49.594, 5.252),
+                (49.631, 5.282), (49.666, 5.295), (49.648, 5.306), (49.641, 5.294),
+                (49.613, 5.298), (49.613, 5.322), (49.626, 5.335), (49.613, 5.383),
+                (49.602, 5.402), (49.546, 5.450), (49.508, 5.450), (49.495, 5.478),
+                (49.518, 5.529), (49.521, 5.556), (49.467, 5.517), (49.425, 5.570),
+                (49.430, 5.658), (49.409, 5.659), (49.384, 5.709), (49.339, 5.723),
+                (49.301, 5.761), (49.238, 5.759), (49.222, 5.791), (49.199, 5.779),
+                (49.167, 5.777), (49.141, 5.794), (49.123, 5.832), (49.096, 5.872),
+                (49.070, 5.890), (49.041, 5.879), (49.001, 5.887), (48.947, 5.896),
+                (48.917, 5.885), (48.833, 5.889), (48.784, 5.847), (48.757, 5.749),
+                (48.660, 5.735), (48.641, 5.762), (48.616, 5.776), (48.569, 5.767),
+                (48.537, 5.797), (48.497, 5.798), (48.416, 5.844), (48.415, 5.669),
+                (48.383, 5.606), (48.377, 5.522), (48.396, 5.456), (48.429, 5.437),
+                (48.440, 5.374), (48.477, 5.388), (48.477, 5.362), (48.490, 5.332),
+                (48.502, 5.329), (48.499, 5.272), (48.510, 5.250), (48.549, 5.226),
+                (48.558, 5.191), (48.551, 5.181), (48.553, 5.133), (48.602, 5.069),
+                (48.630, 4.988), (48.657, 5.013), (48.680, 4.985), (48.677, 4.942),
+                (48.705, 4.927),
+            ],
+        ],
+    ],
+    "56": [
+        [
+            [
+                (48.199, -3.517), (48.179, -3.483), (48.188, -3.341), (48.164, -3.278),
+                (48.161, -3.242), (48.147, -3.185), (48.196, -3.087), (48.164, -3.030),
+                (48.164, -2.975), (48.146, -2.900), (48.164, -2.808), (48.124, -2.737),
+                (48.135, -2.669), (48.058, -2.621), (48.061, -2.503), (48.075, -2.493),
+                (48.143, -2.536), (48.194, -2.506), (48.134, -2.357), (48.151, -2.327),
+                (48.075, -2.199), (48.019, -2.265), (47.994, -2.238), (47.996, -2.142),
+                (47.953, -2.105), (47.932, -2.054), (47.858, -2.066), (47.837, -2.043),
+                (47.791, -2.114), (47.739, -2.092), (47.730, -2.111), (47.696, -2.108),
+                (47.677, -2.070), (47.652, -2.111), (47.626, -2.090), (47.609, -2.086),
+                (47.587, -2.120), (47.511, -2.110), (47.515, -2.214), (47.499, -2.229),
+                (47.454, -2.363), (47.473, -2.408), (47.447, -2.443), (47.459, -2.489),
+                (47.498, -2.484), (47.500, -2.421), (47.506, -2.425), (47.527, -2.502),
+                (47.520, -2.563), (47.520, -2.632), (47.529, -2.599), (47.544, -2.592),
+                (47.540, -2.638), (47.527, -2.618), (47.534, -2.666), (47.510, -2.667),
+                (47.504, -2.681), (47.512, -2.731), (47.499, -2.783), (47.499, -2.817),
+                (47.512, -2.844), (47.542, -2.869), (47.558, -2.909), (47.567, -2.865),
+                (47.547, -2.851), (47.547, -2.816), (47.568, -2.810), (47.555, -2.794),
+                (47.551, -2.741), (47.604, -2.689), (47.630, -2.697), (47.602, -2.709),
+                (47.629, -2.775), (47.622, -2.734), (47.639, -2.758), (47.630, -2.796),
+                (47.626, -2.848), (47.607, -2.867), (47.596, -2.919), (47.609, -2.913),
+                (47.602, -2.940), (47.624, -2.945), (47.637, -2.933), (47.642, -2.958),
+                (47.664, -2.975), (47.613, -2.967), (47.574, -2.933), (47.561, -2.940),
+                (47.596, -2.994), (47.579, -3.003), (47.607, -3.012), (47.581, -3.016),
+                (47.588, -3.042), (47.576, -3.074), (47.599, -3.112), (47.548, -3.129),
+                (47.519, -3.123), (47.478, -3.085), (47.478, -3.132), (47.507, -3.144),
+                (47.544, -3.134), (47.598, -3.141), (47.622, -3.166), (47.633, -3.197),
+                (47.681, -3.186), (47.704, -3.111), (47.732, -3.118), (47.725, -3.139),
+                (47.753, -3.139), (47.742, -3.153), (47.746, -3.193), (47.735, -3.170),
+                (47.711, -3.159), (47.697, -3.207), (47.684, -3.193), (47.656, -3.224),
+                (47.684, -3.262), (47.708, -3.316), (47.711, -3.358), (47.739, -3.341),
+                (47.739, -3.317), (47.787, -3.283), (47.753, -3.332), (47.737, -3.383),
+                (47.718, -3.364), (47.705, -3.446), (47.708, -3.461), (47.739, -3.495),
+                (47.780, -3.528), (47.775, -3.560), (47.799, -3.538), (47.824, -3.536),
+                (47.830, -3.520), (47.821, -3.476), (47.830, -3.441), (47.869, -3.426),
+                (47.894, -3.383), (47.943, -3.396), (47.949, -3.464), (47.988, -3.488),
+                (47.972, -3.625), (47.984, -3.637), (48.111, -3.714), (48.116, -3.726),
+                (48.187, -3.642), (48.206, -3.577),
+            ],
+        ],
+        [
+            [
+                (47.297, -3.094), (47.302, -3.172), (47.321, -3.241), (47.336, -3.238),
+                (47.383, -3.262), (47.395, -3.250), (47.371, -3.177), (47.331, -3.115),
+                (47.328, -3.073), (47.302, -3.067),
+            ],
+        ],
+    ],
+    "57": [
+        [
+            [
+                (49.473, 5.942), (49.441, 5.961), (49.448, 6.063), (49.465, 6.100),
+                (49.495, 6.136), (49.499, 6.194), (49.490, 6.249), (49.457, 6.325),
+                (49.456, 6.364), (49.465, 6.403), (49.436, 6.495), (49.425, 6.512),
+                (49.395, 6.526), (49.362, 6.574), (49.348, 6.573), (49.338, 6.550),
+                (49.313, 6.573), (49.271, 6.640), (49.257, 6.639), (49.244, 6.664),
+                (49.207, 6.681), (49.214, 6.703), (49.173, 6.701), (49.156, 6.726),
+                (49.155, 6.770), (49.146, 6.809), (49.163, 6.839), (49.196, 6.828),
+                (49.209, 6.833), (49.206, 6.925), (49.182, 6.988), (49.182, 7.009),
+                (49.146, 7.009), (49.119, 7.021), (49.108, 7.043), (49.120, 7.073),
+                (49.142, 7.085), (49.114, 7.155), (49.114, 7.241), (49.106, 7.268),
+                (49.128, 7.297), (49.132, 7.326), (49.159, 7.351), (49.170, 7.391),
+                (49.158, 7.415), (49.152, 7.476), (49.128, 7.471), (49.084, 7.521),
+                (49.075, 7.543), (49.065, 7.599), (49.032, 7.566), (48.984, 7.502),
+                (48.975, 7.499), (48.948, 7.412), (48.948, 7.374), (48.899, 7.282),
+                (48.905, 7.274), (48.955, 7.260), (48.985, 7.233), (48.993, 7.207),
+                (49.035, 7.173), (49.051, 7.110), (49.043, 7.070), (49.009, 7.055),
+                (48.992, 7.067), (48.973, 6.984), (48.884, 6.889), (48.839, 6.919),
+                (48.832, 7.022), (48.836, 7.072), (48.802, 7.174), (48.841, 7.295),
+                (48.796, 7.325), (48.774, 7.321), (48.707, 7.285), (48.683, 7.303),
+                (48.580, 7.223), (48.575, 7.194), (48.531, 7.082), (48.613, 7.017),
+                (48.677, 6.790), (48.655, 6.742), (48.692, 6.661), (48.728, 6.455),
+                (48.781, 6.431), (48.846, 6.368), (48.876, 6.382), (48.948, 6.212),
+                (48.942, 6.151), (48.977, 6.117), (49.016, 5.996), (49.001, 5.887),
+                (49.041, 5.879), (49.070, 5.890), (49.109, 6.000), (49.166, 6.005),
+                (49.193, 5.973), (49.208, 6.004), (49.224, 6.008), (49.229, 6.051),
+                (49.263, 6.001), (49.281, 6.006), (49.302, 5.974), (49.325, 5.978),
+                (49.352, 5.949), (49.355, 5.933), (49.397, 5.912), (49.402, 5.902),
+                (49.444, 5.952),
+            ],
+        ],
+    ],
+    "58": [
+        [
+            [
+                (47.530, 2.839), (47.596, 2.959), (47.584, 2.975), (47.588, 3.272),
+                (47.564, 3.319), (47.604, 3.505), (47.597, 3.558), (47.523, 3.706),
+                (47.420, 3.723), (47.355, 4.026), (47.214, 4.019), (47.107, 4.182),
+                (46.992, 4.105), (46.932, 4.005), (46.787, 4.110), (46.691, 3.993),
+                (46.675, 3.925), (46.759, 3.777), (46.732, 3.667), (46.648, 3.574),
+                (46.643, 3.415), (46.653, 3.406), (46.690, 3.261), (46.639, 3.169),
+                (46.681, 3.062), (46.716, 3.061), (46.787, 3.008), (46.855, 3.038),
+                (46.879, 3.026), (46.916, 3.089), (46.946, 3.097), (46.995, 3.049),
+                (47.037, 3.063), (47.103, 3.021), (47.114, 3.005), (47.125, 2.901),
+                (47.250, 3.041), (47.251, 2.850), (47.324, 2.909), (47.346, 2.931),
+                (47.377, 2.878), (47.448, 2.916), (47.479, 2.984), (47.484, 2.981),
+                (47.494, 2.892),
+            ],
+        ],
+    ],
+    "59": [
+        [
+            [
+                (51.014, 2.057), (51.020, 2.134), (51.060, 2.324), (51.055, 2.384),
+                (51.069, 2.466), (51.088, 2.522), (51.065, 2.537), (51.001, 2.557),
+                (50.961, 2.608), (50.941, 2.612), (50.912, 2.577), (50.868, 2.597),
+                (50.842, 2.590), (50.816, 2.620), (50.809, 2.692), (50.789, 2.707),
+                (50.766, 2.744), (50.733, 2.768), (50.723, 2.787), (50.699, 2.871),
+                (50.703, 2.900), (50.736, 2.930), (50.758, 2.971), (50.784, 3.103),
+                (50.769, 3.146), (50.709, 3.197), (50.705, 3.224), (50.672, 3.244),
+                (50.655, 3.230), (50.626, 3.238), (50.570, 3.264), (50.527, 3.271),
+                (50.507, 3.300), (50.493, 3.344), (50.492, 3.385), (50.502, 3.429),
+                (50.519, 3.463), (50.517, 3.491), (50.493, 3.487), (50.487, 3.499),
+                (50.487, 3.564), (50.477, 3.608), (50.446, 3.644), (50.407, 3.653),
+                (50.360, 3.653), (50.319, 3.662), (50.298, 3.697), (50.343, 3.742),
+                (50.348, 3.799), (50.345, 3.840), (50.325, 3.896), (50.325, 3.919),
+                (50.343, 3.982), (50.338, 4.023), (50.315, 4.056), (50.295, 4.098),
+                (50.257, 4.125), (50.252, 4.144), (50.273, 4.163), (50.252, 4.204),
+                (50.242, 4.201), (50.213, 4.157), (50.146, 4.128), (50.128, 4.126),
+                (50.127, 4.181), (50.060, 4.210), (50.031, 4.145), (50.018, 4.132),
+                (49.975, 4.140), (49.965, 4.162), (49.954, 4.112), (49.963, 4.034),
+                (49.954, 4.004), (49.981, 3.974), (50.055, 3.950), (50.061, 3.918),
+                (50.038, 3.860), (50.074, 3.761), (50.069, 3.734), (50.067, 3.650),
+                (50.076, 3.629), (50.068, 3.610), (50.006, 3.528), (50.001, 3.526),
+                (50.015, 3.431), (50.001, 3.382), (50.023, 3.362), (50.007, 3.221),
+                (50.035, 3.209), (50.021, 3.045), (50.043, 3.025), (50.103, 3.110),
+                (50.130, 3.105), (50.137, 3.119), (50.180, 3.140), (50.206, 3.134),
+                (50.224, 3.167), (50.271, 3.134), (50.261, 3.099), (50.275, 3.073),
+                (50.217, 2.982), (50.240, 2.958), (50.292, 2.994), (50.302, 3.013),
+                (50.295, 3.044), (50.314, 3.076), (50.358, 3.030), (50.372, 2.987),
+                (50.405, 3.034), (50.424, 3.036), (50.423, 3.075), (50.457, 3.085),
+                (50.458, 3.061), (50.444, 3.048), (50.448, 3.008), (50.469, 3.031),
+                (50.500, 3.019), (50.491, 2.988), (50.514, 2.955), (50.496, 2.926),
+                (50.508, 2.880), (50.536, 2.881), (50.519, 2.845), (50.519, 2.812),
+                (50.527, 2.788), (50.551, 2.809), (50.578, 2.815), (50.599, 2.783),
+                (50.624, 2.814), (50.622, 2.852), (50.660, 2.854), (50.677, 2.802),
+                (50.682, 2.755), (50.666, 2.739), (50.643, 2.754), (50.609, 2.727),
+                (50.641, 2.684), (50.636, 2.653), (50.662, 2.616), (50.665, 2.596),
+                (50.628, 2.577), (50.632, 2.509), (50.643, 2.495), (50.656, 2.442),
+                (50.664, 2.435), (50.666, 2.384), (50.707, 2.381), (50.733, 2.336),
+                (50.788, 2.347), (50.809, 2.301), (50.805, 2.285), (50.818, 2.186),
+                (50.832, 2.172), (50.886, 2.219), (50.900, 2.208), (50.926, 2.162),
+                (50.964, 2.158), (50.967, 2.089),
+            ],
+        ],
+    ],
+    "60": [
+        [
+            [
+                (49.219, 1.813), (49.320, 1.794), (49.316, 1.753), (49.358, 1.672),
+                (49.402, 1.644), (49.405, 1.664), (49.499, 1.808), (49.566, 1.735),
+                (49.567, 1.666), (49.716, 1.678), (49.705, 1.792), (49.730, 1.863),
+                (49.739, 1.874), (49.711, 2.040), (49.683, 2.061), (49.657, 2.176),
+                (49.713, 2.263), (49.669, 2.429), (49.657, 2.431), (49.619, 2.467),
+                (49.600, 2.538), (49.615, 2.686), (49.637, 2.715), (49.692, 2.740),
+                (49.697, 2.756), (49.669, 2.902), (49.676, 2.961), (49.699, 3.020),
+                (49.696, 3.112), (49.662, 3.141), (49.604, 3.102), (49.579, 3.103),
+                (49.561, 3.085), (49.461, 3.090), (49.361, 3.073), (49.331, 3.087),
+                (49.292, 3.019), (49.200, 3.051), (49.194, 3.045), (49.111, 3.173),
+                (49.116, 3.007), (49.086, 2.973), (49.080, 2.930), (49.108, 2.894),
+                (49.108, 2.862), (49.091, 2.810), (49.088, 2.784), (49.048, 2.752),
+                (49.063, 2.720), (49.085, 2.708), (49.096, 2.635), (49.085, 2.600),
+                (49.105, 2.563), (49.116, 2.560), (49.113, 2.472), (49.143, 2.442),
+                (49.155, 2.401), (49.151, 2.349), (49.186, 2.327), (49.153, 2.252),
+                (49.160, 2.201), (49.173, 2.161), (49.146, 2.078), (49.185, 2.043),
+                (49.207, 1.998), (49.227, 1.974), (49.201, 1.859),
+            ],
+        ],
+    ],
+    "61": [
+        [
+            [
+                (48.494, -0.757), (48.524, -0.746), (48.538, -0.753), (48.647, -0.735),
+                (48.680, -0.825), (48.755, -0.833), (48.804, -0.791), (48.817, -0.774),
+                (48.812, -0.714), (48.797, -0.665), (48.815, -0.615), (48.872, -0.494),
+                (48.837, -0.439), (48.812, -0.367), (48.850, -0.293), (48.834, -0.247),
+                (48.832, -0.098), (48.913, -0.060), (48.916, 0.082), (48.945, 0.103),
+                (48.969, 0.183), (48.946, 0.330), (48.910, 0.361), (48.931, 0.461),
+                (48.920, 0.574), (48.896, 0.616), (48.848, 0.606), (48.772, 0.733),
+                (48.688, 0.720), (48.655, 0.788), (48.655, 0.817), (48.629, 0.904),
+                (48.525, 0.921), (48.510, 0.912), (48.396, 0.991), (48.385, 0.963),
+                (48.384, 0.932), (48.355, 0.862), (48.371, 0.768), (48.360, 0.729),
+                (48.277, 0.776), (48.254, 0.840), (48.143, 0.790), (48.207, 0.701),
+                (48.238, 0.674), (48.256, 0.587), (48.292, 0.580), (48.340, 0.475),
+                (48.439, 0.450), (48.464, 0.398), (48.543, 0.351), (48.522, 0.233),
+                (48.490, 0.196), (48.450, 0.174), (48.443, 0.129), (48.415, 0.086),
+                (48.383, 0.015), (48.367, -0.007), (48.405, -0.027), (48.448, -0.123),
+                (48.582, -0.111), (48.585, -0.136), (48.493, -0.302), (48.452, -0.411),
+                (48.487, -0.477), (48.477, -0.551), (48.445, -0.581), (48.451, -0.717),
+            ],
+        ],
+    ],
+    "62": [
+        [
+            [
+                (50.372, 1.569), (50.377, 1.610), (50.405, 1.555), (50.445, 1.573),
+                (50.533, 1.579), (50.548, 1.610), (50.575, 1.583), (50.678, 1.563),
+                (50.717, 1.568), (50.790, 1.606), (50.869, 1.581), (50.881, 1.605),
+                (50.889, 1.653), (50.944, 1.730), (50.997, 1.921), (50.994, 1.939),
+                (51.007, 1.973), (51.014, 2.057), (50.967, 2.089), (50.964, 2.158),
+                (50.926, 2.162), (50.900, 2.208), (50.886, 2.219), (50.832, 2.172),
+                (50.818, 2.186), (50.805, 2.285), (50.809, 2.301), (50.788, 2.347),
+                (50.733, 2.336), (50.707, 2.381), (50.666, 2.384), (50.664, 2.435),
+                (50.656, 2.442), (50.643, 2.495), (50.632, 2.509), (50.628, 2.577),
+                (50.665, 2.596), (50.662, 2.616), (50.636, 2.653), (50.641, 2.684),
+                (50.609, 2.727), (50.643, 2.754), (50.666, 2.739), (50.682, 2.755),
+                (50.677, 2.802), (50.660, 2.854), (50.622, 2.852), (50.624, 2.814),
+                (50.599, 2.783), (50.578, 2.815), (50.551, 2.809), (50.527, 2.788),
+                (50.519, 2.812), (50.519, 2.845), (50.536, 2.881), (50.508, 2.880),
+                (50.496, 2.926), (50.514, 2.955), (50.491, 2.988), (50.500, 3.019),
+                (50.469, 3.031), (50.448, 3.008), (50.444, 3.048), (50.458, 3.061),
+                (50.457, 3.085), (50.423, 3.075), (50.424, 3.036), (50.405, 3.034),
+                (50.372, 2.987), (50.358, 3.030), (50.314, 3.076), (50.295, 3.044),
+                (50.302, 3.013), (50.292, 2.994), (50.240, 2.958), (50.217, 2.982),
+                (50.275, 3.073), (50.261, 3.099), (50.271, 3.134), (50.224, 3.167),
+                (50.206, 3.134), (50.180, 3.140), (50.137, 3.119), (50.130, 3.105),
+                (50.103, 3.110), (50.043, 3.025), (50.066, 2.949), (50.007, 2.824),
+                (50.023, 2.783), (50.046, 2.757), (50.061, 2.726), (50.095, 2.558),
+                (50.153, 2.537), (50.168, 2.501), (50.237, 2.409), (50.200, 2.235),
+                (50.202, 2.230), (50.163, 2.055), (50.213, 1.993), (50.284, 2.006),
+                (50.325, 1.923), (50.323, 1.788), (50.352, 1.759), (50.357, 1.673),
+                (50.348, 1.611),
+            ],
+        ],
+    ],
+    "63": [
+        [
+            [
+                (45.529, 2.459), (45.638, 2.391), (45.801, 2.495), (45.829, 2.487),
+                (45.878, 2.587), (45.982, 2.660), (45.998, 2.660), (46.105, 2.565),
+                (46.180, 2.614), (46.180, 2.709), (46.205, 2.766), (46.229, 2.801),
+                (46.250, 2.863), (46.221, 2.943), (46.154, 2.966), (46.089, 2.942),
+                (46.063, 2.959), (46.048, 2.993), (46.048, 3.109), (46.060, 3.128),
+                (46.063, 3.276), (46.056, 3.281), (46.048, 3.349), (46.080, 3.408),
+                (46.066, 3.427), (46.012, 3.446), (46.017, 3.568), (45.983, 3.612),
+                (45.973, 3.661), (45.978, 3.727), (45.874, 3.781), (45.830, 3.694),
+                (45.784, 3.662), (45.771, 3.662), (45.719, 3.691), (45.714, 3.814),
+                (45.643, 3.894), (45.511, 3.909), (45.500, 3.890), (45.444, 3.842),
+                (45.406, 3.834), (45.362, 3.772), (45.331, 3.578), (45.337, 3.568),
+                (45.391, 3.527), (45.378, 3.467), (45.389, 3.356), (45.429, 3.292),
+                (45.369, 3.074), (45.373, 3.040), (45.373, 2.964), (45.459, 2.782),
+                (45.464, 2.723), (45.494, 2.667), (45.527, 2.592),
+            ],
+        ],
+    ],
+    "64": [
+        [
+            [
+                (43.441, -0.142), (43.410, -0.116), (43.365, -0.105), (43.347, -0.077),
+                (43.265, -0.008), (43.217, -0.043), (43.213, -0.075), (43.145, -0.075),
+                (43.134, -0.102), (43.144, -0.140), (43.100, -0.208), (43.034, -0.281),
+                (43.015, -0.264), (42.954, -0.259), (42.827, -0.349), (42.791, -0.424),
+                (42.789, -0.454), (42.807, -0.508), (42.808, -0.534), (42.784, -0.536),
+                (42.777, -0.579), (42.796, -0.583), (42.799, -0.610), (42.811, -0.609),
+                (42.850, -0.648), (42.876, -0.700), (42.878, -0.730), (42.894, -0.746),
+                (42.911, -0.741), (42.947, -0.760), (42.953, -0.786), (42.943, -0.864),
+                (42.948, -0.943), (42.957, -0.981), (42.987, -1.028), (42.993, -1.080),
+                (43.008, -1.112), (43.006, -1.150), (43.039, -1.217), (43.047, -1.275),
+                (43.069, -1.311), (43.083, -1.315), (43.109, -1.286), (43.114, -1.309),
+                (43.093, -1.348), (43.047, -1.358), (43.029, -1.383), (43.036, -1.435),
+                (43.060, -1.475), (43.082, -1.488), (43.135, -1.426), (43.207, -1.400),
+                (43.243, -1.404), (43.265, -1.432), (43.261, -1.466), (43.277, -1.508),
+                (43.284, -1.559), (43.277, -1.574), (43.252, -1.588), (43.247, -1.622),
+                (43.256, -1.639), (43.292, -1.645), (43.304, -1.674), (43.291, -1.747),
+                (43.319, -1.756), (43.341, -1.797), (43.386, -1.794), (43.376, -1.776),
+                (43.389, -1.750), (43.400, -1.661), (43.424, -1.638), (43.443, -1.597),
+                (43.493, -1.562), (43.539, -1.514), (43.531, -1.426), (43.513, -1.418),
+                (43.512, -1.368), (43.537, -1.290), (43.529, -1.233), (43.537, -1.205),
+                (43.527, -1.187), (43.501, -1.049), (43.483, -1.032), (43.505, -0.972),
+                (43.545, -0.943), (43.563, -0.834), (43.548, -0.820), (43.530, -0.672),
+                (43.563, -0.613), (43.562, -0.577), (43.521, -0.440), (43.632, -0.355),
+                (43.624, -0.219), (43.485, -0.288), (43.444, -0.172),
+            ],
+        ],
+    ],
+    "65": [
+        [
+            [
+                (42.684, 0.433), (42.685, 0.389), (42.717, 0.354), (42.713, 0.336),
+                (42.670, 0.290), (42.669, 0.275), (42.710, 0.238), (42.726, 0.169),
+                (42.715, 0.134), (42.708, 0.073), (42.688, -0.004), (42.685, -0.039),
+                (42.697, -0.078), (42.717, -0.119), (42.746, -0.146), (42.778, -0.164),
+                (42.795, -0.161), (42.784, -0.208), (42.786, -0.235), (42.805, -0.247),
+                (42.843, -0.323), (42.827, -0.349), (42.954, -0.259), (43.015, -0.264),
+                (43.034, -0.281), (43.100, -0.208), (43.144, -0.140), (43.134, -0.102),
+                (43.145, -0.075), (43.213, -0.075), (43.217, -0.043), (43.265, -0.008),
+                (43.347, -0.077), (43.365, -0.105), (43.410, -0.116), (43.441, -0.142),
+                (43.541, -0.079), (43.536, 0.061), (43.456, 0.135), (43.454, 0.204),
+                (43.359, 0.258), (43.412, 0.443), (43.339, 0.514), (43.234, 0.488),
+                (43.208, 0.522), (43.104, 0.474), (43.048, 0.476), (42.937, 0.464),
+                (42.928, 0.483),
+            ],
+        ],
+    ],
+    "66": [
+        [
+            [
+                (42.690, 2.113), (42.686, 2.139), (42.751, 2.303), (42.844, 2.343),
+                (42.997, 2.515), (42.955, 2.665), (42.955, 2.694), (42.942, 2.772),
+                (42.942, 2.807), (42.916, 2.910), (42.848, 3.007), (42.850, 3.048),
+                (42.750, 3.039), (42.725, 3.043), (42.683, 3.038), (42.555, 3.052),
+                (42.542, 3.066), (42.525, 3.137), (42.492, 3.143), (42.456, 3.176),
+                (42.431, 3.181), (42.425, 3.112), (42.432, 3.066), (42.466, 3.030),
+                (42.469, 2.983), (42.461, 2.966), (42.470, 2.934), (42.451, 2.901),
+                (42.448, 2.851), (42.420, 2.805), (42.410, 2.768), (42.414, 2.729),
+                (42.406, 2.690), (42.373, 2.640), (42.339, 2.662), (42.341, 2.613),
+                (42.352, 2.548), (42.326, 2.525), (42.341, 2.465), (42.368, 2.430),
+                (42.384, 2.423), (42.389, 2.375), (42.410, 2.317), (42.429, 2.277),
+                (42.426, 2.246), (42.412, 2.184), (42.416, 2.137), (42.411, 2.121),
+                (42.385, 2.104), (42.352, 2.052), (42.349, 1.996), (42.367, 1.964),
+                (42.420, 1.941), (42.437, 1.927), (42.447, 1.870), (42.482, 1.793),
+                (42.488, 1.731), (42.503, 1.707), (42.547, 1.721), (42.568, 1.839),
+            ],
+            [
+                (42.444, 1.999), (42.486, 1.968), (42.464, 1.946), (42.444, 1.961),
+            ],
+        ],
+    ],
+    "67": [
+        [
+            [
+                (48.531, 7.082), (48.575, 7.194), (48.580, 7.223), (48.683, 7.303),
+                (48.707, 7.285), (48.774, 7.321), (48.796, 7.325), (48.841, 7.295),
+                (48.802, 7.174), (48.836, 7.072), (48.832, 7.022), (48.839, 6.919),
+                (48.884, 6.889), (48.973, 6.984), (48.992, 7.067), (49.009, 7.055),
+                (49.043, 7.070), (49.051, 7.110), (49.035, 7.173), (48.993, 7.207),
+                (48.985, 7.233), (48.955, 7.260), (48.905, 7.274), (48.899, 7.282),
+                (48.948, 7.374), (48.948, 7.412), (48.975, 7.499), (48.984, 7.502),
+                (49.032, 7.566), (49.065, 7.599), (49.043, 7.626), (49.036, 7.649),
+                (49.043, 7.685), (49.036, 7.727), (49.048, 7.774), (49.032, 7.857),
+                (49.035, 7.932), (48.979, 8.090), (48.966, 8.189), (48.959, 8.200),
+                (48.943, 8.179), (48.904, 8.148), (48.821, 8.103), (48.804, 8.084),
+                (48.780, 8.027), (48.765, 8.023), (48.757, 7.970), (48.729, 7.964),
+                (48.712, 7.948), (48.668, 7.881), (48.659, 7.852), (48.615, 7.810),
+                (48.582, 7.802), (48.548, 7.802), (48.519, 7.813), (48.498, 7.776),
+                (48.470, 7.769), (48.444, 7.751), (48.407, 7.738), (48.355, 7.752),
+                (48.327, 7.737), (48.311, 7.702), (48.270, 7.693), (48.238, 7.677),
+                (48.179, 7.613), (48.153, 7.605), (48.119, 7.581), (48.121, 7.540),
+                (48.176, 7.470), (48.187, 7.474), (48.215, 7.454), (48.222, 7.406),
+                (48.244, 7.333), (48.301, 7.342), (48.315, 7.238), (48.356, 7.144),
+                (48.356, 7.133), (48.494, 7.054),
+            ],
+        ],
+    ],
+    "68": [
+        [
+            [
+                (47.806, 6.886), (47.837, 6.921), (47.879, 6.921), (47.929, 6.890),
+                (47.957, 6.903), (48.002, 6.968), (48.015, 6.967), (48.057, 7.011),
+                (48.105, 7.023), (48.124, 7.073), (48.144, 7.086), (48.190, 7.098),
+                (48.206, 7.126), (48.348, 7.122), (48.356, 7.133), (48.356, 7.144),
+                (48.315, 7.238), (48.301, 7.342), (48.244, 7.333), (48.222, 7.406),
+                (48.215, 7.454), (48.187, 7.474), (48.176, 7.470), (48.121, 7.540),
+                (48.119, 7.581), (48.095, 7.573), (48.054, 7.576), (48.003, 7.619),
+                (47.971, 7.621), (47.940, 7.585), (47.911, 7.581), (47.879, 7.558),
+                (47.839, 7.562), (47.829, 7.543), (47.783, 7.526), (47.732, 7.538),
+                (47.707, 7.512), (47.670, 7.522), (47.652, 7.550), (47.608, 7.590),
+                (47.585, 7.586), (47.566, 7.526), (47.542, 7.483), (47.533, 7.505),
+                (47.517, 7.501), (47.515, 7.477), (47.491, 7.483), (47.482, 7.467),
+                (47.493, 7.426), (47.484, 7.414), (47.456, 7.426), (47.438, 7.406),
+                (47.431, 7.379), (47.433, 7.309), (47.418, 7.245), (47.444, 7.168),
+                (47.460, 7.163), (47.488, 7.181), (47.486, 7.154), (47.496, 7.104),
+                (47.494, 7.082), (47.559, 7.100), (47.571, 7.077), (47.679, 7.038),
+                (47.682, 7.042), (47.747, 7.009), (47.758, 6.975), (47.766, 6.900),
+            ],
+        ],
+    ],
+    "69": [
+        [
+            [
+                (46.198, 4.472), (46.211, 4.478), (46.248, 4.588), (46.275, 4.618),
+                (46.263, 4.687), (46.249, 4.704), (46.206, 4.727), (46.171, 4.713),
+                (46.150, 4.729), (46.147, 4.760), (46.142, 4.768), (46.097, 4.745),
+                (46.088, 4.729), (46.051, 4.766), (46.039, 4.738), (46.010, 4.733),
+                (46.000, 4.747), (45.972, 4.735), (45.926, 4.749), (45.930, 4.790),
+                (45.897, 4.817), (45.910, 4.860), (45.896, 4.891), (45.854, 4.925),
+                (45.840, 4.913), (45.805, 4.921), (45.790, 5.012), (45.813, 5.047),
+                (45.824, 5.083), (45.811, 5.119), (45.789, 5.073), (45.768, 5.092),
+                (45.736, 5.087), (45.734, 5.129), (45.720, 5.152), (45.691, 5.087),
+                (45.674, 5.091), (45.658, 5.051), (45.631, 5.034), (45.606, 4.938),
+                (45.614, 4.907), (45.602, 4.863), (45.582, 4.843), (45.591, 4.793),
+                (45.568, 4.779), (45.562, 4.818), (45.537, 4.828), (45.555, 4.880),
+                (45.514, 4.893), (45.489, 4.868), (45.491, 4.846), (45.457, 4.806),
+                (45.459, 4.706), (45.477, 4.687), (45.498, 4.709), (45.556, 4.665),
+                (45.554, 4.638), (45.564, 4.615), (45.580, 4.545), (45.576, 4.536),
+                (45.584, 4.445), (45.597, 4.416), (45.665, 4.428), (45.676, 4.417),
+                (45.679, 4.349), (45.706, 4.308), (45.735, 4.314), (45.765, 4.403),
+                (45.815, 4.405), (45.827, 4.420), (45.858, 4.417), (45.913, 4.349),
+                (45.911, 4.328), (45.935, 4.283), (45.967, 4.269), (45.994, 4.278),
+                (46.033, 4.235), (46.072, 4.269), (46.109, 4.250), (46.143, 4.284),
+                (46.132, 4.339), (46.129, 4.443), (46.145, 4.466),
+            ],
+        ],
+    ],
+    "70": [
+        [
+            [
+                (47.511, 5.409), (47.629, 5.416), (47.644, 5.431), (47.654, 5.462),
+                (47.662, 5.524), (47.641, 5.596), (47.622, 5.635), (47.626, 5.654),
+                (47.636, 5.808), (47.721, 5.828), (47.756, 5.804), (47.807, 5.809),
+                (47.866, 5.845), (47.928, 6.064), (47.934, 6.065), (47.942, 6.257),
+                (47.986, 6.360), (47.937, 6.401), (47.923, 6.459), (47.853, 6.533),
+                (47.849, 6.570), (47.828, 6.664), (47.820, 6.756), (47.812, 6.780),
+                (47.737, 6.778), (47.710, 6.789), (47.699, 6.773), (47.660, 6.778),
+                (47.650, 6.806), (47.605, 6.786), (47.588, 6.813), (47.566, 6.805),
+                (47.536, 6.750), (47.535, 6.726), (47.611, 6.644), (47.579, 6.559),
+                (47.503, 6.539), (47.477, 6.494), (47.473, 6.476), (47.566, 6.301),
+                (47.507, 6.206), (47.496, 6.193), (47.424, 6.223), (47.363, 6.138),
+                (47.358, 6.113), (47.395, 5.942), (47.386, 5.935), (47.338, 5.857),
+                (47.270, 5.845), (47.239, 5.805), (47.222, 5.716), (47.234, 5.676),
+                (47.186, 5.529), (47.232, 5.482), (47.256, 5.479), (47.361, 5.514),
+                (47.393, 5.456), (47.504, 5.417),
+            ],
+        ],
+    ],
+    "71": [
+        [
+            [
+                (46.277, 3.893), (46.344, 3.935), (46.376, 3.918), (46.437, 3.985),
+                (46.479, 3.953), (46.522, 3.857), (46.563, 3.872), (46.581, 3.735),
+                (46.732, 3.667), (46.759, 3.777), (46.675, 3.925), (46.691, 3.993),
+                (46.787, 4.110), (46.932, 4.005), (46.992, 4.105), (47.107, 4.182),
+                (47.120, 4.253), (47.053, 4.455), (47.071, 4.633), (46.927, 4.553),
+                (46.899, 4.629), (46.899, 4.667), (46.920, 4.685), (46.919, 4.793),
+                (46.948, 4.792), (46.957, 4.806), (46.966, 4.947), (46.990, 4.973),
+                (47.000, 5.000), (46.916, 5.139), (46.954, 5.233), (46.837, 5.383),
+                (46.816, 5.354), (46.720, 5.348), (46.665, 5.387), (46.636, 5.386),
+                (46.624, 5.360), (46.557, 5.282), (46.517, 5.311), (46.510, 5.499),
+                (46.470, 5.509), (46.431, 5.462), (46.484, 5.317), (46.415, 5.251),
+                (46.438, 5.170), (46.489, 5.155), (46.474, 5.000), (46.494, 4.976),
+                (46.502, 4.937), (46.485, 4.810), (46.402, 4.908), (46.356, 4.866),
+                (46.326, 4.859), (46.294, 4.812), (46.276, 4.808), (46.217, 4.831),
+                (46.214, 4.815), (46.187, 4.776), (46.147, 4.760), (46.150, 4.729),
+                (46.171, 4.713), (46.206, 4.727), (46.249, 4.704), (46.263, 4.687),
+                (46.275, 4.618), (46.248, 4.588), (46.211, 4.478), (46.198, 4.472),
+                (46.181, 4.282), (46.234, 4.251), (46.262, 4.174), (46.227, 4.120),
+                (46.219, 4.096), (46.203, 3.980),
+            ],
+        ],
+    ],
+    "72": [
+        [
+            [
+                (47.860, -0.487), (47.962, -0.435), (47.994, -0.360), (48.061, -0.317),
+                (48.080, -0.271), (48.098, -0.249), (48.185, -0.266), (48.217, -0.246),
+                (48.278, -0.116), (48.304, -0.112), (48.356, -0.008), (48.367, -0.007),
+                (48.383, 0.015), (48.415, 0.086), (48.443, 0.129), (48.450, 0.174),
+                (48.490, 0.196), (48.522, 0.233), (48.543, 0.351), (48.464, 0.398),
+                (48.439, 0.450), (48.340, 0.475), (48.292, 0.580), (48.256, 0.587),
+                (48.238, 0.674), (48.207, 0.701), (48.143, 0.790), (48.107, 0.855),
+                (48.076, 0.878), (47.990, 0.791), (47.981, 0.798), (47.916, 0.800),
+                (47.878, 0.745), (47.823, 0.833), (47.807, 0.828), (47.756, 0.752),
+                (47.727, 0.743), (47.673, 0.745), (47.669, 0.711), (47.674, 0.648),
+                (47.667, 0.580), (47.655, 0.547), (47.666, 0.479), (47.636, 0.393),
+                (47.609, 0.375), (47.606, 0.252), (47.569, 0.206), (47.581, 0.116),
+                (47.599, 0.022), (47.612, 0.006), (47.623, -0.108), (47.615, -0.165),
+                (47.740, -0.234), (47.718, -0.283), (47.731, -0.332), (47.751, -0.368),
+                (47.799, -0.394), (47.814, -0.429), (47.852, -0.471),
+            ],
+        ],
+    ],
+    "73": [
+        [
+            [
+                (45.687, 5.648), (45.769, 5.785), (45.786, 5.772), (45.865, 5.848),
+                (45.824, 5.932), (45.772, 5.984), (45.738, 5.982), (45.713, 6.005),
+                (45.669, 6.086), (45.685, 6.135), (45.674, 6.210), (45.678, 6.242),
+                (45.716, 6.344), (45.753, 6.353), (45.811, 6.349), (45.832, 6.411),
+                (45.829, 6.458), (45.778, 6.514), (45.778, 6.640), (45.716, 6.727),
+                (45.728, 6.793), (45.697, 6.816), (45.683, 6.843), (45.676, 6.883),
+                (45.653, 6.919), (45.641, 6.963), (45.626, 6.969), (45.586, 6.955),
+                (45.567, 6.970), (45.511, 6.983), (45.470, 7.072), (45.435, 7.097),
+                (45.411, 7.161), (45.398, 7.160), (45.357, 7.130), (45.324, 7.093),
+                (45.259, 7.108), (45.215, 7.050), (45.228, 7.030), (45.210, 6.959),
+                (45.170, 6.914), (45.168, 6.881), (45.157, 6.868), (45.141, 6.877),
+                (45.130, 6.844), (45.153, 6.771), (45.157, 6.736), (45.140, 6.694),
+                (45.140, 6.667), (45.126, 6.633), (45.103, 6.603), (45.072, 6.637),
+                (45.092, 6.577), (45.044, 6.333), (45.158, 6.228), (45.209, 6.164),
+                (45.247, 6.169), (45.290, 6.154), (45.319, 6.155), (45.359, 6.173),
+                (45.404, 6.171), (45.436, 6.078), (45.463, 6.064), (45.481, 6.008),
+                (45.460, 5.916), (45.461, 5.866), (45.454, 5.866), (45.432, 5.730),
+                (45.468, 5.713), (45.471, 5.691), (45.494, 5.667), (45.501, 5.634),
+                (45.541, 5.628), (45.562, 5.675), (45.579, 5.688), (45.587, 5.665),
+                (45.583, 5.626), (45.629, 5.611), (45.643, 5.626),
+            ],
+        ],
+    ],
+    "74": [
+        [
+            [
+                (45.865, 5.848), (45.903, 5.827), (45.926, 5.764), (45.959, 5.726),
+                (46.025, 5.734), (46.034, 5.827), (46.076, 5.899), (46.148, 5.959),
+                (46.148, 5.970), (46.130, 5.959), (46.148, 6.028), (46.149, 6.074),
+                (46.139, 6.108), (46.150, 6.140), (46.192, 6.191), (46.221, 6.255),
+                (46.240, 6.281), (46.263, 6.276), (46.268, 6.238), (46.315, 6.214),
+                (46.329, 6.219), (46.375, 6.269), (46.394, 6.302), (46.408, 6.398),
+                (46.449, 6.483), (46.457, 6.547), (46.456, 6.614), (46.429, 6.763),
+                (46.414, 6.787), (46.378, 6.782), (46.346, 6.750), (46.323, 6.769),
+                (46.297, 6.805), (46.269, 6.828), (46.222, 6.792), (46.152, 6.766),
+                (46.135, 6.774), (46.123, 6.854), (46.112, 6.869), (46.086, 6.851),
+                (46.050, 6.851), (46.044, 6.869), (46.056, 6.892), (46.049, 6.915),
+                (45.995, 6.983), (45.925, 7.022), (45.911, 6.997), (45.870, 6.969),
+                (45.845, 6.905), (45.845, 6.873), (45.828, 6.871), (45.839, 6.843),
+                (45.826, 6.801), (45.795, 6.783), (45.728, 6.793), (45.716, 6.727),
+                (45.778, 6.640), (45.778, 6.514), (45.829, 6.458), (45.832, 6.411),
+                (45.811, 6.349), (45.753, 6.353), (45.716, 6.344), (45.678, 6.242),
+                (45.674, 6.210), (45.685, 6.135), (45.669, 6.086), (45.713, 6.005),
+                (45.738, 5.982), (45.772, 5.984), (45.824, 5.932),
+            ],
+        ],
+    ],
+    "75": [
+        [
+            [
+                (48.883, 2.345), (48.885, 2.358), (48.853, 2.385), (48.840, 2.380),
+                (48.834, 2.333), (48.857, 2.299),
+            ],
+        ],
+    ],
+    "76": [
+        [
+            [
+                (50.068, 1.377), (50.049, 1.395), (50.076, 1.430), (50.070, 1.455),
+                (50.042, 1.481), (50.029, 1.507), (49.976, 1.505), (49.921, 1.455),
+                (49.913, 1.472), (49.914, 1.517), (49.963, 1.597), (49.880, 1.694),
+                (49.865, 1.676), (49.824, 1.676), (49.796, 1.845), (49.774, 1.870),
+                (49.739, 1.874), (49.730, 1.863), (49.705, 1.792), (49.716, 1.678),
+                (49.567, 1.666), (49.566, 1.735), (49.499, 1.808), (49.405, 1.664),
+                (49.402, 1.644), (49.405, 1.632), (49.372, 1.518), (49.407, 1.467),
+                (49.487, 1.408), (49.447, 1.302), (49.368, 1.303), (49.353, 1.258),
+                (49.349, 1.224), (49.336, 1.203), (49.337, 1.161), (49.326, 1.128),
+                (49.314, 1.123), (49.316, 1.066), (49.301, 1.063), (49.270, 1.094),
+                (49.246, 1.027), (49.269, 1.003), (49.281, 0.971), (49.301, 0.979),
+                (49.328, 0.973), (49.328, 0.957), (49.307, 0.928), (49.304, 0.906),
+                (49.330, 0.875), (49.343, 0.916), (49.403, 0.934), (49.420, 0.894),
+                (49.393, 0.845), (49.393, 0.832), (49.432, 0.767), (49.424, 0.716),
+                (49.428, 0.670), (49.401, 0.638), (49.401, 0.595), (49.411, 0.541),
+                (49.470, 0.559), (49.495, 0.535), (49.488, 0.498), (49.425, 0.467),
+                (49.423, 0.396), (49.445, 0.363), (49.452, 0.411), (49.467, 0.457),
+                (49.494, 0.493), (49.464, 0.422), (49.457, 0.340), (49.464, 0.257),
+                (49.480, 0.185), (49.481, 0.147), (49.494, 0.104), (49.516, 0.079),
+                (49.542, 0.080), (49.604, 0.131), (49.692, 0.171), (49.729, 0.236),
+                (49.775, 0.387), (49.784, 0.398), (49.833, 0.523), (49.840, 0.557),
+                (49.857, 0.597), (49.876, 0.675), (49.875, 0.761), (49.961, 1.173),
+                (49.979, 1.221), (50.008, 1.261),
+            ],
+        ],
+    ],
+    "77": [
+        [
+            [
+                (48.351, 2.429), (48.358, 2.433), (48.401, 2.520), (48.424, 2.515),
+                (48.447, 2.494), (48.481, 2.525), (48.512, 2.499), (48.534, 2.501),
+                (48.606, 2.537), (48.623, 2.521), (48.653, 2.534), (48.668, 2.552),
+                (48.679, 2.590), (48.692, 2.583), (48.712, 2.565), (48.732, 2.597),
+                (48.758, 2.581), (48.771, 2.616), (48.799, 2.586), (48.827, 2.596),
+                (48.832, 2.582), (48.850, 2.581), (48.867, 2.611), (48.877, 2.563),
+                (48.899, 2.609), (48.906, 2.597), (48.941, 2.590), (48.963, 2.597),
+                (48.986, 2.563), (49.018, 2.578), (49.031, 2.574), (49.078, 2.588),
+                (49.085, 2.600), (49.096, 2.635), (49.085, 2.708), (49.063, 2.720),
+                (49.048, 2.752), (49.088, 2.784), (49.091, 2.810), (49.108, 2.862),
+                (49.108, 2.894), (49.080, 2.930), (49.086, 2.973), (49.116, 3.007),
+                (49.111, 3.173), (49.104, 3.193), (49.035, 3.111), (49.023, 3.111),
+                (48.990, 3.190), (48.996, 3.236), (48.909, 3.275), (48.920, 3.405),
+                (48.918, 3.434), (48.797, 3.447), (48.742, 3.427), (48.659, 3.521),
+                (48.579, 3.442), (48.557, 3.453), (48.470, 3.400), (48.405, 3.405),
+                (48.400, 3.393), (48.372, 3.212), (48.398, 3.165), (48.358, 3.029),
+                (48.319, 3.004), (48.306, 3.022), (48.256, 3.061), (48.238, 2.964),
+                (48.194, 2.934), (48.110, 2.969), (48.097, 2.950), (48.141, 2.832),
+                (48.183, 2.804), (48.156, 2.734), (48.132, 2.731), (48.094, 2.681),
+                (48.093, 2.642), (48.143, 2.588), (48.093, 2.491), (48.115, 2.424),
+                (48.168, 2.405), (48.178, 2.585), (48.196, 2.595), (48.240, 2.573),
+                (48.270, 2.501), (48.311, 2.489),
+            ],
+        ],
+    ],
+    "78": [
+        [
+            [
+                (48.892, 1.529), (48.916, 1.495), (48.957, 1.482), (48.998, 1.498),
+                (49.033, 1.468), (49.048, 1.487), (49.122, 1.534), (49.070, 1.586),
+                (49.069, 1.674), (49.098, 1.714), (49.082, 1.777), (49.087, 1.802),
+                (49.018, 1.872), (49.038, 1.911), (49.011, 2.005), (48.993, 2.036),
+                (49.007, 2.057), (49.006, 2.130), (48.980, 2.128), (48.962, 2.171),
+                (48.954, 2.220), (48.935, 2.199), (48.908, 2.207), (48.872, 2.164),
+                (48.855, 2.168), (48.837, 2.136), (48.817, 2.151), (48.813, 2.171),
+                (48.793, 2.179), (48.797, 2.217), (48.783, 2.233), (48.764, 2.195),
+                (48.746, 2.185), (48.743, 2.142), (48.750, 2.115), (48.718, 2.097),
+                (48.704, 2.113), (48.688, 2.098), (48.692, 2.055), (48.675, 2.022),
+                (48.654, 2.026), (48.619, 2.067), (48.592, 2.028), (48.586, 1.988),
+                (48.557, 1.985), (48.537, 1.960), (48.530, 1.904), (48.469, 1.886),
+                (48.479, 1.824), (48.487, 1.811), (48.562, 1.773), (48.569, 1.782),
+                (48.641, 1.712), (48.675, 1.696), (48.677, 1.638), (48.724, 1.559),
+                (48.730, 1.540), (48.844, 1.555), (48.854, 1.567),
+            ],
+        ],
+    ],
+    "79": [
+        [
+            [
+                (46.960, -0.823), (46.973, -0.805), (47.002, -0.796), (46.998, -0.710),
+                (46.967, -0.660), (47.025, -0.569), (47.049, -0.557), (47.066, -0.487),
+                (47.065, -0.455), (47.079, -0.336), (47.120, -0.300), (47.078, -0.187),
+                (47.066, -0.130), (47.073, -0.031), (46.971, -0.023), (46.961, -0.011),
+                (46.860, -0.085), (46.800, -0.025), (46.799, -0.009), (46.761, 0.072),
+                (46.742, 0.085), (46.647, -0.026), (46.638, -0.011), (46.576, 0.043),
+                (46.494, -0.014), (46.487, -0.049), (46.385, 0.006), (46.329, -0.028),
+                (46.293, 0.082), (46.262, 0.094), (46.200, 0.050), (46.148, 0.200),
+                (46.104, 0.206), (46.069, 0.124), (46.079, 0.030), (45.991, -0.091),
+                (45.980, -0.152), (46.034, -0.189), (46.119, -0.361), (46.072, -0.488),
+                (46.103, -0.585), (46.198, -0.757), (46.216, -0.744), (46.312, -0.791),
+                (46.325, -0.678), (46.340, -0.668), (46.349, -0.553), (46.361, -0.524),
+                (46.414, -0.602), (46.434, -0.599), (46.444, -0.619), (46.507, -0.642),
+                (46.578, -0.554), (46.595, -0.564), (46.615, -0.558), (46.676, -0.639),
+                (46.725, -0.653), (46.740, -0.699), (46.756, -0.707), (46.791, -0.685),
+                (46.832, -0.722), (46.862, -0.742), (46.846, -0.813), (46.877, -0.847),
+                (46.908, -0.838), (46.918, -0.825),
+            ],
+        ],
+    ],
+    "80": [
+        [
+            [
+                (50.068, 1.377), (50.132, 1.465), (50.185, 1.487), (50.215, 1.521),
+                (50.218, 1.555), (50.187, 1.654), (50.193, 1.673), (50.212, 1.645),
+                (50.220, 1.665), (50.232, 1.610), (50.256, 1.594), (50.278, 1.542),
+                (50.349, 1.552), (50.372, 1.569), (50.348, 1.611), (50.357, 1.673),
+                (50.352, 1.759), (50.323, 1.788), (50.325, 1.923), (50.284, 2.006),
+                (50.213, 1.993), (50.163, 2.055), (50.202, 2.230), (50.200, 2.235),
+                (50.237, 2.409), (50.168, 2.501), (50.153, 2.537), (50.095, 2.558),
+                (50.061, 2.726), (50.046, 2.757), (50.023, 2.783), (50.007, 2.824),
+                (50.066, 2.949), (50.043, 3.025), (50.021, 3.045), (50.035, 3.209),
+                (50.007, 3.221), (49.943, 3.219), (49.888, 3.053), (49.835, 3.024),
+                (49.769, 3.156), (49.696, 3.112), (49.699, 3.020), (49.676, 2.961),
+                (49.669, 2.902), (49.697, 2.756), (49.692, 2.740), (49.637, 2.715),
+                (49.615, 2.686), (49.600, 2.538), (49.619, 2.467), (49.657, 2.431),
+                (49.669, 2.429), (49.713, 2.263), (49.657, 2.176), (49.683, 2.061),
+                (49.711, 2.040), (49.739, 1.874), (49.774, 1.870), (49.796, 1.845),
+                (49.824, 1.676), (49.865, 1.676), (49.880, 1.694), (49.963, 1.597),
+                (49.914, 1.517), (49.913, 1.472), (49.921, 1.455), (49.976, 1.505),
+                (50.029, 1.507), (50.042, 1.481), (50.070, 1.455), (50.076, 1.430),
+                (50.049, 1.395),
+            ],
+        ],
+    ],
+    "81": [
+        [
+            [
+                (43.884, 1.631), (43.922, 1.712), (43.958, 1.750), (44.000, 1.745),
+                (44.057, 1.784), (44.115, 1.787), (44.173, 1.903), (44.141, 2.025),
+                (44.144, 2.042), (44.196, 2.117), (44.165, 2.259), (44.097, 2.305),
+                (44.115, 2.415), (44.100, 2.454), (43.921, 2.494), (43.881, 2.551),
+                (43.815, 2.526), (43.738, 2.821), (43.676, 2.901), (43.674, 2.900),
+                (43.644, 2.615), (43.563, 2.592), (43.532, 2.696), (43.392, 2.714),
+                (43.383, 2.630), (43.407, 2.564), (43.392, 2.422), (43.401, 2.413),
+                (43.428, 2.335), (43.441, 2.234), (43.400, 2.167), (43.371, 2.143),
+                (43.368, 2.095), (43.381, 2.022), (43.514, 2.047), (43.517, 1.936),
+                (43.588, 1.898), (43.611, 1.858), (43.618, 1.774), (43.707, 1.725),
+                (43.716, 1.676), (43.736, 1.651), (43.814, 1.666),
+            ],
+        ],
+    ],
+    "82": [
+        [
+            [
+                (43.775, 1.026), (43.841, 0.831), (43.864, 0.826), (43.922, 0.774),
+                (43.985, 0.764), (44.003, 0.779), (44.041, 0.778), (44.094, 0.739),
+                (44.131, 0.744), (44.205, 0.802), (44.229, 0.929), (44.303, 0.894),
+                (44.396, 0.944), (44.405, 0.974), (44.417, 1.094), (44.410, 1.114),
+                (44.321, 1.112), (44.283, 1.209), (44.281, 1.267), (44.231, 1.293),
+                (44.229, 1.409), (44.308, 1.451), (44.262, 1.596), (44.272, 1.643),
+                (44.370, 1.738), (44.355, 1.848), (44.290, 1.908), (44.173, 1.903),
+                (44.115, 1.787), (44.057, 1.784), (44.000, 1.745), (43.958, 1.750),
+                (43.922, 1.712), (43.884, 1.631), (43.931, 1.508), (43.859, 1.456),
+                (43.861, 1.422), (43.877, 1.375), (43.857, 1.338), (43.816, 1.358),
+                (43.799, 1.333), (43.804, 1.233), (43.798, 1.212), (43.823, 1.100),
+            ],
+        ],
+    ],
+    "83": [
+        [
+            [
+                (43.669, 5.737), (43.743, 5.753), (43.768, 5.822), (43.713, 5.876),
+                (43.691, 5.994), (43.727, 6.025), (43.752, 6.246), (43.774, 6.311),
+                (43.738, 6.369), (43.730, 6.491), (43.735, 6.555), (43.771, 6.679),
+                (43.741, 6.699), (43.712, 6.704), (43.665, 6.729), (43.638, 6.770),
+                (43.622, 6.810), (43.604, 6.820), (43.616, 6.880), (43.570, 6.909),
+                (43.549, 6.877), (43.524, 6.880), (43.471, 6.852), (43.430, 6.895),
+                (43.416, 6.860), (43.416, 6.819), (43.409, 6.783), (43.423, 6.757),
+                (43.408, 6.731), (43.382, 6.733), (43.351, 6.718), (43.346, 6.675),
+                (43.322, 6.661), (43.284, 6.597), (43.269, 6.591), (43.264, 6.612),
+                (43.276, 6.672), (43.265, 6.698), (43.240, 6.668), (43.221, 6.665),
+                (43.202, 6.680), (43.173, 6.610), (43.188, 6.593), (43.182, 6.540),
+                (43.161, 6.527), (43.151, 6.506), (43.156, 6.479), (43.152, 6.422),
+                (43.136, 6.379), (43.119, 6.366), (43.091, 6.375), (43.091, 6.342),
+                (43.104, 6.326), (43.119, 6.280), (43.117, 6.220), (43.093, 6.163),
+                (43.048, 6.153), (43.036, 6.180), (43.031, 6.098), (43.035, 6.089),
+                (43.053, 6.132), (43.071, 6.129), (43.084, 6.110), (43.078, 6.027),
+                (43.099, 6.017), (43.102, 5.959), (43.114, 5.934), (43.134, 5.941),
+                (43.120, 5.879), (43.115, 5.896), (43.093, 5.911), (43.080, 5.951),
+                (43.071, 5.940), (43.069, 5.875), (43.045, 5.857), (43.053, 5.819),
+                (43.079, 5.782), (43.099, 5.818), (43.115, 5.783), (43.131, 5.776),
+                (43.132, 5.741), (43.147, 5.696), (43.169, 5.688), (43.186, 5.654),
+                (43.208, 5.676), (43.235, 5.683), (43.245, 5.749), (43.263, 5.785),
+                (43.295, 5.779), (43.309, 5.678), (43.333, 5.658), (43.357, 5.680),
+                (43.409, 5.659), (43.430, 5.767), (43.451, 5.772), (43.487, 5.686),
+                (43.598, 5.763),
+            ],
+        ],
+        [
+            [
+                (42.987, 6.202), (43.000, 6.166), (43.009, 6.175), (43.016, 6.233),
+                (43.026, 6.242), (43.003, 6.252),
+            ],
+        ],
+    ],
+    "84": [
+        [
+            [
+                (43.926, 4.774), (43.954, 4.786), (43.966, 4.829), (43.996, 4.827),
+                (44.026, 4.837), (44.042, 4.808), (44.087, 4.803), (44.089, 4.731),
+                (44.097, 4.712), (44.117, 4.711), (44.141, 4.727), (44.167, 4.696),
+                (44.214, 4.689), (44.227, 4.670), (44.272, 4.694), (44.286, 4.657),
+                (44.313, 4.651), (44.344, 4.676), (44.340, 4.712), (44.315, 4.739),
+                (44.292, 4.794), (44.272, 4.797), (44.249, 4.774), (44.217, 4.841),
+                (44.220, 4.858), (44.263, 4.856), (44.278, 4.886), (44.238, 4.963),
+                (44.249, 4.993), (44.277, 5.013), (44.318, 4.887), (44.352, 4.917),
+                (44.391, 4.880), (44.420, 4.949), (44.412, 4.968), (44.432, 5.086),
+                (44.388, 5.071), (44.342, 5.000), (44.283, 5.021), (44.284, 5.031),
+                (44.260, 5.172), (44.239, 5.181), (44.193, 5.252), (44.175, 5.316),
+                (44.256, 5.551), (44.152, 5.673), (44.138, 5.678), (44.027, 5.596),
+                (43.999, 5.560), (43.975, 5.550), (43.931, 5.515), (43.822, 5.504),
+                (43.808, 5.520), (43.809, 5.574), (43.832, 5.647), (43.828, 5.678),
+                (43.782, 5.700), (43.743, 5.753), (43.669, 5.737), (43.692, 5.643),
+                (43.685, 5.626), (43.676, 5.552), (43.660, 5.487), (43.688, 5.461),
+                (43.687, 5.391), (43.700, 5.358), (43.730, 5.339), (43.734, 5.256),
+                (43.718, 5.243), (43.770, 5.137), (43.781, 5.131), (43.773, 5.073),
+                (43.811, 5.030), (43.851, 4.998), (43.881, 5.013), (43.876, 4.932),
+                (43.909, 4.907), (43.904, 4.883), (43.911, 4.844), (43.923, 4.832),
+            ],
+        ],
+    ],
+    "85": [
+        [
+            [
+                (47.023, -1.155), (47.027, -1.088), (46.998, -1.079), (47.019, -1.000),
+                (47.013, -0.995), (47.009, -0.902), (46.992, -0.898), (46.960, -0.823),
+                (46.918, -0.825), (46.908, -0.838), (46.877, -0.847), (46.846, -0.813),
+                (46.862, -0.742), (46.832, -0.722), (46.791, -0.685), (46.756, -0.707),
+                (46.740, -0.699), (46.725, -0.653), (46.676, -0.639), (46.615, -0.558),
+                (46.595, -0.564), (46.578, -0.554), (46.507, -0.642), (46.444, -0.619),
+                (46.434, -0.599), (46.414, -0.602), (46.361, -0.524), (46.349, -0.553),
+                (46.340, -0.668), (46.325, -0.678), (46.312, -0.791), (46.320, -0.913),
+                (46.361, -0.950), (46.342, -1.061), (46.333, -1.169), (46.326, -1.174),
+                (46.311, -1.214), (46.279, -1.213), (46.284, -1.240), (46.320, -1.277),
+                (46.324, -1.303), (46.354, -1.370), (46.342, -1.423), (46.343, -1.449),
+                (46.390, -1.465), (46.419, -1.504), (46.425, -1.599), (46.431, -1.626),
+                (46.444, -1.617), (46.454, -1.633), (46.461, -1.687), (46.481, -1.720),
+                (46.500, -1.768), (46.533, -1.789), (46.495, -1.782), (46.504, -1.805),
+                (46.577, -1.827), (46.594, -1.823), (46.599, -1.839), (46.635, -1.857),
+                (46.666, -1.900), (46.692, -1.910), (46.710, -1.965), (46.752, -1.995),
+                (46.792, -2.050), (46.820, -2.119), (46.872, -2.131), (46.904, -2.122),
+                (46.916, -2.096), (46.931, -2.102), (46.957, -2.049), (47.018, -2.014),
+                (46.995, -1.938), (46.984, -1.923), (46.986, -1.894), (46.947, -1.820),
+                (46.902, -1.780), (46.898, -1.740), (46.905, -1.723), (46.874, -1.651),
+                (46.820, -1.647), (46.813, -1.623), (46.815, -1.587), (46.889, -1.529),
+                (46.924, -1.572), (46.959, -1.541), (46.991, -1.558), (47.020, -1.499),
+                (46.995, -1.472), (46.965, -1.482), (46.943, -1.461), (46.962, -1.388),
+                (47.019, -1.378), (47.035, -1.338), (47.029, -1.304), (47.073, -1.271),
+                (47.064, -1.213), (47.037, -1.227),
+            ],
+        ],
+        [
+            [
+                (46.962, -2.195), (46.974, -2.220), (46.964, -2.247), (46.980, -2.263),
+                (47.018, -2.279), (47.033, -2.296), (47.035, -2.239), (47.024, -2.200),
+                (46.985, -2.200), (46.957, -2.145), (46.923, -2.138), (46.916, -2.159),
+            ],
+        ],
+        [
+            [
+                (46.732, -2.337), (46.720, -2.298), (46.697, -2.269), (46.704, -2.291),
+                (46.704, -2.371), (46.732, -2.375),
+            ],
+        ],
+    ],
+    "86": [
+        [
+            [
+                (47.073, -0.031), (47.091, 0.013), (47.101, 0.132), (47.040, 0.202),
+                (46.928, 0.208), (46.914, 0.243), (46.991, 0.464), (46.998, 0.466),
+                (46.998, 0.657), (46.951, 0.649), (46.926, 0.667), (46.861, 0.667),
+                (46.838, 0.688), (46.851, 0.739), (46.854, 0.830), (46.843, 0.844),
+                (46.740, 0.842), (46.721, 0.861), (46.607, 0.857), (46.575, 0.865),
+                (46.523, 0.983), (46.446, 1.054), (46.424, 1.107), (46.346, 1.157),
+                (46.320, 1.124), (46.264, 1.003), (46.304, 0.869), (46.294, 0.766),
+                (46.271, 0.720), (46.247, 0.714), (46.108, 0.849), (46.091, 0.851),
+                (46.080, 0.831), (46.058, 0.531), (46.070, 0.517), (46.067, 0.383),
+                (46.077, 0.345), (46.072, 0.287), (46.104, 0.206), (46.148, 0.200),
+                (46.200, 0.050), (46.262, 0.094), (46.293, 0.082), (46.329, -0.028),
+                (46.385, 0.006), (46.487, -0.049), (46.494, -0.014), (46.576, 0.043),
+                (46.638, -0.011), (46.647, -0.026), (46.742, 0.085), (46.761, 0.072),
+                (46.799, -0.009), (46.800, -0.025), (46.860, -0.085), (46.961, -0.011),
+                (46.971, -0.023),
+            ],
+        ],
+    ],
+    "87": [
+        [
+            [
+                (45.704, 0.624), (45.762, 0.605), (45.778, 0.632), (45.786, 0.705),
+                (45.852, 0.773), (45.869, 0.838), (45.909, 0.842), (45.940, 0.945),
+                (46.031, 0.967), (46.091, 0.851), (46.108, 0.849), (46.247, 0.714),
+                (46.271, 0.720), (46.294, 0.766), (46.304, 0.869), (46.264, 1.003),
+                (46.320, 1.124), (46.346, 1.157), (46.336, 1.192), (46.402, 1.424),
+                (46.354, 1.473), (46.296, 1.437), (46.256, 1.433), (46.200, 1.327),
+                (46.174, 1.355), (46.131, 1.508), (46.050, 1.540), (46.038, 1.560),
+                (46.035, 1.613), (45.881, 1.714), (45.896, 1.957), (45.759, 2.005),
+                (45.741, 1.951), (45.655, 1.814), (45.663, 1.697), (45.630, 1.616),
+                (45.529, 1.588), (45.515, 1.505), (45.529, 1.451), (45.456, 1.325),
+                (45.448, 1.288), (45.460, 1.260), (45.456, 1.170), (45.462, 1.148),
+                (45.528, 1.127), (45.548, 1.054), (45.574, 1.038), (45.598, 0.965),
+                (45.599, 0.843), (45.633, 0.805),
+            ],
+        ],
+    ],
+    "88": [
+        [
+            [
+                (47.934, 6.065), (48.018, 5.923), (48.010, 5.883), (48.007, 5.797),
+                (48.032, 5.749), (48.081, 5.695), (48.148, 5.757), (48.174, 5.749),
+                (48.280, 5.763), (48.288, 5.672), (48.294, 5.550), (48.333, 5.520),
+                (48.377, 5.522), (48.383, 5.606), (48.415, 5.669), (48.416, 5.844),
+                (48.372, 5.926), (48.374, 5.930), (48.403, 6.193), (48.399, 6.201),
+                (48.403, 6.268), (48.420, 6.429), (48.391, 6.500), (48.433, 6.608),
+                (48.400, 6.679), (48.382, 6.763), (48.392, 6.777), (48.459, 6.828),
+                (48.446, 6.931), (48.494, 7.054), (48.356, 7.133), (48.348, 7.122),
+                (48.206, 7.126), (48.190, 7.098), (48.144, 7.086), (48.124, 7.073),
+                (48.105, 7.023), (48.057, 7.011), (48.015, 6.967), (48.002, 6.968),
+                (47.957, 6.903), (47.929, 6.890), (47.879, 6.921), (47.837, 6.921),
+                (47.806, 6.886), (47.812, 6.780), (47.820, 6.756), (47.828, 6.664),
+                (47.849, 6.570), (47.853, 6.533), (47.923, 6.459), (47.937, 6.401),
+                (47.986, 6.360), (47.942, 6.257),
+            ],
+        ],
+    ],
+    "89": [
+        [
+            [
+                (48.110, 2.969), (48.194, 2.934), (48.238, 2.964), (48.256, 3.061),
+                (48.306, 3.022), (48.319, 3.004), (48.358, 3.029), (48.398, 3.165),
+                (48.372, 3.212), (48.400, 3.393), (48.405, 3.405), (48.369, 3.554),
+                (48.320, 3.588), (48.196, 3.533), (48.133, 3.551), (48.113, 3.646),
+                (48.147, 3.854), (48.004, 3.852), (47.959, 4.053), (47.941, 4.203),
+                (47.886, 4.264), (47.856, 4.332), (47.848, 4.362), (47.750, 4.436),
+                (47.594, 4.100), (47.556, 4.123), (47.421, 4.119), (47.355, 4.026),
+                (47.420, 3.723), (47.523, 3.706), (47.597, 3.558), (47.604, 3.505),
+                (47.564, 3.319), (47.588, 3.272), (47.584, 2.975), (47.596, 2.959),
+                (47.610, 2.949), (47.628, 2.903), (47.744, 2.855), (47.784, 2.953),
+                (47.845, 2.977), (47.889, 3.025), (47.957, 3.198), (47.988, 3.174),
+                (48.039, 3.177), (48.108, 3.081), (48.117, 3.011),
+            ],
+        ],
+    ],
+    "90": [
+        [
+            [
+                (47.812, 6.780), (47.806, 6.886), (47.766, 6.900), (47.758, 6.975),
+                (47.747, 7.009), (47.682, 7.042), (47.679, 7.038), (47.571, 7.077),
+                (47.559, 7.100), (47.494, 7.082), (47.490, 7.054), (47.499, 7.010),
+                (47.489, 6.973), (47.452, 6.991), (47.437, 6.972), (47.451, 6.938),
+                (47.493, 6.901), (47.507, 6.956), (47.519, 6.926), (47.546, 6.891),
+                (47.552, 6.821), (47.566, 6.805), (47.588, 6.813), (47.605, 6.786),
+                (47.650, 6.806), (47.660, 6.778), (47.699, 6.773), (47.710, 6.789),
+                (47.737, 6.778),
+            ],
+        ],
+    ],
+    "91": [
+        [
+            [
+                (48.469, 1.886), (48.530, 1.904), (48.537, 1.960), (48.557, 1.985),
+                (48.586, 1.988), (48.592, 2.028), (48.619, 2.067), (48.654, 2.026),
+                (48.675, 2.022), (48.692, 2.055), (48.688, 2.098), (48.704, 2.113),
+                (48.718, 2.097), (48.750, 2.115), (48.743, 2.142), (48.746, 2.185),
+                (48.764, 2.195), (48.783, 2.233), (48.755, 2.246), (48.756, 2.279),
+                (48.741, 2.287), (48.744, 2.312), (48.745, 2.334), (48.729, 2.348),
+                (48.712, 2.431), (48.731, 2.471), (48.731, 2.515), (48.708, 2.517),
+                (48.686, 2.547), (48.692, 2.583), (48.679, 2.590), (48.668, 2.552),
+                (48.653, 2.534), (48.623, 2.521), (48.606, 2.537), (48.534, 2.501),
+                (48.512, 2.499), (48.481, 2.525), (48.447, 2.494), (48.424, 2.515),
+                (48.401, 2.520), (48.358, 2.433), (48.351, 2.429), (48.338, 2.341),
+                (48.345, 2.293), (48.376, 2.256), (48.374, 2.238), (48.323, 2.158),
+                (48.243, 2.125), (48.267, 2.044), (48.257, 1.953), (48.263, 1.930),
+                (48.320, 1.820), (48.420, 1.928),
+            ],
+        ],
+    ],
+    "92": [
+        [
+            [
+                (48.908, 2.207), (48.907, 2.221), (48.932, 2.236), (48.935, 2.264),
+                (48.952, 2.284), (48.937, 2.334), (48.917, 2.309), (48.883, 2.345),
+                (48.857, 2.299), (48.834, 2.333), (48.805, 2.318), (48.770, 2.332),
+                (48.766, 2.307), (48.744, 2.312), (48.741, 2.287), (48.756, 2.279),
+                (48.755, 2.246), (48.783, 2.233), (48.797, 2.217), (48.793, 2.179),
+                (48.813, 2.171), (48.817, 2.151), (48.837, 2.136), (48.855, 2.168),
+                (48.872, 2.164),
+            ],
+        ],
+    ],
+    "93": [
+        [
+            [
+                (48.853, 2.385), (48.885, 2.358), (48.883, 2.345), (48.917, 2.309),
+                (48.937, 2.334), (48.952, 2.284), (48.961, 2.298), (48.965, 2.349),
+                (48.980, 2.379), (48.963, 2.380), (48.956, 2.399), (48.969, 2.419),
+                (48.962, 2.451), (48.976, 2.541), (48.986, 2.563), (48.963, 2.597),
+                (48.941, 2.590), (48.906, 2.597), (48.899, 2.609), (48.877, 2.563),
+                (48.867, 2.611), (48.850, 2.581), (48.832, 2.582), (48.842, 2.542),
+                (48.854, 2.525), (48.858, 2.495), (48.872, 2.471), (48.853, 2.418),
+            ],
+        ],
+    ],
+    "94": [
+        [
+            [
+                (48.744, 2.312), (48.766, 2.307), (48.770, 2.332), (48.805, 2.318),
+                (48.834, 2.333), (48.840, 2.380), (48.853, 2.385), (48.853, 2.418),
+                (48.872, 2.471), (48.858, 2.495), (48.854, 2.525), (48.842, 2.542),
+                (48.832, 2.582), (48.827, 2.596), (48.799, 2.586), (48.771, 2.616),
+                (48.758, 2.581), (48.732, 2.597), (48.712, 2.565), (48.692, 2.583),
+                (48.686, 2.547), (48.708, 2.517), (48.731, 2.515), (48.731, 2.471),
+                (48.712, 2.431), (48.729, 2.348), (48.745, 2.334),
+            ],
+        ],
+    ],
+    "95": [
+        [
+            [
+                (49.098, 1.714), (49.150, 1.676), (49.199, 1.685), (49.218, 1.767),
+                (49.219, 1.813), (49.201, 1.859), (49.227, 1.974), (49.207, 1.998),
+                (49.185, 2.043), (49.146, 2.078), (49.173, 2.161), (49.160, 2.201),
+                (49.153, 2.252), (49.186, 2.327), (49.151, 2.349), (49.155, 2.401),
+                (49.143, 2.442), (49.113, 2.472), (49.116, 2.560), (49.105, 2.563),
+                (49.085, 2.600), (49.078, 2.588), (49.031, 2.574), (49.018, 2.578),
+                (48.986, 2.563), (48.976, 2.541), (48.962, 2.451), (48.969, 2.419),
+                (48.956, 2.399), (48.963, 2.380), (48.980, 2.379), (48.965, 2.349),
+                (48.961, 2.298), (48.952, 2.284), (48.935, 2.264), (48.932, 2.236),
+                (48.907, 2.221), (48.908, 2.207), (48.935, 2.199), (48.954, 2.220),
+                (48.962, 2.171), (48.980, 2.128), (49.006, 2.130), (49.007, 2.057),
+                (48.993, 2.036), (49.011, 2.005), (49.038, 1.911), (49.018, 1.872),
+                (49.087, 1.802), (49.082, 1.777),
+            ],
+        ],
+    ],
+}
+
+# Coastal parts of the outer rings of DEPARTMENT_POLYGONS as (polygon, first
+# vertex, last vertex) index ranges, for the coastal departments.
+DEPARTMENT_COASTS = {
+    "06": [(0, 32, 35), (0, 38, 60)],
+    "11": [(0, 37, 44)],
+    "13": [(0, 36, 101)],
+    "14": [(0, 0, 22)],
+    "17": [(0, 39, 84), (1, 0, 16), (2, 0, 18), (3, 0, 1)],
+    "22": [(0, 13, 80), (0, 83, 87)],
+    "29": [(0, 17, 160), (1, 0, 5)],
+    "2A": [(0, 0, 99), (1, 1, 3)],
+    "2B": [(0, 2, 61), (0, 0, 1), (1, 0, 3)],
+    "30": [(0, 51, 57)],
+    "33": [(0, 71, 95), (0, 0, 23)],
+    "34": [(0, 34, 47)],
+    "35": [(0, 16, 33), (1, 0, 7)],
+    "40": [(0, 0, 10)],
+    "44": [(0, 70, 122)],
+    "50": [(0, 35, 113)],
+    "56": [(0, 42, 129), (1, 0, 10)],
+    "59": [(0, 0, 5)],
+    "62": [(0, 0, 17)],
+    "64": [(0, 67, 73)],
+    "66": [(0, 11, 20)],
+    "76": [(0, 65, 90)],
+    "80": [(0, 0, 13)],
+    "83": [(0, 23, 83), (1, 0, 6)],
+    "85": [(0, 35, 71), (1, 0, 12), (2, 0, 6)],
+}
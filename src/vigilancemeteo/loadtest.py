@@ -0,0 +1,283 @@
+# coding: utf-8
+"""Load-testing harness with a local stand-in for the Météo France website.
+
+Run it with: python -m vigilancemeteo.loadtest --help
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import threading
+import time
+import zipfile
+import zlib
+
+from vigilancemeteo.constants import VALID_DEPARTMENT_LIST
+from vigilancemeteo.department_weather_alert import DepartmentWeatherAlert
+from vigilancemeteo.sources import BulletinSource
+from vigilancemeteo.vigilance_proxy import VigilanceMeteoFranceProxy
+
+# Manage differences beetween python 2.7 and 3.6
+if sys.version_info < (3, 0):
+    from BaseHTTPServer import BaseHTTPRequestHandler  # pylint: disable=import-error
+    from SocketServer import ThreadingMixIn, TCPServer  # pylint: disable=import-error
+else:
+    from http.server import BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn, TCPServer
+
+CHECKSUM_PATH = "/data/vigilance_controle.txt"
+XML_PATH = "/data/NXFR33_LFPW_.xml"
+ZIP_PATH = "/data/vigilance.zip"
+
+
+class _ThreadingServer(ThreadingMixIn, TCPServer):
+    """TCP server answering each request in a thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeMeteoFranceServer(object):
+    """Class to serve weather alert bulletins like the Météo France website.
+
+    The server serves the checksum file, the XML bulletin and the compressed
+    data source. Failures can be injected:
+    - latency = delay in seconds before answering each request
+    - error_rate = probability to answer a request with an HTTP 500 error
+    - slow_body_delay = delay in seconds between each chunk of the body
+    - rotate_every = delay in seconds before publishing the next bulletin of
+      the list (bulletins are published in a loop)
+
+    Public attributes:
+    - url = base URL of the server
+    - request_counts = number of requests received for each path
+    - bulletin_index = index of the bulletin currently published
+
+    Public Methods:
+    - start() / stop(): start or stop the server (also a context manager).
+    - source(name): return a BulletinSource using the server.
+    """
+
+    CHUNK_SIZE = 4096
+
+    def __init__(
+        self,
+        bulletins,
+        latency=0,
+        error_rate=0,
+        slow_body_delay=0,
+        rotate_every=None,
+        seed=None,
+    ):
+        """Class instance constructor.
+
+        'bulletins' is the list of the XML bulletins (bytes) to publish.
+        """
+        self._bulletins = [self._build_files(xml) for xml in bulletins]
+        self._latency = latency
+        self._error_rate = error_rate
+        self._slow_body_delay = slow_body_delay
+        self._rotate_every = rotate_every
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._start_time = None
+        self.request_counts = {}
+
+    @staticmethod
+    def _build_files(xml):
+        """Return the files published for a XML bulletin."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("NXFR33_LFPW_.xml", xml)
+        archive = archive.getvalue()
+        checksum = zlib.crc32(xml) & 0xFFFFFFFF
+        control = "{}\n{} {} vigilance.zip".format(
+            time.strftime("%a %b %d %H:%M:%S %Y"), checksum, len(archive)
+        )
+        return {
+            CHECKSUM_PATH: control.encode("utf-8"),
+            XML_PATH: xml,
+            ZIP_PATH: archive,
+        }
+
+    @property
+    def bulletin_index(self):
+        """Index of the bulletin currently published."""
+        if not self._rotate_every or self._start_time is None:
+            return 0
+        elapsed = time.time() - self._start_time
+        return int(elapsed // self._rotate_every) % len(self._bulletins)
+
+    @property
+    def url(self):
+        """Base URL of the server."""
+        return "http://127.0.0.1:{}".format(self._server.server_address[1])
+
+    def source(self, name="fake"):
+        """Return a BulletinSource using the server."""
+        return BulletinSource(
+            name, self.url + CHECKSUM_PATH, self.url + XML_PATH, self.url + ZIP_PATH
+        )
+
+    def _answer(self, handler):
+        """Answer a request received by the server."""
+        with self._lock:
+            self.request_counts[handler.path] = (
+                self.request_counts.get(handler.path, 0) + 1
+            )
+            failure = self._random.random() < self._error_rate
+
+        if self._latency:
+            time.sleep(self._latency)
+        body = self._bulletins[self.bulletin_index].get(handler.path)
+        if body is None:
+            handler.send_error(404)
+            return
+        if failure:
+            handler.send_error(500)
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        for start in range(0, len(body), self.CHUNK_SIZE):
+            if self._slow_body_delay:
+                time.sleep(self._slow_body_delay)
+            handler.wfile.write(body[start : start + self.CHUNK_SIZE])
+
+    def start(self):
+        """Start the server in a background thread."""
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Forward the requests to the fake server."""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Answer a GET request."""
+                fake_server._answer(self)  # pylint: disable=protected-access
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Don't log the requests."""
+
+        self._server = _ThreadingServer(("127.0.0.1", 0), Handler)
+        self._start_time = time.time()
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def _percentile(sorted_values, percentile):
+    """Return the percentile of a sorted list (None if empty)."""
+    if not sorted_values:
+        return None
+    index = int(round(percentile / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_load_test(proxy, departments=None, workers=16, duration=10.0):
+    """Hammer a shared proxy from many threads and return a report.
+
+    Each thread updates in a loop the DepartmentWeatherAlert objects of
+    'departments' (all valid departments by default) created with the shared
+    proxy. An update is an error if the department color is unknown.
+
+    The report is a dictionary with the number of updates and errors, the
+    throughput (updates per second) and the latency percentiles in seconds.
+    """
+    if departments is None:
+        departments = VALID_DEPARTMENT_LIST
+    alerts = [DepartmentWeatherAlert(department, proxy) for department in departments]
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_time = time.time() + duration
+
+    def worker(offset):
+        """Update the department alerts until the end of the test."""
+        worker_latencies = []
+        worker_errors = 0
+        index = offset
+        while time.time() < stop_time:
+            alert = alerts[index % len(alerts)]
+            start = time.time()
+            alert.update_department_status()
+            worker_latencies.append(time.time() - start)
+            if alert.department_color is None:
+                worker_errors += 1
+            index += 1
+        with lock:
+            latencies.extend(worker_latencies)
+            errors[0] += worker_errors
+
+    start = time.time()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+
+    latencies.sort()
+    return {
+        "workers": workers,
+        "duration": elapsed,
+        "updates": len(latencies),
+        "errors": errors[0],
+        "throughput": len(latencies) / elapsed,
+        "latency_p50": _percentile(latencies, 50),
+        "latency_p90": _percentile(latencies, 90),
+        "latency_p99": _percentile(latencies, 99),
+        "latency_max": _percentile(latencies, 100),
+    }
+
+
+def main(argv=None):
+    """Run a load test against a fake server and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("bulletins", nargs="+", help="XML bulletin files to publish")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--slow-body-delay", type=float, default=0)
+    parser.add_argument("--rotate-every", type=float, default=None)
+    parser.add_argument("--compressed", action="store_true")
+    args = parser.parse_args(argv)
+
+    bulletins = []
+    for path in args.bulletins:
+        with open(path, "rb") as xml_file:
+            bulletins.append(xml_file.read())
+
+    with FakeMeteoFranceServer(
+        bulletins,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        slow_body_delay=args.slow_body_delay,
+        rotate_every=args.rotate_every,
+    ) as server:
+        proxy = VigilanceMeteoFranceProxy(
+            compressed=args.compressed, sources=[server.source()]
+        )
+        report = run_load_test(proxy, workers=args.workers, duration=args.duration)
+        report["upstream_requests"] = dict(server.request_counts)
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# coding: utf-8
+"""Implement a class to find the department of a location offline."""
+import math
+
+from vigilancemeteo.constants import (
+    CORSICA_POSTAL_CODE_PREFIXES,
+    INSEE_CODE_ANDORRE,
+    VALID_DEPARTMENT_LIST,
+)
+
+# Longitude scale to compute distances in France (cosinus of 46.5°)
+LONGITUDE_SCALE = math.cos(math.radians(46.5))
+
+
+def _point_in_polygon(polygon, latitude, longitude):
+    """Return True if a point is in a polygon (outer ring followed by holes)."""
+    inside = False
+    for ring in polygon:
+        previous_latitude, previous_longitude = ring[-1]
+        for ring_latitude, ring_longitude in ring:
+            if (ring_latitude > latitude) != (previous_latitude > latitude) and (
+                longitude
+                < previous_longitude
+                + (ring_longitude - previous_longitude)
+                * (latitude - previous_latitude)
+                / (ring_latitude - previous_latitude)
+            ):
+                inside = not inside
+            previous_latitude, previous_longitude = ring_latitude, ring_longitude
+    return inside
+
+
+def _distance_to_polygon(polygon, latitude, longitude):
+    """Return the distance in degrees between a point and the rings of a polygon."""
+    point_x, point_y = longitude * LONGITUDE_SCALE, latitude
+    distance = float("inf")
+    for ring in polygon:
+        start_x, start_y = ring[-1][1] * LONGITUDE_SCALE, ring[-1][0]
+        for ring_latitude, ring_longitude in ring:
+            end_x, end_y = ring_longitude * LONGITUDE_SCALE, ring_latitude
+            delta_x, delta_y = end_x - start_x, end_y - start_y
+            length = delta_x ** 2 + delta_y ** 2
+            ratio = 0
+            if length:
+                ratio = ((point_x - start_x) * delta_x + (point_y - start_y) * delta_y)
+                ratio = min(1, max(0, ratio / length))
+            distance = min(
+                distance,
+                math.hypot(
+                    point_x - start_x - ratio * delta_x,
+                    point_y - start_y - ratio * delta_y,
+                ),
+            )
+            start_x, start_y = end_x, end_y
+    return distance
+
+
+class DepartmentResolver(object):
+    """Class to find the department of a postal code, INSEE code or coordinates.
+
+    The departments returned are the strings accepted by DepartmentWeatherAlert.
+    None is returned when the location is not in a department.
+
+    Postal and INSEE codes are resolved with a prefix table. Coordinates are
+    resolved with the simplified department polygons (DEPARTMENT_POLYGONS): a
+    grid of cells lists the departments near each cell, then the point is
+    tested in their polygons. The borders between departments are precise to a
+    few kilometers, so the result is approximate close to them.
+
+    Public Methods:
+    - from_postal_code(postal_code): return the department of a postal code.
+    - from_insee_code(insee_code): return the department of an INSEE code.
+    - from_coordinates(latitude, longitude): return the department of a location.
+    - resolve_many(locations, kind): return the departments of a list of
+      locations. 'kind' can be 'postal_code', 'insee_code' or 'coordinates'.
+    """
+
+    # Grid limits (latitude and longitude)
+    GRID_LATITUDE_RANGE = (41.0, 51.5)
+    GRID_LONGITUDE_RANGE = (-5.5, 10.0)
+
+    def __init__(self, cell_size=0.25, max_distance=0.015):
+        """Class instance constructor.
+
+        'cell_size' is the size of the grid cells in degrees. Coordinates out
+        of the polygons but at less than 'max_distance' degrees of one of them
+        (like a harbour on a simplified coast) are in the nearest department.
+        """
+        self._cell_size = cell_size
+        self._max_distance = max_distance
+
+        # Prefix tables for postal and INSEE codes
+        self._postal_code_prefixes = {}
+        self._insee_code_prefixes = {}
+        for department in VALID_DEPARTMENT_LIST:
+            # Corsica codes are 2A and 2B since 1976 and Andorre has no codes.
+            if department in ["20", "99"]:
+                continue
+            self._insee_code_prefixes[department] = department
+            if department not in ["2A", "2B"]:
+                self._postal_code_prefixes[department] = department
+        self._postal_code_prefixes.update(CORSICA_POSTAL_CODE_PREFIXES)
+
+        # Polygons of the departments (Andorre last). The geometry is large, it's
+        # only loaded when a resolver is created.
+        from vigilancemeteo import geography  # pylint: disable=import-outside-toplevel
+
+        self._polygons = [
+            (department, polygon)
+            for department, polygons in sorted(geography.DEPARTMENT_POLYGONS.items())
+            for polygon in polygons
+        ]
+        self._polygons.append(("99", [geography.ANDORRE_OUTLINE]))
+
+        # Candidate polygons for each cell of the grid
+        self._rows = int(
+            math.ceil(
+                (self.GRID_LATITUDE_RANGE[1] - self.GRID_LATITUDE_RANGE[0]) / cell_size
+            )
+        )
+        self._columns = int(
+            math.ceil(
+                (self.GRID_LONGITUDE_RANGE[1] - self.GRID_LONGITUDE_RANGE[0])
+                / cell_size
+            )
+        )
+        self._grid = [[] for _ in range(self._rows * self._columns)]
+        for candidate in self._polygons:
+            for index in self._polygon_cells(candidate[1]):
+                self._grid[index].append(candidate)
+
+    def _polygon_cells(self, polygon):
+        """Return the indices of the cells of the bounding box of a polygon.
+
+        The bounding box is extended by max_distance.
+        """
+        latitudes = [latitude for latitude, _ in polygon[0]]
+        longitudes = [longitude for _, longitude in polygon[0]]
+        margin = self._max_distance / LONGITUDE_SCALE
+        first_row, last_row = [
+            int((latitude - self.GRID_LATITUDE_RANGE[0]) // self._cell_size)
+            for latitude in (min(latitudes) - margin, max(latitudes) + margin)
+        ]
+        first_column, last_column = [
+            int((longitude - self.GRID_LONGITUDE_RANGE[0]) // self._cell_size)
+            for longitude in (min(longitudes) - margin, max(longitudes) + margin)
+        ]
+        return [
+            row * self._columns + column
+            for row in range(max(first_row, 0), min(last_row + 1, self._rows))
+            for column in range(
+                max(first_column, 0), min(last_column + 1, self._columns)
+            )
+        ]
+
+    def from_postal_code(self, postal_code):
+        """Return the department of a postal code (string or integer)."""
+        if isinstance(postal_code, int):
+            postal_code = "{:05d}".format(postal_code)
+        postal_code = str(postal_code).strip().upper()
+        if postal_code.startswith("AD") and postal_code[2:].isdigit():
+            # Andorre postal codes: AD100 to AD700
+            return "99"
+        if len(postal_code) != 5 or not postal_code.isdigit():
+            return None
+        if postal_code.startswith("20"):
+            return self._postal_code_prefixes.get(postal_code[:3])
+        return self._postal_code_prefixes.get(postal_code[:2])
+
+    def from_insee_code(self, insee_code):
+        """Return the department of an INSEE code of a commune."""
+        insee_code = str(insee_code).strip().upper()
+        if len(insee_code) != 5:
+            return None
+        if insee_code == INSEE_CODE_ANDORRE:
+            return "99"
+        return self._insee_code_prefixes.get(insee_code[:2])
+
+    def from_coordinates(self, latitude, longitude):
+        """Return the department of a location (WGS84 latitude and longitude)."""
+        # Comparisons with NaN are always False: NaN is out of the grid too.
+        if not (
+            self.GRID_LATITUDE_RANGE[0] <= latitude < self.GRID_LATITUDE_RANGE[1]
+            and self.GRID_LONGITUDE_RANGE[0] <= longitude < self.GRID_LONGITUDE_RANGE[1]
+        ):
+            return None
+        row = int((latitude - self.GRID_LATITUDE_RANGE[0]) // self._cell_size)
+        column = int((longitude - self.GRID_LONGITUDE_RANGE[0]) // self._cell_size)
+        candidates = self._grid[row * self._columns + column]
+
+        for department, polygon in candidates:
+            if _point_in_polygon(polygon, latitude, longitude):
+                return department
+
+        nearest = None
+        nearest_distance = self._max_distance
+        for department, polygon in candidates:
+            distance = _distance_to_polygon(polygon, latitude, longitude)
+            if distance <= nearest_distance:
+                nearest, nearest_distance = department, distance
+        return nearest
+
+    def resolve_many(self, locations, kind="postal_code"):
+        """Return the list of departments of a list of locations.
+
+        'kind' can be 'postal_code', 'insee_code' or 'coordinates'. For
+        coordinates, locations are (latitude, longitude) tuples.
+        """
+        if kind == "postal_code":
+            return [self.from_postal_code(location) for location in locations]
+        if kind == "insee_code":
+            return [self.from_insee_code(location) for location in locations]
+        if kind == "coordinates":
+            from_coordinates = self.from_coordinates
+            return [from_coordinates(*location) for location in locations]
+        raise ValueError(
+            "kind of resolve_many() only method accept 'postal_code', 'insee_code' "
+            "or 'coordinates' values. Used value: {}".format(kind)
+        )
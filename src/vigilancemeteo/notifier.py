@@ -0,0 +1,292 @@
+# coding: utf-8
+"""Implement a class to notify the subscribers of the weather alert escalations."""
+import sys
+import threading
+import time
+
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import ALERT_COLOR_LIST, ALERT_TYPE_LIST
+from vigilancemeteo.fork import reinit_after_fork
+
+# Manage differences beetween python 2.7 and 3.6
+if sys.version_info < (3, 0):
+    from Queue import Queue  # pylint: disable=import-error
+else:
+    from queue import Queue
+
+
+class AlertNotifier(object):
+    """Class to send notifications when the alerts of a department escalate.
+
+    The notifier is fed with the bulletin snapshots published by the proxy.
+    The subscribers are grouped by (department, alert type, color): the message
+    of a group is rendered once and sent by batches of subscribers. The batches
+    are sent concurrently by 'workers' threads with 'send(subscribers, message)'
+    which raises an exception on failure. A failing batch is retried 'retries'
+    times, waiting 'retry_delay' seconds (doubled at each retry).
+
+    A subscriber is notified once per alert type and color: the same alert in
+    the next bulletins is not sent again, until the alert goes below the color
+    (an alert going down then up again is notified again).
+    Deliveries still failing after the retries are tried again with the next
+    bulletin. The subscriptions can be changed while the notifications are
+    sent: they are taken into account with the next bulletin.
+
+    Public attributes:
+    - min_color = lowest color notified
+
+    Public Methods:
+    - subscribe(subscriber, department, alert_types): notify a subscriber (any
+      hashable value, like an URL or a device token) of the alerts of a
+      department (all alert types by default).
+    - unsubscribe(subscriber, department): stop notifying a subscriber (for all
+      departments by default).
+    - notify(snapshot): send the notifications of a bulletin snapshot and return
+      a report.
+    - update(proxy, bulletin): notify the latest snapshot of a proxy.
+    - render(department, alert_type, color): return the message of a group.
+    """
+
+    def __init__(
+        self,
+        send,
+        workers=8,
+        batch_size=100,
+        retries=2,
+        retry_delay=0.5,
+        min_color="Jaune",
+    ):
+        """Class instance constructor."""
+        if min_color not in ALERT_COLOR_LIST:
+            raise ValueError(
+                "min_color parameter have to be in {}. Used value: {}".format(
+                    ALERT_COLOR_LIST, min_color
+                )
+            )
+        self._send = send
+        self._workers = workers
+        self._batch_size = batch_size
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self.min_color = min_color
+        self._min_color_index = ALERT_COLOR_LIST.index(min_color)
+        # _lock protects the subscriptions, _dispatch_lock serializes notify()
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()
+        # Alert type indices of each subscriber of each department
+        self._subscriptions = {}
+        # Color delivered to each subscriber for each (department, alert type)
+        self._delivered = {}
+        reinit_after_fork(self)
+
+    def _after_fork_in_child(self):
+        """Reinitialize the locks in a forked process (they may be held)."""
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()
+
+    def subscribe(self, subscriber, department, alert_types=None):
+        """Notify a subscriber of the alerts of a department."""
+        if department not in MATRIX_DEPARTMENT_LIST:
+            raise ValueError(
+                "Department parameter have to be a 2 characters string"
+                "between '01' and '95' or '2A' or '2B' or '99'."
+                "Used value: {}".format(department)
+            )
+        if alert_types is None:
+            alert_types = ALERT_TYPE_LIST
+        type_indices = []
+        for alert_type in alert_types:
+            if alert_type not in ALERT_TYPE_LIST:
+                raise ValueError(
+                    "alert_types parameter have to be in {}. Used value: {}".format(
+                        ALERT_TYPE_LIST, alert_type
+                    )
+                )
+            type_indices.append(ALERT_TYPE_LIST.index(alert_type))
+        with self._lock:
+            self._subscriptions.setdefault(department, {})[subscriber] = frozenset(
+                type_indices
+            )
+
+    def unsubscribe(self, subscriber, department=None):
+        """Stop notifying a subscriber (for all departments by default)."""
+        with self._lock:
+            if department is None:
+                departments = list(self._subscriptions)
+            else:
+                departments = [department]
+            for subscribed_department in departments:
+                subscribers = self._subscriptions.get(subscribed_department, {})
+                subscribers.pop(subscriber, None)
+                if not subscribers:
+                    self._subscriptions.pop(subscribed_department, None)
+                # Forget the deliveries: a new subscription is notified again
+                for alert_type in range(len(ALERT_TYPE_LIST)):
+                    key = (subscribed_department, alert_type)
+                    delivered = self._delivered.get(key, {})
+                    delivered.pop(subscriber, None)
+                    if not delivered:
+                        self._delivered.pop(key, None)
+
+    def render(self, department, alert_type, color):
+        """Return the message of a group (a dictionary with a 'text' key).
+
+        The message is shared by all the subscribers of the group.
+        """
+        return {
+            "department": department,
+            "alert_type": alert_type,
+            "color": color,
+            "text": "Alerte météo {} en cours :\n - {}: {}".format(
+                color, alert_type, color
+            ),
+        }
+
+    def _group_subscribers(self, color_matrix):
+        """Return the subscribers to notify for each (department, type, color).
+
+        The colors delivered for the alerts below the minimal color are
+        forgotten and the colors delivered above the current color are lowered
+        to it, so the alert is notified again when it goes up. The number of
+        already notified subscribers is returned too.
+        """
+        type_count = len(ALERT_TYPE_LIST)
+        groups = {}
+        duplicates = 0
+        for department, subscribers in self._subscriptions.items():
+            offset = MATRIX_DEPARTMENT_LIST.index(department) * type_count
+            for alert_type in range(type_count):
+                color = color_matrix[offset + alert_type]
+                key = (department, alert_type)
+                if color < self._min_color_index:
+                    self._delivered.pop(key, None)
+                    continue
+                delivered = self._delivered.get(key, {})
+                recipients = []
+                for subscriber, type_indices in subscribers.items():
+                    if alert_type not in type_indices:
+                        continue
+                    delivered_color = delivered.get(subscriber, -1)
+                    if delivered_color >= color:
+                        duplicates += 1
+                        if delivered_color > color:
+                            delivered[subscriber] = color
+                    else:
+                        recipients.append(subscriber)
+                if recipients:
+                    groups[(department, alert_type, color)] = recipients
+        return groups, duplicates
+
+    def _deliver(self, subscribers, message):
+        """Send a batch, retrying on failure. Return True if sent."""
+        delay = self._retry_delay
+        for attempt in range(self._retries + 1):
+            try:
+                self._send(subscribers, message)
+                return True
+            except Exception:  # pylint: disable=broad-except
+                if attempt < self._retries:
+                    time.sleep(delay)
+                    delay *= 2
+        return False
+
+    def notify(self, snapshot):
+        """Send the notifications of a bulletin snapshot.
+
+        Return a report dictionary with the number of groups, the number of
+        batches sent and failed, the number of subscribers notified and the
+        number of subscribers skipped because already notified.
+        The subscriptions are only locked to group the subscribers and to
+        record the deliveries, not while the batches are sent.
+        """
+        with self._dispatch_lock:
+            with self._lock:
+                groups, duplicates = self._group_subscribers(
+                    snapshot.alerts.color_matrix
+                )
+
+            batches = Queue()
+            for (department, alert_type, color), recipients in groups.items():
+                message = self.render(
+                    department, ALERT_TYPE_LIST[alert_type], ALERT_COLOR_LIST[color]
+                )
+                for start in range(0, len(recipients), self._batch_size):
+                    batches.put(
+                        (
+                            (department, alert_type),
+                            color,
+                            recipients[start : start + self._batch_size],
+                            message,
+                        )
+                    )
+
+            report = {
+                "groups": len(groups),
+                "batches": batches.qsize(),
+                "failures": 0,
+                "notified": 0,
+                "duplicates": duplicates,
+            }
+            sent_batches = []
+            report_lock = threading.Lock()
+
+            def worker():
+                """Send the batches until the queue is empty."""
+                while True:
+                    with report_lock:
+                        if batches.empty():
+                            return
+                        key, color, recipients, message = batches.get()
+                    sent = self._deliver(recipients, message)
+                    with report_lock:
+                        if not sent:
+                            report["failures"] += 1
+                            continue
+                        report["notified"] += len(recipients)
+                        sent_batches.append((key, color, recipients))
+
+            threads = [
+                threading.Thread(target=worker)
+                for _ in range(min(self._workers, report["batches"]))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            with self._lock:
+                for key, color, recipients in sent_batches:
+                    delivered = self._delivered.setdefault(key, {})
+                    for subscriber in recipients:
+                        delivered[subscriber] = color
+            return report
+
+    def update(self, proxy, bulletin=None):
+        """Notify the latest snapshot of a proxy (first bulletin by default)."""
+        return self.notify(proxy.get_snapshot(bulletin))
+
+
+class MemorySink(object):
+    """Class to collect the notifications locally, to test an AlertNotifier.
+
+    The sink is the 'send' function of the notifier. The first 'failures' calls
+    raise an IOError.
+
+    Public attributes:
+    - deliveries = list of the (subscribers, message) received
+    - calls = number of calls, failures included
+    """
+
+    def __init__(self, failures=0):
+        """Class instance constructor."""
+        self._failures = failures
+        self._lock = threading.Lock()
+        self.deliveries = []
+        self.calls = 0
+
+    def __call__(self, subscribers, message):
+        with self._lock:
+            self.calls += 1
+            if self.calls <= self._failures:
+                raise IOError("Error: local sink failure")
+            self.deliveries.append((list(subscribers), message))
@@ -0,0 +1,161 @@
+# coding: utf-8
+"""Implement a class to profile the next calls of the proxy."""
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from datetime import datetime
+
+from vigilancemeteo.fork import reinit_after_fork
+
+# Functions measured in the reports: stage name, file name and function name
+STAGES = [
+    ("checksum", "vigilance_proxy.py", "_fetch_checksum"),
+    ("download", "vigilance_proxy.py", "_download_bulletins"),
+    ("publish", "engine.py", "payloads_received"),
+    ("parse", "engine.py", "parse_payload"),
+    ("query", "bulletin.py", "get_alert_list"),
+]
+
+
+class _ProfilingLock(object):
+    """Lock held while a call is profiled: one cProfile profiler per process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        reinit_after_fork(self)
+
+    def _after_fork_in_child(self):
+        """Reinitialize the lock in a forked process (it may be held)."""
+        self.lock = threading.Lock()
+
+
+_profiling = _ProfilingLock()
+
+
+class Profiler(object):
+    """Class to record the next calls of the proxy with cProfile and tracemalloc.
+
+    The next 'calls' calls to update_data() and get_alert_list() are profiled
+    and a JSON report is appended to the 'path' file for each of them (one line
+    per call). A report gives the duration of the call, the time spent in each
+    stage of STAGES, the 'top' functions with the highest cumulative time and,
+    if 'memory' is True, the peak and retained memory with the 'top' allocation
+    lines (tracemalloc, python 3.4+).
+
+    Only one call is profiled at a time in the process, whatever the profiler:
+    the calls running concurrently, nested in a profiled call, or made while
+    another tool profiles the process (python 3.12+), are not recorded.
+
+    Public attributes:
+    - path = file where the reports are written
+    - remaining = number of calls still to record
+
+    Public Methods:
+    - run(call, function, *args): call function(*args), profiled if calls
+      remain to record.
+    """
+
+    def __init__(self, path, calls=10, memory=False, top=20):
+        """Class instance constructor."""
+        self.path = path
+        self.remaining = calls
+        self._memory = memory
+        self._top = top
+
+    def run(self, call, function, *args):
+        """Return function(*args), profiled if calls remain to record."""
+        if self.remaining <= 0 or not _profiling.lock.acquire(False):
+            return function(*args)
+        try:
+            if self.remaining <= 0:
+                return function(*args)
+            return self._profile(call, function, args)
+        finally:
+            _profiling.lock.release()
+
+    def _profile(self, call, function, args):
+        """Call function(*args) with the profilers and write the report."""
+        tracemalloc = None
+        if self._memory:
+            import tracemalloc  # pylint: disable=import-outside-toplevel
+
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            memory_start = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            snapshot_start = tracemalloc.take_snapshot()
+
+        report = {"call": call, "start": datetime.now().isoformat()}
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another tool profiles the process: the call is not recorded
+            if tracemalloc is not None and started_tracing:
+                tracemalloc.stop()
+            return function(*args)
+        self.remaining -= 1
+        start = time.time()
+        try:
+            return function(*args)
+        except Exception as error:
+            report["error"] = repr(error)
+            raise
+        finally:
+            profile.disable()
+            report["duration"] = time.time() - start
+            if tracemalloc is not None:
+                memory_end, memory_peak = tracemalloc.get_traced_memory()
+                snapshot_end = tracemalloc.take_snapshot()
+                if started_tracing:
+                    tracemalloc.stop()
+                report["memory"] = {
+                    "retained": memory_end - memory_start,
+                    "peak": memory_peak - memory_start,
+                    "top": [
+                        {
+                            "location": str(statistic.traceback),
+                            "size": statistic.size_diff,
+                            "count": statistic.count_diff,
+                        }
+                        for statistic in snapshot_end.compare_to(
+                            snapshot_start, "lineno"
+                        )[: self._top]
+                    ],
+                }
+            report.update(self._cpu_report(profile))
+            self._write(report)
+
+    def _cpu_report(self, profile):
+        """Return the stages and the top functions of a profile."""
+        stats = pstats.Stats(profile).stats
+        stages = {}
+        for (file_name, _, function_name), values in stats.items():
+            for stage, stage_file_name, stage_function_name in STAGES:
+                if function_name == stage_function_name and (
+                    os.path.basename(file_name) == stage_file_name
+                ):
+                    stages[stage] = stages.get(stage, 0) + values[3]
+        functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+        return {
+            "stages": stages,
+            "functions": [
+                {
+                    "function": "{}:{}({})".format(*function),
+                    "calls": values[1],
+                    "total_time": values[2],
+                    "cumulative_time": values[3],
+                }
+                for function, values in functions[: self._top]
+            ],
+        }
+
+    def _write(self, report):
+        """Append a report to the file."""
+        with open(self.path, "a") as report_file:
+            report_file.write(json.dumps(report, sort_keys=True) + "\n")
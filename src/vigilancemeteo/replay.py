@@ -0,0 +1,244 @@
+# coding: utf-8
+"""Replay recorded bulletins through the proxy faster than real time.
+
+Run it with: python -m vigilancemeteo.replay --help
+"""
+import argparse
+import glob
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+import zlib
+from datetime import timedelta
+
+from lxml import etree
+from pytz import timezone
+
+from vigilancemeteo.bulletin import extract_bulletin_date
+from vigilancemeteo.coordination import CHECKSUM_FILE_NAME, ZIP_FILE_NAME
+from vigilancemeteo.engine import BulletinEngine, VigilanceMeteoError
+from vigilancemeteo.sources import BulletinSource
+from vigilancemeteo.vigilance_proxy import VigilanceMeteoFranceProxy
+
+XML_FILE_NAME = "NXFR33_LFPW_.xml"
+
+# Default delay between two polls in simulated seconds. The proxy downloads the
+# checksum file again only after more than 60 seconds (BulletinEngine
+# CHECKSUM_CACHE_DELAY): with a shorter or equal delay some polls are cached.
+DEFAULT_POLL_INTERVAL = BulletinEngine.CHECKSUM_CACHE_DELAY.total_seconds() + 1
+
+
+class ReplayClock(object):
+    """Class to simulate the clock of a replay.
+
+    The clock is a function returning the simulated date and time (with
+    timezone). The time only changes when the replay moves it.
+
+    Public attributes:
+    - now = simulated date and time
+    """
+
+    def __init__(self, now=None):
+        """Class instance constructor."""
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Move the simulated time forward."""
+        self.now = self.now + timedelta(seconds=seconds)
+
+
+class BulletinReplay(object):
+    """Class to replay a directory of recorded XML bulletins through a proxy.
+
+    The bulletins are published in the order of their date. Between two
+    bulletins, the proxy is polled every 'poll_interval' simulated seconds, so
+    all the status and diff machinery of the proxy is used. The simulated time
+    runs 'speedup' times faster than real time, or as fast as possible if
+    'speedup' is None. With a 'poll_interval' of 60 seconds or less, some polls
+    use the cached checksum file (UPDATE_STATUS_CHECKSUM_CACHED_60S).
+
+    A recorded bulletin can come with its checksum file and its compressed data
+    source, with the same name and the '.txt' and '.zip' extensions. Else they
+    are computed from the bulletin. Without a recorded compressed data source,
+    the size advertised in a recorded checksum file is replaced by the size of
+    the computed one.
+
+    Public attributes:
+    - recordings = list of (bulletin date, XML file path) in replay order
+    - clock = simulated clock (ReplayClock) to give to the proxies
+    - directory = directory where the current files are published
+
+    Public Methods:
+    - source(): return the BulletinSource of the current files.
+    - proxy(**options): return a VigilanceMeteoFranceProxy using the replay.
+    - run(proxy, callback): replay all the bulletins and return a report.
+    """
+
+    def __init__(
+        self, recordings_directory, speedup=None, poll_interval=DEFAULT_POLL_INTERVAL
+    ):
+        """Class instance constructor."""
+        self._speedup = speedup
+        self._poll_interval = poll_interval
+        self.recordings = sorted(
+            (self._read_bulletin_date(path), path)
+            for path in glob.glob(os.path.join(recordings_directory, "*.xml"))
+        )
+        if not self.recordings:
+            raise ValueError(
+                "Error: no XML bulletin in {}".format(recordings_directory)
+            )
+        self.clock = ReplayClock(self.recordings[0][0])
+        self.directory = tempfile.mkdtemp(prefix="vigilancemeteo-replay-")
+
+    @staticmethod
+    def _read_bulletin_date(path):
+        """Return the date of a recorded bulletin with UTC timezone."""
+        return extract_bulletin_date(etree.parse(path)).astimezone(timezone("UTC"))
+
+    def source(self):
+        """Return the BulletinSource of the current files."""
+        url = "file:" + os.path.abspath(self.directory) + "/"
+        return BulletinSource(
+            "replay",
+            url + CHECKSUM_FILE_NAME,
+            os.path.join(self.directory, XML_FILE_NAME),
+            url + ZIP_FILE_NAME,
+        )
+
+    def proxy(self, **options):
+        """Return a VigilanceMeteoFranceProxy using the replay source and clock."""
+        return VigilanceMeteoFranceProxy(
+            sources=[self.source()], clock=self.clock, **options
+        )
+
+    def _publish(self, path):
+        """Publish a recorded bulletin as the current files."""
+        with open(path, "rb") as xml_file:
+            xml = xml_file.read()
+        zip_path = os.path.splitext(path)[0] + ".zip"
+        if os.path.isfile(zip_path):
+            with open(zip_path, "rb") as zip_file:
+                archive = zip_file.read()
+        else:
+            archive = io.BytesIO()
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                zip_file.writestr(XML_FILE_NAME, xml)
+            archive = archive.getvalue()
+
+        checksum_path = os.path.splitext(path)[0] + ".txt"
+        if os.path.isfile(checksum_path):
+            with open(checksum_path, "rb") as checksum_file:
+                control = checksum_file.read()
+            if not os.path.isfile(zip_path):
+                # Advertise the size of the computed compressed data source
+                control = re.sub(
+                    br"(\n\S+\s+)\d+(\s)",
+                    lambda match: match.group(1)
+                    + str(len(archive)).encode("utf-8")
+                    + match.group(2),
+                    control,
+                    count=1,
+                )
+        else:
+            control = "{}\n{} {} {}\n".format(
+                self.clock.now.strftime("%a %b %d %H:%M:%S %Y"),
+                zlib.crc32(xml) & 0xFFFFFFFF,
+                len(archive),
+                ZIP_FILE_NAME,
+            ).encode("utf-8")
+
+        for file_name, content in [
+            (XML_FILE_NAME, xml),
+            (ZIP_FILE_NAME, archive),
+            (CHECKSUM_FILE_NAME, control),
+        ]:
+            with open(os.path.join(self.directory, file_name), "wb") as output:
+                output.write(content)
+
+    def _wait(self, real_start, simulated_start):
+        """Sleep until the real time catches up with the simulated time."""
+        if self._speedup is None:
+            return
+        simulated_elapsed = (self.clock.now - simulated_start).total_seconds()
+        delay = simulated_elapsed / self._speedup - (time.time() - real_start)
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self, proxy, callback=None):
+        """Replay all the bulletins through a proxy and return a report.
+
+        'callback(proxy)' is called after each poll, for example to update the
+        consumers to measure. The report is a dictionary with the number of
+        bulletins and polls, the number of polls of each status, the simulated
+        and real durations in seconds and the polls per real second.
+        """
+        real_start = time.time()
+        simulated_start = self.recordings[0][0]
+        statuses = {}
+        polls = 0
+        for index, (bulletin_date, path) in enumerate(self.recordings):
+            self.clock.now = max(bulletin_date, self.clock.now)
+            self._publish(path)
+            if index + 1 < len(self.recordings):
+                next_date = self.recordings[index + 1][0]
+            else:
+                next_date = self.clock.now + timedelta(seconds=self._poll_interval)
+
+            while self.clock.now < next_date:
+                self._wait(real_start, simulated_start)
+                try:
+                    proxy.update_data()
+                except VigilanceMeteoError:
+                    pass
+                statuses[proxy.status] = statuses.get(proxy.status, 0) + 1
+                polls += 1
+                if callback is not None:
+                    callback(proxy)
+                self.clock.advance(self._poll_interval)
+
+        real_duration = time.time() - real_start
+        return {
+            "bulletins": len(self.recordings),
+            "polls": polls,
+            "statuses": statuses,
+            "simulated_duration": (self.clock.now - simulated_start).total_seconds(),
+            "real_duration": real_duration,
+            "polls_per_second": polls / real_duration if real_duration else None,
+        }
+
+    def close(self):
+        """Delete the directory of the current files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def main(argv=None):
+    """Replay a directory of recorded bulletins and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="directory of the recorded XML bulletins")
+    parser.add_argument("--speedup", type=float, default=None)
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL)
+    parser.add_argument("--compressed", action="store_true")
+    args = parser.parse_args(argv)
+
+    with BulletinReplay(args.directory, args.speedup, args.poll_interval) as replay:
+        report = replay.run(replay.proxy(compressed=args.compressed))
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
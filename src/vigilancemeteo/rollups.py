@@ -0,0 +1,105 @@
+# coding: utf-8
+"""Functions to synthesize the alerts at national, regional and coastal level."""
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import (
+    ALERT_COLOR_LIST,
+    ALERT_TYPE_LIST,
+    COASTAL_DEPARTMENT_LIST,
+    REGION_DEPARTMENTS,
+)
+
+# Name of the national and coastal groups of departments
+NATIONAL = "national"
+COASTAL = "coastal"
+
+
+def _build_row_groups():
+    """Return for each row of the color matrix the list of its groups.
+
+    Groups are NATIONAL, COASTAL and the regions. Andorre (99) is in no group.
+    """
+    department_regions = {}
+    for region, departments in REGION_DEPARTMENTS.items():
+        for department in departments:
+            department_regions[department] = region
+
+    row_groups = []
+    for department in MATRIX_DEPARTMENT_LIST:
+        groups = []
+        if department in department_regions:
+            groups.extend([NATIONAL, department_regions[department]])
+        if department in COASTAL_DEPARTMENT_LIST:
+            groups.append(COASTAL)
+        row_groups.append(groups)
+    return row_groups
+
+
+# Groups of each row of the color matrix
+ROW_GROUPS = _build_row_groups()
+
+
+def compute_rollups(color_matrix):
+    """Return the synthesis of a color matrix (see build_color_matrix()).
+
+    The result is a dictionary with 3 keys:
+    - 'national': synthesis of all french departments
+    - 'coastal': synthesis of the departments of COASTAL_DEPARTMENT_LIST
+    - 'regions': dictionary with the synthesis of each region
+
+    A synthesis is a dictionary with:
+    - 'departments': number of departments
+    - 'counts': for each alert type, the number of departments at each color
+    - 'max': for each alert type, the most critical color
+    - 'color': the most critical color of all alert types
+    """
+    type_count = len(ALERT_TYPE_LIST)
+    color_count = len(ALERT_COLOR_LIST)
+
+    # Count the departments of each group at each (alert type, color) in a
+    # single pass on the matrix.
+    counters = {}
+    sizes = {}
+    for row, groups in enumerate(ROW_GROUPS):
+        offset = row * type_count
+        cells = [
+            alert_type * color_count + color
+            for alert_type, color in enumerate(
+                color_matrix[offset : offset + type_count]
+            )
+        ]
+        for group in groups:
+            counter = counters.get(group)
+            if counter is None:
+                counter = counters[group] = [0] * (type_count * color_count)
+                sizes[group] = 0
+            sizes[group] += 1
+            for cell in cells:
+                counter[cell] += 1
+
+    syntheses = {}
+    for group, counter in counters.items():
+        counts = {}
+        maxima = {}
+        worst_color = 0
+        for alert_type_index, alert_type in enumerate(ALERT_TYPE_LIST):
+            type_counts = counter[
+                alert_type_index * color_count : (alert_type_index + 1) * color_count
+            ]
+            counts[alert_type] = dict(zip(ALERT_COLOR_LIST, type_counts))
+            max_color = max(
+                color for color, count in enumerate(type_counts) if count > 0
+            )
+            maxima[alert_type] = ALERT_COLOR_LIST[max_color]
+            worst_color = max(worst_color, max_color)
+        syntheses[group] = {
+            "departments": sizes[group],
+            "counts": counts,
+            "max": maxima,
+            "color": ALERT_COLOR_LIST[worst_color],
+        }
+
+    return {
+        NATIONAL: syntheses.pop(NATIONAL),
+        COASTAL: syntheses.pop(COASTAL),
+        "regions": syntheses,
+    }
@@ -0,0 +1,157 @@
+# coding: utf-8
+"""Implement the data sources and the hedged requests used by the proxy."""
+import sys
+import threading
+import time
+from collections import deque
+
+from vigilancemeteo.constants import BULLETIN_TODAY
+from vigilancemeteo.fork import reinit_after_fork
+
+# Manage differences beetween python 2.7 and 3.6
+if sys.version_info < (3, 0):
+    from Queue import Empty, Queue  # pylint: disable=import-error
+else:
+    from queue import Empty, Queue
+
+
+class BulletinSource(object):
+    """Class to describe where the weather alert bulletin can be downloaded.
+
+    Public attributes:
+    - name = name of the source (recorded when the source wins a request)
+    - checksum_url = URL of the checksum file (vigilance_controle.txt)
+    - xml_url = URL of the XML bulletin, or dictionary with the URL of each
+      bulletin name (BULLETIN_TODAY, BULLETIN_TOMORROW)
+    - zip_url = URL of the compressed data source (vigilance.zip)
+    """
+
+    def __init__(self, name, checksum_url, xml_url, zip_url=None):
+        """Class instance constructor."""
+        self.name = name
+        self.checksum_url = checksum_url
+        self.xml_url = xml_url
+        self.zip_url = zip_url
+
+    def __repr__(self):
+        """Instance representation"""
+        return "BulletinSource('{}')".format(self.name)
+
+    def xml_url_for(self, bulletin):
+        """Return the URL of the XML file of a bulletin (None if unknown)."""
+        if isinstance(self.xml_url, dict):
+            return self.xml_url.get(bulletin)
+        if bulletin == BULLETIN_TODAY:
+            return self.xml_url
+        return None
+
+
+class HedgedFetcher(object):
+    """Class to fetch a resource from an ordered list of sources.
+
+    The first source is requested first. If it doesn't answer before the hedge
+    delay, the next source is requested too, and so on. A failing source
+    triggers immediately the request to the next one. The first valid answer
+    wins and the other requests are ignored.
+
+    The hedge delay is 'hedge_delay' seconds until 'min_samples' latencies are
+    known. Then it's the 'hedge_percentile' percentile of the latest latencies.
+
+    Public attributes:
+    - hedge_delay = current delay before sending the next request
+    - wins = number of requests won by each source name
+    - hedged_requests = number of requests sent because of a slow source
+
+    Public Methods:
+    - fetch(sources, fetch_function): return the source which answered first and
+      the result of fetch_function(source).
+    """
+
+    def __init__(
+        self, hedge_percentile=95, hedge_delay=1.0, min_samples=10, history_size=100
+    ):
+        """Class instance constructor."""
+        self._hedge_percentile = hedge_percentile
+        self._initial_hedge_delay = hedge_delay
+        self._min_samples = min_samples
+        self._latencies = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self.wins = {}
+        self.hedged_requests = 0
+        reinit_after_fork(self)
+
+    def _after_fork_in_child(self):
+        """Reinitialize the lock in a forked process (it may be held)."""
+        self._lock = threading.Lock()
+
+    @property
+    def hedge_delay(self):
+        """Delay in seconds before sending a request to the next source."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self._min_samples:
+            return self._initial_hedge_delay
+        index = int(round(self._hedge_percentile / 100.0 * (len(latencies) - 1)))
+        return latencies[index]
+
+    def _record(self, source, latency):
+        """Record the latency of a successful request."""
+        with self._lock:
+            self._latencies.append(latency)
+            self.wins[source.name] = self.wins.get(source.name, 0) + 1
+
+    def fetch(self, sources, fetch_function):
+        """Return the first valid (source, fetch_function(source)) answer.
+
+        A request is valid if fetch_function doesn't raise an exception. If all
+        the sources fail, the error of the latest one is raised.
+        """
+        if len(sources) == 1:
+            # Nothing to hedge
+            start = time.time()
+            result = fetch_function(sources[0])
+            self._record(sources[0], time.time() - start)
+            return sources[0], result
+
+        answers = Queue()
+
+        def request(source):
+            """Send the request to a source and post the answer."""
+            start = time.time()
+            try:
+                answers.put((source, fetch_function(source), None, time.time() - start))
+            except Exception as error:  # pylint: disable=broad-except
+                answers.put((source, None, error, None))
+
+        hedge_delay = self.hedge_delay
+        pending = list(sources)
+        running = 0
+        launch_next = True
+        while True:
+            if launch_next and pending:
+                thread = threading.Thread(target=request, args=(pending.pop(0),))
+                thread.daemon = True
+                thread.start()
+                if running > 0:
+                    with self._lock:
+                        self.hedged_requests += 1
+                running += 1
+                launch_next = False
+
+            try:
+                source, result, error, latency = answers.get(
+                    timeout=hedge_delay if pending else None
+                )
+            except Empty:
+                # Running requests are too slow, hedge with the next source.
+                launch_next = True
+                continue
+
+            running -= 1
+            if error is None:
+                self._record(source, latency)
+                return source, result
+            if running == 0 and not pending:
+                raise error
+            # Replace the failing request by a request to the next source.
+            launch_next = True
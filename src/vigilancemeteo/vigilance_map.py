@@ -0,0 +1,284 @@
+# coding: utf-8
+"""Functions to render the weather alerts as a GeoJSON or SVG map.
+
+The departments are drawn with their simplified polygons (DEPARTMENT_POLYGONS).
+The coastal zone of a coastal department (department followed by '10' in the
+bulletin) is an offshore strip along its coast (DEPARTMENT_COASTS), drawn
+under the departments as its inner side follows the simplified coast. The
+geometry is computed once per process and the maps once per bulletin alerts.
+"""
+import json
+import threading
+
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import (
+    ALERT_COLOR_LIST,
+    ALERT_TYPE_LIST,
+    COASTAL_DEPARTMENT_LIST,
+)
+from vigilancemeteo.fork import reinit_after_fork
+from vigilancemeteo.location import LONGITUDE_SCALE
+
+# Output formats of render_map()
+MAP_GEOJSON = "geojson"
+MAP_SVG = "svg"
+
+# Fill color of each alert color in the SVG map
+SVG_COLORS = {
+    "Vert": "#31aa35",
+    "Jaune": "#fff600",
+    "Orange": "#ffb82b",
+    "Rouge": "#cc0000",
+}
+
+# Width of the offshore strip of the coastal zones in degrees
+COASTAL_STRIP_WIDTH = 0.1
+
+# Width of the SVG map in pixels
+SVG_WIDTH = 800
+
+
+class _GeometryCache(object):
+    """Geometry of the map, computed once per process."""
+
+    def __init__(self):
+        self.zones = []
+        self.lock = threading.Lock()
+        reinit_after_fork(self)
+
+    def _after_fork_in_child(self):
+        """Reinitialize the lock in a forked process (it may be held)."""
+        self.lock = threading.Lock()
+
+
+_geometry = _GeometryCache()
+
+
+def _to_plane(outline):
+    """Convert (latitude, longitude) points to a plane where distances are in degrees."""
+    return [(longitude * LONGITUDE_SCALE, latitude) for latitude, longitude in outline]
+
+
+def _signed_area(polygon):
+    """Return the signed area of a polygon (positive if counterclockwise)."""
+    return (
+        sum(
+            polygon[index - 1][0] * point[1] - point[0] * polygon[index - 1][1]
+            for index, point in enumerate(polygon)
+        )
+        / 2
+    )
+
+
+def _simplify(line, tolerance):
+    """Return the points of a line kept by the Douglas-Peucker algorithm."""
+    (start_x, start_y), (end_x, end_y) = line[0], line[-1]
+    length = ((end_x - start_x) ** 2 + (end_y - start_y) ** 2) ** 0.5
+    farthest, farthest_distance = 0, 0
+    for index in range(1, len(line) - 1):
+        point_x, point_y = line[index]
+        if length:
+            distance = (
+                abs(
+                    (end_x - start_x) * (start_y - point_y)
+                    - (start_x - point_x) * (end_y - start_y)
+                )
+                / length
+            )
+        else:
+            distance = ((point_x - start_x) ** 2 + (point_y - start_y) ** 2) ** 0.5
+        if distance > farthest_distance:
+            farthest, farthest_distance = index, distance
+    if farthest_distance <= tolerance:
+        return [line[0], line[-1]]
+    return (
+        _simplify(line[: farthest + 1], tolerance)[:-1]
+        + _simplify(line[farthest:], tolerance)
+    )
+
+
+def _offshore_strip(outline, first, last):
+    """Return the strip along the coast from outline[first] to outline[last].
+
+    The strip follows the coast simplified to half its width, so it doesn't loop
+    in the bays and the estuaries: its inner side can overlap the department.
+    """
+    orientation = 1 if _signed_area(outline) > 0 else -1
+    count = len(outline)
+    coast = [outline[index % count] for index in range(first, last + 1)]
+    simplified = _simplify(coast, COASTAL_STRIP_WIDTH / 2)
+    offshore = []
+    for index, point in enumerate(simplified):
+        # Outward normal: average of the normals of the adjacent coast edges
+        normal_x = normal_y = 0
+        for start, end in [(index - 1, index), (index, index + 1)]:
+            if 0 <= start and end < len(simplified):
+                delta_x = simplified[end][0] - simplified[start][0]
+                delta_y = simplified[end][1] - simplified[start][1]
+                length = (delta_x ** 2 + delta_y ** 2) ** 0.5 or 1
+                normal_x += orientation * delta_y / length
+                normal_y -= orientation * delta_x / length
+        length = (normal_x ** 2 + normal_y ** 2) ** 0.5 or 1
+        offshore.append(
+            (
+                point[0] + COASTAL_STRIP_WIDTH * normal_x / length,
+                point[1] + COASTAL_STRIP_WIDTH * normal_y / length,
+            )
+        )
+    return simplified + offshore[::-1]
+
+
+def _build_geometry():
+    """Return the list of the map zones: (zone, department, polygons).
+
+    Polygons are lists of rings (outer ring followed by the holes) of
+    (longitude, latitude) points. The coastal zones come first.
+    """
+    # The geometry is large, it's only loaded when a map is rendered.
+    from vigilancemeteo import geography  # pylint: disable=import-outside-toplevel
+
+    zones = [("99", "99", [[_to_plane(geography.ANDORRE_OUTLINE)]])]
+    for department, polygons in geography.DEPARTMENT_POLYGONS.items():
+        polygons = [[_to_plane(ring) for ring in polygon] for polygon in polygons]
+        zones.append((department, department, polygons))
+        if department in COASTAL_DEPARTMENT_LIST:
+            # Strips along the coast of the mainland (or of Corsica) only
+            strips = [
+                [_offshore_strip(polygons[0][0], first, last)]
+                for polygon, first, last in geography.DEPARTMENT_COASTS[department]
+                if polygon == 0
+            ]
+            zones.append((department + "10", department, strips))
+
+    return [
+        (
+            zone,
+            department,
+            [
+                [[(x / LONGITUDE_SCALE, y) for x, y in ring] for ring in polygon]
+                for polygon in polygons
+            ],
+        )
+        for zone, department, polygons in sorted(
+            zones, key=lambda zone: (zone[0] == zone[1], zone[0])
+        )
+    ]
+
+
+def get_map_geometry():
+    """Return the list of the map zones: (zone, department, polygons).
+
+    The geometry is computed on first call only.
+    """
+    if not _geometry.zones:
+        with _geometry.lock:
+            if not _geometry.zones:
+                _geometry.zones = _build_geometry()
+    return _geometry.zones
+
+
+def _zone_colors(alerts, zone, department):
+    """Return the color index of each alert type of a map zone."""
+    if zone != department:
+        return alerts.get_zone_colors(zone)
+    row = MATRIX_DEPARTMENT_LIST.index(department) * len(ALERT_TYPE_LIST)
+    return list(alerts.color_matrix[row : row + len(ALERT_TYPE_LIST)])
+
+
+def _render_geojson(alerts):
+    """Return the GeoJSON map of the alerts as bytes."""
+    features = []
+    for zone, department, polygons in get_map_geometry():
+        colors = _zone_colors(alerts, zone, department)
+        coordinates = [
+            [
+                [[round(lon, 3), round(lat, 3)] for lon, lat in ring + ring[:1]]
+                for ring in polygon
+            ]
+            for polygon in polygons
+        ]
+        if len(coordinates) == 1:
+            geometry = {"type": "Polygon", "coordinates": coordinates[0]}
+        else:
+            geometry = {"type": "MultiPolygon", "coordinates": coordinates}
+        features.append(
+            {
+                "type": "Feature",
+                "id": zone,
+                "properties": {
+                    "zone": zone,
+                    "department": department,
+                    "coastal": zone != department,
+                    "color": ALERT_COLOR_LIST[max(colors)],
+                    "alerts": dict(
+                        (ALERT_TYPE_LIST[alert_type], ALERT_COLOR_LIST[color])
+                        for alert_type, color in enumerate(colors)
+                        if color > 0
+                    ),
+                },
+                "geometry": geometry,
+            }
+        )
+    return json.dumps(
+        {"type": "FeatureCollection", "features": features},
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _render_svg(alerts):
+    """Return the SVG map of the alerts as bytes."""
+    geometry = get_map_geometry()
+    points = [
+        _to_plane([(lat, lon)])[0]
+        for _, _, polygons in geometry
+        for polygon in polygons
+        for ring in polygon
+        for lon, lat in ring
+    ]
+    min_x = min(x for x, _ in points)
+    max_y = max(y for _, y in points)
+    scale = SVG_WIDTH / (max(x for x, _ in points) - min_x)
+    height = int(round((max_y - min(y for _, y in points)) * scale))
+
+    paths = []
+    for zone, department, polygons in geometry:
+        color = ALERT_COLOR_LIST[max(_zone_colors(alerts, zone, department))]
+        path = " ".join(
+            "M"
+            + " L".join(
+                "{:.1f},{:.1f}".format((x - min_x) * scale, (max_y - y) * scale)
+                for x, y in _to_plane([(lat, lon) for lon, lat in ring])
+            )
+            + " Z"
+            for polygon in polygons
+            for ring in polygon
+        )
+        paths.append(
+            '<path id="zone-{}" fill="{}" fill-rule="evenodd" d="{}">'
+            "<title>{}: {}</title></path>".format(
+                zone, SVG_COLORS[color], path, zone, color
+            )
+        )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{1}" '
+        'viewBox="0 0 {0} {1}" stroke="#ffffff" stroke-width="0.5">{2}</svg>'.format(
+            SVG_WIDTH, height, "".join(paths)
+        )
+    ).encode("utf-8")
+
+
+def render_map(alerts, output=MAP_GEOJSON):
+    """Return the map of the alerts of a bulletin (BulletinAlerts) as bytes.
+
+    'output' can be MAP_GEOJSON or MAP_SVG. The map is rendered once per
+    bulletin alerts: bulletins with the same alerts share it.
+    """
+    if output == MAP_GEOJSON:
+        return alerts.cached(("map", output), _render_geojson)
+    if output == MAP_SVG:
+        return alerts.cached(("map", output), _render_svg)
+    raise ValueError(
+        "output of render_map() only accept '{}' or '{}' values. "
+        "Used value: {}".format(MAP_GEOJSON, MAP_SVG, output)
+    )
@@ -1,24 +1,24 @@
 # coding: utf-8
 """Implement a class to communicate with Météofrance weather alerts website."""
-import re
+import io
 import sys
+import threading
+import zipfile
 from datetime import datetime
 
 from lxml import etree
 from pytz import timezone
 
-from vigilancemeteo.constants import (
-    ALERT_COLOR_LIST,
-    ALERT_TYPE_LIST,
-    COASTAL_DEPARTMENT_LIST,
-    UPDATE_STATUS_CHECKSUM_CACHED_60S,
-    UPDATE_STATUS_CHECKSUM_UPDATED,
-    UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED,
-    UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID,
-    UPDATE_STATUS_SAME_CHECKSUM,
-    UPDATE_STATUS_XML_UPDATED,
-    VALID_DEPARTMENT_LIST,
-)
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import BULLETIN_TODAY, BULLETIN_TOMORROW
+from vigilancemeteo.coordination import CHECKSUM_FILE_NAME, ZIP_FILE_NAME
+from vigilancemeteo.engine import BulletinEngine, VigilanceMeteoError, parse_checksum
+from vigilancemeteo.export import OUTPUT_ARRAY, export_alerts
+from vigilancemeteo.fork import freeze, reinit_after_fork
+from vigilancemeteo.profiling import Profiler
+from vigilancemeteo.rollups import compute_rollups
+from vigilancemeteo.sources import BulletinSource, HedgedFetcher
+from vigilancemeteo.vigilance_map import MAP_GEOJSON, render_map
 
 # Manage differences beetween python 2.7 and 3.6
 if sys.version_info < (3, 0):
@@ -27,30 +27,45 @@ else:
     from urllib.request import urlopen, URLError
 
 
-class VigilanceMeteoError(Exception):
-    """Error class, used when fetching or parsing vigilance.meteofrance.com website."""
-
-
 class VigilanceMeteoFranceProxy(object):
     """Class to manage the download of the data sources from MeteoFrance website.
     
     Data are fetch on vigilance.meteofrance.com website.
     
     Public attributes:
-    - xml_tree = XML representation of the weather alert bulletin
+    - xml_tree = XML representation of the weather alert bulletin (None if the
+      proxy is created with keep_xml_tree=False)
+    - snapshot = latest published version of the bulletin (BulletinSnapshot)
+    - snapshots = latest published version of each bulletin
+    - metadata = metadata of the weather alert bulletin (BulletinMetadata)
     - bulletin_date = Date of the bulletin (with timezone)
     - checksum = Checksum of the weather alert bulletin
     - status = current status of the proxy (possible value in constant.py)
+    - source = name of the source which provided the latest bulletin
+    - metrics = statistics about the requests sent to the sources
 
     Public Methods:
     - update_date(): Check if new information are available and download them if any.
-    - get_alert_list(department): of a given department return the list of the alerts.
+    - get_snapshot(bulletin): update data and return the latest published snapshot.
+    - get_alert_list(department, bulletin): of a given department return the list of
+      the alerts.
+    - get_rollups(bulletin): return the national, regional and coastal synthesis of
+      the alerts.
+    - get_departments_at_risk(alert_types, min_color, bulletin): return the
+      departments with an alert of one of the types at min_color or more.
+    - export_alerts(output, bulletin): return the alerts of the bulletin as typed
+      columns (see export.export_alerts()).
+    - get_map(output, bulletin): return the GeoJSON or SVG map of the alerts.
+    - preload(): load the bulletins before forking worker processes.
+    - start_profiling(path, calls, memory): profile the next calls of
+      update_data() and get_alert_list().
+    - stop_profiling(): stop profiling the calls.
  
     Private attributes:
-    - _xml_tree = XML representation of the weather alert bulletin
+    - _engine = state machine of the bulletins (BulletinEngine): the proxy only
+      downloads the files and reads the clock
     - _bulletin_date = Date of the bulletin (with timezone)
     - _latest_check_date = Date of the latest check if new bulletin is available
-    - _latest_checksum_value = Checksum of the weather alert bulletin
     """
 
     # URL used to fetch data on Météo France website.
@@ -59,175 +74,485 @@ class VigilanceMeteoFranceProxy(object):
     )
     # URL_VIGILANCE_METEO_XML = "./tests/NXFR33_LFPW_.xml" #for local tests.
 
+    # URL used to fetch the next day bulletin on Météo France website.
+    URL_VIGILANCE_METEO_XML_TOMORROW = (
+        "http://vigilance.meteofrance.com" "/data/NXFR34_LFPW_.xml"
+    )
+
     # URL used to check if there were any updates since last check
     URL_VIGILANCE_METEO_CHECKSUM = (
         "http://vigilance.meteofrance.com" "/data/vigilance_controle.txt"
     )
     # URL_VIGILANCE_METEO_CHECKSUM = "./tests/vigilance_controle.txt" #for local tests
 
-    def __init__(self):
-        """Class instance constructor."""
-        self._xml_tree = None
-        self._latest_check_date = None
-        self._latest_checksum_value = None
-        self._bulletin_date = None
-        self._proxy_status = None
+    # URL used to fetch the compressed data source referenced by the checksum file.
+    URL_VIGILANCE_METEO_ZIP = (
+        "http://vigilance.meteofrance.com" "/data/vigilance.zip"
+    )
 
-    def _get_new_checksum(self):
-        """Return the checksum of the data source on MétéoFrance website.
-        
-        The checksum allows high frequency requests and downloads data only if 
-        new information are published.
-        If the data source is unvailabe, return the previous checksum if bulletin
-        validity date is still not reached. If the bulletin has expired, raise
-        an VigilanceMeteoError error."""
-        # download checksum if not yet done or done since 60 secondes
-        if (self._latest_check_date is None) or (
-            datetime.now() - self._latest_check_date
-        ).total_seconds() > 60:
+    # Name of the weather alert bulletins inside the compressed data source.
+    ZIP_XML_MEMBER = "NXFR33_LFPW_.xml"
+    ZIP_XML_MEMBER_TOMORROW = "NXFR34_LFPW_.xml"
 
-            # get checksum in vigilance_controle.txt
-            try:
-                text = urlopen(self.URL_VIGILANCE_METEO_CHECKSUM).read().decode("utf-8")
-            except URLError:
-                # Didn't succeed to download the cheksum file
-                if (
-                    self.bulletin_date is not None
-                    and (
-                        timezone("UTC").localize(datetime.utcnow()) - self.bulletin_date
-                    ).days
-                    < 1
-                ):
-                    # If the bulletin is old of less than 24 hours. It's OK to keep it.
-                    self._proxy_status = UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID
-                    return self._latest_checksum_value
-                else:
-                    self._proxy_status = UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED
-                    raise VigilanceMeteoError(
-                        "Error: 'vigilance_controle.txt' unreachable and weather alert bulletin has expired"
-                    )
-            else:
-                # Update latest check date.
-                self._latest_check_date = datetime.now()
+    def __init__(
+        self,
+        compressed=False,
+        sources=None,
+        hedge_percentile=95,
+        hedge_delay=1.0,
+        keep_xml_tree=True,
+        bulletins=None,
+        coordinator=None,
+        clock=None,
+        profiler=None,
+    ):
+        """Class instance constructor.
+
+        If 'compressed' is True, the bulletin is fetched from the compressed
+        data source (vigilance.zip) instead of the XML file.
+        'sources' is an ordered list of BulletinSource objects. By default, the
+        Météo France website is the only source. When a source is slower than
+        the 'hedge_percentile' percentile of the previous requests of the same
+        kind (checksum file or data source) or than 'hedge_delay' seconds at
+        startup, the next source is requested too.
+        If 'keep_xml_tree' is False, the XML tree is released once the alerts
+        and the metadata are extracted.
+        'bulletins' is the list of the names of the bulletins to fetch
+        (BULLETIN_TODAY and/or BULLETIN_TOMORROW). The first one is used by
+        default and decides if the proxy is in error. By default, only the
+        BULLETIN_TODAY bulletin is fetched.
+        'coordinator' is an optional PollingCoordinator shared by the processes
+        of the host. Only the leader process polls the sources, the other ones
+        read the files it publishes (and poll the sources only if the files are
+        missing). All the processes have to use the same 'compressed' option.
+        'clock' is a function returning the current date and time with timezone
+        (the system clock by default), used for the 60 secondes cache of the
+        checksum file and the 24 hours validity of the bulletin.
+        'profiler' is an optional Profiler recording the next calls of
+        update_data() and get_alert_list() (see also start_profiling()).
+        """
+        self._compressed = compressed
+        self._sources = sources
+        # The checksum file is small and polled often, the data sources are
+        # large: their latencies are recorded separately.
+        self._checksum_fetcher = HedgedFetcher(hedge_percentile, hedge_delay)
+        self._payload_fetcher = HedgedFetcher(hedge_percentile, hedge_delay)
+        self._update_lock = threading.Lock()
+        self._coordinator = coordinator
+        self._checksum_source = None
+        self._xml_source = None
+        self._clock = clock or self._now
+        self._profiler = profiler
+        bulletins = list(bulletins) if bulletins else [BULLETIN_TODAY]
+        self._engine = BulletinEngine(
+            bulletins,
+            compressed,
+            dict((bulletin, self._zip_member(bulletin)) for bulletin in bulletins),
+            keep_xml_tree,
+        )
+        self._bulletins = self._engine.bulletins
+        reinit_after_fork(self)
 
-                # Return checksum
-                checksum = re.search(r"\n(.+?)\s", text)
-                self._proxy_status = UPDATE_STATUS_CHECKSUM_UPDATED
-                return checksum.group(1)
+    def _after_fork_in_child(self):
+        """Reinitialize the lock in a forked process (it may be held)."""
+        self._update_lock = threading.Lock()
 
-        else:
-            # No need to check so return previous value
-            self._proxy_status = UPDATE_STATUS_CHECKSUM_CACHED_60S
-            return self._latest_checksum_value
+    @staticmethod
+    def _now():
+        """Return the current date and time with UTC timezone."""
+        return timezone("UTC").localize(datetime.utcnow())
+
+    @property
+    def _latest_check_date(self):
+        """Date of the latest check if new bulletin is available"""
+        return self._engine.latest_check_date
+
+    @_latest_check_date.setter
+    def _latest_check_date(self, value):
+        self._engine.latest_check_date = value
+
+    @property
+    def _bulletin_date(self):
+        """Date of the first bulletin (with timezone)"""
+        return self._engine.bulletin_date
+
+    @_bulletin_date.setter
+    def _bulletin_date(self, value):
+        self._engine.bulletin_date = value
 
     def update_data(self):
         """Downloads an updates of the XML data source only if needed.
         
         The methods checks before if the checksum has changed on the website. If
-        yes, XML data source is updated.
+        yes, XML data source is updated. If the downloaded data source or the
+        alerts it contains are the same as before, the previous alerts are kept
+        and the status is UPDATE_STATUS_SAME_CONTENT.
+        Concurrent calls are serialized and a new snapshot is published
+        atomically once the bulletin is ready.
         """
+        with self._update_lock:
+            if self._profiler is None:
+                self._update_data()
+            else:
+                self._profiler.run("update_data", self._update_data)
+
+    def _update_data(self):
+        """Downloads an updates of the XML data source only if needed.
+
+        The decisions are taken by the engine, the proxy only downloads the
+        files it asks for.
+        """
+        # download checksum if not yet done or done since 60 secondes
+        if not self._engine.checksum_due(self._clock()):
+            self._engine.checksum_cached()
+            return
+
+        # get checksum in vigilance_controle.txt
+        try:
+            source, text = self._fetch_checksum()
+        except URLError:
+            # Raise a VigilanceMeteoError if the bulletin has expired
+            self._engine.checksum_unreachable(self._clock())
+            return
+        self._checksum_source = source.name
+
         # Download only if the checksum have change since latest update.
-        current_checksum = self._get_new_checksum()
-        if current_checksum != self._latest_checksum_value:
-            # Save the new checksum
-            # TODO: how to secure concurrent update request between checksum updated and XML downloaded
-            # Perhaps with a status to say data is ready.
-            self._latest_checksum_value = current_checksum
-
-            # Save the new xml source
+        if not self._engine.checksum_received(text, self._clock()):
+            self._share_downloads({})
+            return
+
+        # Download the new data sources of the pending bulletins concurrently
+        downloads = self._download_bulletins(self._engine.pending_bulletins())
+        primary_download = downloads.get(self._bulletins[0])
+        if primary_download is not None and not isinstance(primary_download, Exception):
+            self._xml_source = primary_download[0].name
+        self._engine.payloads_received(
+            dict(
+                (bulletin, download if isinstance(download, Exception) else download[1])
+                for bulletin, download in downloads.items()
+            ),
+            self._clock(),
+        )
+
+        # The leader shares the downloaded files with the other processes
+        self._share_downloads(downloads)
+
+    def _fetch_checksum(self):
+        """Download the checksum file. Return the tuple (source, content)."""
+        return self._checksum_fetcher.fetch(
+            self._get_sources(), self._download_checksum_file
+        )
+
+    def _download_bulletins(self, bulletins):
+        """Download the data sources of the bulletins concurrently.
+
+        Return a dictionary with the bulletin name as key and the tuple (source,
+        data source) or the raised exception as value. With the compressed data
+        source, all bulletins share the same download.
+        """
+        sources = self._get_sources()
+        downloads = {}
+
+        def download(bulletin):
+            """Download the data source of a bulletin."""
             try:
-                self._xml_tree = etree.parse(
-                    self.URL_VIGILANCE_METEO_XML
-                )  # pylint disable=c-extension-no-member
-            except (OSError, IOError):
-                # Didn't succeed to download the xml file
-                if (
-                    self.bulletin_date is not None
-                    and (
-                        timezone("UTC").localize(datetime.utcnow()) - self.bulletin_date
-                    ).days
-                    < 1
-                ):
-                    # If the bulletin is old of less than 24 hours, it's OK to keep it.
-                    self._proxy_status = UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID
-                else:
-                    # If the bulletin is older than 24 hours, it raises an Error
-                    self._proxy_status = UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED
-                    # Delete lasest check date to be sure every other future call
-                    # won't use the cached data
-                    self._latest_check_date = None
-                    raise VigilanceMeteoError(
-                        "Error: 'NXFR33_LFPX_.xml' unreachable and weather alert bulletin has expired"
-                    )
-            else:
-                # Get the weather bulletin date & time
-                string_date = self._xml_tree.xpath("/CV/EV")[0].get("dateinsert")
-
-                # Convert the string in date and time with Europe/Paris timezone
-                annee = int(string_date[0:4])
-                mois = int(string_date[4:6])
-                jour = int(string_date[6:8])
-                heure = int(string_date[8:10])
-                minute = int(string_date[10:12])
-                seconde = int(string_date[12:14])
-                paris_timezone = timezone("Europe/Paris")
-                self._bulletin_date = paris_timezone.localize(
-                    datetime(annee, mois, jour, heure, minute, seconde)
+                downloads[bulletin] = self._payload_fetcher.fetch(
+                    sources, lambda source: self._download_payload(source, bulletin)
                 )
-                self._proxy_status = UPDATE_STATUS_XML_UPDATED
-        elif self._proxy_status == UPDATE_STATUS_CHECKSUM_UPDATED:
-            self._proxy_status = UPDATE_STATUS_SAME_CHECKSUM
+            except Exception as error:  # pylint: disable=broad-except
+                downloads[bulletin] = error
+
+        if self._compressed or len(bulletins) == 1:
+            download(bulletins[0])
+            for bulletin in bulletins[1:]:
+                downloads[bulletin] = downloads[bulletins[0]]
+            return downloads
+
+        threads = [
+            threading.Thread(target=download, args=(bulletin,))
+            for bulletin in bulletins
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return downloads
+
+    def _share_downloads(self, downloads):
+        """Publish the downloaded files for the follower processes (leader only).
+
+        Only the pending bulletins were downloaded, the files of the other
+        ones are already up to date. The checksum file is rewritten even if
+        nothing was downloaded: its age tells the followers the leader polls.
+        """
+        if self._coordinator is None or not self._coordinator.leader:
+            return
+        if isinstance(downloads.get(self._bulletins[0]), Exception):
+            return
+        files = [
+            (
+                ZIP_FILE_NAME if self._compressed else self._zip_member(bulletin),
+                download[1],
+            )
+            for bulletin, download in sorted(downloads.items())
+            if not isinstance(download, Exception)
+        ]
+        if self._compressed:
+            files = files[:1]
+        files.append((CHECKSUM_FILE_NAME, self._engine.checksum_text.encode("utf-8")))
+        self._coordinator.publish(files)
+
+    def _get_sources(self):
+        """Return the ordered list of sources.
+
+        Without explicit sources, the only source is build from the class
+        attributes to take into account their changes. The files published by
+        the leader process are the first source of the follower processes,
+        unless the leader didn't poll for two checksum cache delays.
+        """
+        if self._sources is not None:
+            sources = list(self._sources)
+        else:
+            sources = [
+                BulletinSource(
+                    "meteofrance",
+                    self.URL_VIGILANCE_METEO_CHECKSUM,
+                    {
+                        BULLETIN_TODAY: self.URL_VIGILANCE_METEO_XML,
+                        BULLETIN_TOMORROW: self.URL_VIGILANCE_METEO_XML_TOMORROW,
+                    },
+                    self.URL_VIGILANCE_METEO_ZIP,
+                )
+            ]
+        if (
+            self._coordinator is not None
+            and not self._coordinator.try_lead()
+            and self._leader_polls()
+        ):
+            xml_file_names = dict(
+                (bulletin, self._zip_member(bulletin)) for bulletin in self._bulletins
+            )
+            sources.insert(0, self._coordinator.source(xml_file_names))
+        return sources
 
-    def get_alert_list(self, department):
+    def _leader_polls(self):
+        """Return True if the leader published its checksum file recently."""
+        published_age = self._coordinator.published_age()
+        return (
+            published_age is not None
+            and published_age
+            < 2 * self._engine.CHECKSUM_CACHE_DELAY.total_seconds()
+        )
+
+    def _zip_member(self, bulletin):
+        """Return the name of a bulletin inside the compressed data source."""
+        if bulletin == BULLETIN_TOMORROW:
+            return self.ZIP_XML_MEMBER_TOMORROW
+        return self.ZIP_XML_MEMBER
+
+    @staticmethod
+    def _download_checksum_file(source):
+        """Download the checksum file of a source and check its content."""
+        text = urlopen(source.checksum_url).read().decode("utf-8")
+        if parse_checksum(text)[0] is None:
+            raise URLError("Error: no checksum in {}".format(source.checksum_url))
+        return text
+
+    def _download_payload(self, source, bulletin=BULLETIN_TODAY):
+        """Download the data source of a bulletin from a source.
+
+        Return the content of the XML file or of the compressed data source.
+        Raise an IOError if the data source is unreachable or invalid, so only
+        a valid data source wins the hedged request.
+        """
+        if self._compressed:
+            payload = self._download_zip(source)
+        else:
+            payload = self._download_xml(source, bulletin)
+
+        # Check the bulletin can be parsed (truncated or corrupted answers)
+        try:
+            if self._compressed:
+                with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+                    archive.getinfo(self._zip_member(bulletin))
+            self._engine.parse_payload(payload, bulletin)
+        except (zipfile.BadZipfile, KeyError, etree.XMLSyntaxError) as error:
+            raise IOError(
+                "Error: '{}' bulletin of {} is not valid ({})".format(
+                    bulletin, source.name, error
+                )
+            )
+        return payload
+
+    @staticmethod
+    def _download_xml(source, bulletin):
+        """Download the XML file of a bulletin from a source."""
+        xml_url = source.xml_url_for(bulletin)
+        if xml_url is None:
+            raise IOError("Error: no '{}' bulletin in {}".format(bulletin, source.name))
+        if xml_url.startswith(("http:", "https:", "file:")):
+            # Recent lxml releases don't load network entities, use urllib.
+            response = urlopen(xml_url)
+            try:
+                return response.read()
+            finally:
+                response.close()
+        with open(xml_url, "rb") as xml_file:
+            return xml_file.read()
+
+    def _download_zip(self, source):
+        """Download the compressed data source from a source."""
+        response = urlopen(source.zip_url)
+        try:
+            if self._engine.payload_size is None:
+                return response.read()
+            # Read one byte more than advertised to detect oversized archives.
+            # The read buffer is allocated once with the advertised size.
+            payload = response.read(self._engine.payload_size + 1)
+            if len(payload) != self._engine.payload_size:
+                raise IOError(
+                    "Error: 'vigilance.zip' size is {} bytes instead of the "
+                    "{} bytes advertised".format(len(payload), self._engine.payload_size)
+                )
+            return payload
+        finally:
+            response.close()
+
+    def get_alert_list(self, department, bulletin=None):
         """Return the list and status of the alerts for a given department.
         
         For all alert types, a status (Vert, Jaune, Orange, Rouge) is returned.
+        'bulletin' is the name of the bulletin to use (the first one by default).
         """
+        if self._profiler is not None:
+            return self._profiler.run(
+                "get_alert_list", self._get_alert_list, department, bulletin
+            )
+        return self._get_alert_list(department, bulletin)
+
+    def _get_alert_list(self, department, bulletin):
+        """Return the list and status of the alerts for a given department."""
+        return self.get_snapshot(bulletin).alerts.get_alert_list(department)
+
+    def get_snapshot(self, bulletin=None):
+        """Update data and return the latest published snapshot of a bulletin.
 
+        'bulletin' is the name of the bulletin (the first one by default).
+        """
         # update data
         self.update_data()
 
-        # Set initial value for each alert type in the list
-        alerts_list = {}
-        for alert_type in ALERT_TYPE_LIST:
-            alerts_list[alert_type] = "Vert"
+        snapshot = self._engine.snapshots.get(bulletin or self._bulletins[0])
+        if snapshot is None:
+            raise VigilanceMeteoError(
+                "Error: no '{}' weather alert bulletin available".format(bulletin)
+            )
+        return snapshot
+
+    def get_rollups(self, bulletin=None):
+        """Return the national, regional and coastal synthesis of the alerts.
+
+        The synthesis is computed once per bulletin. See compute_rollups() for
+        the description of the result.
+        """
+        return self.get_snapshot(bulletin).alerts.cached(
+            "rollups", lambda alerts: compute_rollups(alerts.color_matrix)
+        )
+
+    def get_departments_at_risk(
+        self, alert_types=None, min_color="Orange", bulletin=None
+    ):
+        """Return the departments with an alert of a type at min_color or more.
 
-        # Get the active alerts for the specific department
-        department_alerts = self.xml_tree.xpath(
-            "/CV/DV[attribute::dep='" + department + "']"
+        'alert_types' is an alert type or an iterable of alert types (all types
+        by default). The query uses an index built once per bulletin.
+        """
+        return list(
+            self.get_snapshot(bulletin).alerts.get_departments_at_risk(
+                alert_types, min_color
+            )
         )
 
-        # Get the additional active alerts if it is a coastal department
-        if department in COASTAL_DEPARTMENT_LIST:
-            department_alerts.extend(
-                self.xml_tree.xpath("/CV/DV[attribute::dep='" + department + "10']")
+    def export_alerts(self, output=OUTPUT_ARRAY, bulletin=None):
+        """Return the alerts of a bulletin as typed columns.
+
+        See export.export_alerts() for the description of the columns and of
+        the 'output' formats.
+        """
+        return export_alerts(self.get_snapshot(bulletin), output)
+
+    def get_map(self, output=MAP_GEOJSON, bulletin=None):
+        """Return the map of the alerts of a bulletin as bytes.
+
+        'output' can be 'geojson' or 'svg'. The map is rendered once and served
+        from cache until the alerts change (UPDATE_STATUS_XML_UPDATED).
+        """
+        return render_map(self.get_snapshot(bulletin).alerts, output)
+
+    def preload(self, freeze_gc=False):
+        """Load the bulletins to share them with the processes forked later.
+
+        The values derived from the alerts are computed now, so the children
+        read them without writing in the shared memory pages. A leader process
+        of the coordinator stops being the leader: one of the children polls.
+
+        If 'freeze_gc' is True, all the objects of the process are frozen out
+        of the garbage collector (fork.freeze(), python 3.7+). Otherwise it's up
+        to the application to freeze them once it has loaded everything.
+        """
+        self.update_data()
+        for snapshot in self._engine.snapshots.values():
+            alerts = snapshot.alerts
+            for department in MATRIX_DEPARTMENT_LIST:
+                alerts.get_alert_list(department)
+            alerts.cached(
+                "rollups", lambda alerts: compute_rollups(alerts.color_matrix)
             )
+            alerts.alert_index  # pylint: disable=pointless-statement
+        if self._coordinator is not None:
+            self._coordinator.release()
+        if freeze_gc:
+            freeze()
 
-        # Identify each active alert and the color associated (criticity).
-        # They are grouped by color
-        for alerts_group in department_alerts:
-            # Get the color of the alert group
-            color = int(alerts_group.get("coul"))
+    def start_profiling(self, path, calls=10, memory=False):
+        """Profile the next calls of update_data() and get_alert_list().
 
-            # Get all the active alerts in the group
-            for active_alert in list(alerts_group):
-                alert_type = int(active_alert.get("val"))
-                # Update the instance variable with the alert list
-                alerts_list[ALERT_TYPE_LIST[alert_type - 1]] = ALERT_COLOR_LIST[
-                    color - 1
-                ]
+        A JSON report of each of the next 'calls' calls is appended to the
+        'path' file (see profiling.Profiler). Return the Profiler.
+        """
+        self._profiler = Profiler(path, calls, memory)
+        return self._profiler
 
-        return alerts_list
+    def stop_profiling(self):
+        """Stop profiling the calls."""
+        self._profiler = None
 
     @property
     def xml_tree(self):
         """Getter of xml_tree attribute."""
-        return self._xml_tree
+        return self._engine.xml_trees.get(self._bulletins[0])
+
+    @property
+    def snapshot(self):
+        """Getter for the snapshot of the first bulletin"""
+        return self._engine.snapshots.get(self._bulletins[0])
+
+    @property
+    def snapshots(self):
+        """Getter for the snapshots of all bulletins"""
+        return dict(self._engine.snapshots)
+
+    @property
+    def metadata(self):
+        """Getter for the bulletin metadata"""
+        if self.snapshot is None:
+            return None
+        return self.snapshot.metadata
 
     @property
     def checksum(self):
-        """Getter for _latest_checksum_value"""
-        return self._latest_checksum_value
+        """Getter for the checksum of the latest bulletin"""
+        return self._engine.checksum
 
     @property
     def bulletin_date(self):
@@ -236,5 +561,31 @@ class VigilanceMeteoFranceProxy(object):
 
     @property
     def status(self):
-        """ Getter for _proxy_status"""
-        return self._proxy_status
+        """ Getter for the status of the proxy"""
+        return self._engine.status
+
+    @property
+    def source(self):
+        """Getter for the name of the source of the latest bulletin"""
+        return self._xml_source
+
+    @property
+    def metrics(self):
+        """Getter for the statistics about the requests sent to the sources"""
+        fetchers = {"checksum": self._checksum_fetcher, "payload": self._payload_fetcher}
+        wins = {}
+        for fetcher in fetchers.values():
+            for name, count in fetcher.wins.items():
+                wins[name] = wins.get(name, 0) + count
+        return {
+            "checksum_source": self._checksum_source,
+            "xml_source": self._xml_source,
+            "wins": wins,
+            "hedged_requests": sum(
+                fetcher.hedged_requests for fetcher in fetchers.values()
+            ),
+            "hedge_delay": dict(
+                (kind, fetcher.hedge_delay) for kind, fetcher in fetchers.items()
+            ),
+            "leader": self._coordinator.leader if self._coordinator else None,
+        }
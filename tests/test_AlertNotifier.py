@@ -0,0 +1,154 @@
+# coding: utf-8
+"""tests for vigilance module - AlertNotifier Class"""
+import threading
+
+import pytest
+
+from vigilancemeteo.bulletin import BulletinAlerts, BulletinSnapshot
+from vigilancemeteo.notifier import AlertNotifier, MemorySink
+
+# Alert type and color indices
+ORAGES = 2
+VENT = 0
+JAUNE = 1
+ORANGE = 2
+
+
+def _snapshot(checksum, alerts_table):
+    """Return a snapshot with the alerts of 'alerts_table'."""
+    return BulletinSnapshot(checksum, None, None, BulletinAlerts(alerts_table))
+
+
+def test_groups_render_once():
+    """Test the subscribers of a group share one message sent by batches."""
+    sink = MemorySink()
+    notifier = AlertNotifier(sink, workers=4, batch_size=10)
+    for subscriber in range(25):
+        notifier.subscribe(subscriber, "32")
+    notifier.subscribe("other", "33", ["Vent violent"])
+    notifier.subscribe("quiet", "01")
+
+    report = notifier.notify(
+        _snapshot("1", {"32": ((ORAGES, ORANGE),), "33": ((ORAGES, ORANGE),)})
+    )
+
+    assert report == {
+        "groups": 1,
+        "batches": 3,
+        "failures": 0,
+        "notified": 25,
+        "duplicates": 0,
+    }
+    messages = set(id(message) for _, message in sink.deliveries)
+    assert len(messages) == 1
+    assert sink.deliveries[0][1]["text"] == (
+        "Alerte météo Orange en cours :\n - Orages: Orange"
+    )
+    assert sorted(sum([batch for batch, _ in sink.deliveries], [])) == list(range(25))
+
+
+def test_deduplication_across_bulletins():
+    """Test an alert is notified once per color until it goes down."""
+    sink = MemorySink()
+    notifier = AlertNotifier(sink)
+    notifier.subscribe("a", "32")
+
+    jaune = _snapshot("1", {"32": ((ORAGES, JAUNE),)})
+    orange = _snapshot("2", {"32": ((ORAGES, ORANGE),)})
+    vert = _snapshot("3", {})
+
+    reports = [
+        notifier.notify(snapshot)
+        for snapshot in [jaune, jaune, orange, jaune, vert, jaune]
+    ]
+    assert [report["notified"] for report in reports] == [1, 0, 1, 0, 0, 1]
+    assert [report["duplicates"] for report in reports] == [0, 1, 0, 1, 0, 0]
+
+
+def test_alert_up_again_notified():
+    """Test an alert going down then up again is notified again."""
+    sink = MemorySink()
+    notifier = AlertNotifier(sink)
+    notifier.subscribe("a", "32")
+
+    jaune = _snapshot("1", {"32": ((ORAGES, JAUNE),)})
+    orange = _snapshot("2", {"32": ((ORAGES, ORANGE),)})
+
+    reports = [
+        notifier.notify(snapshot) for snapshot in [orange, jaune, orange, orange]
+    ]
+    assert [report["notified"] for report in reports] == [1, 0, 1, 0]
+
+
+def test_unsubscribe_forgets_deliveries():
+    """Test the deliveries of a subscriber are forgotten when it unsubscribes."""
+    sink = MemorySink()
+    notifier = AlertNotifier(sink)
+    orange = _snapshot("1", {"32": ((ORAGES, ORANGE),)})
+    notifier.subscribe("a", "32")
+    notifier.notify(orange)
+
+    notifier.unsubscribe("a")
+    assert notifier._delivered == {}  # pylint: disable=protected-access
+    notifier.subscribe("a", "32")
+    assert notifier.notify(orange)["notified"] == 1
+
+
+def test_retries():
+    """Test failing batches are retried, then tried again on next bulletin."""
+    snapshot = _snapshot("1", {"32": ((VENT, ORANGE),)})
+
+    sink = MemorySink(failures=2)
+    notifier = AlertNotifier(sink, retries=2, retry_delay=0)
+    notifier.subscribe("a", "32")
+    assert notifier.notify(snapshot)["notified"] == 1
+    assert sink.calls == 3
+
+    sink = MemorySink(failures=4)
+    notifier = AlertNotifier(sink, retries=1, retry_delay=0)
+    notifier.subscribe("a", "32")
+    assert notifier.notify(snapshot)["failures"] == 1
+    assert notifier.notify(snapshot)["failures"] == 1
+    assert notifier.notify(snapshot)["notified"] == 1
+
+
+def test_subscribe_while_sending():
+    """Test the subscriptions are not locked while the batches are sent."""
+    sending = threading.Event()
+    release = threading.Event()
+    sink = MemorySink()
+
+    def send(subscribers, message):
+        sending.set()
+        release.wait(10)
+        sink(subscribers, message)
+
+    notifier = AlertNotifier(send)
+    notifier.subscribe("first", "32")
+    snapshot = _snapshot("1", {"32": ((ORAGES, ORANGE),)})
+    thread = threading.Thread(target=notifier.notify, args=(snapshot,))
+    thread.start()
+    try:
+        assert sending.wait(10)
+        # The send is blocked: subscriptions don't wait for it
+        notifier.subscribe("second", "32")
+        notifier.unsubscribe("first", "33")
+    finally:
+        release.set()
+        thread.join()
+
+    report = notifier.notify(snapshot)
+    assert (report["notified"], report["duplicates"], len(sink.deliveries)) == (1, 1, 2)
+
+
+def test_wrong_subscription():
+    """Test subscription checks."""
+    notifier = AlertNotifier(MemorySink())
+    with pytest.raises(ValueError):
+        notifier.subscribe("a", "00")
+    with pytest.raises(ValueError):
+        notifier.subscribe("a", "32", ["Grêle"])
+
+    notifier.subscribe("a", "32")
+    notifier.unsubscribe("a")
+    assert notifier.notify(_snapshot("1", {"32": ((ORAGES, ORANGE),)}))["groups"] == 0
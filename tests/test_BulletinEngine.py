@@ -0,0 +1,125 @@
+# coding: utf-8
+"""tests for vigilance module - BulletinEngine Class"""
+import datetime
+
+import pytest
+from pytz import timezone
+
+from vigilancemeteo import VigilanceMeteoError
+from vigilancemeteo.constants import (BULLETIN_TODAY,
+                                      BULLETIN_TOMORROW,
+                                      UPDATE_STATUS_CHECKSUM_CACHED_60S,
+                                      UPDATE_STATUS_CHECKSUM_UPDATED,
+                                      UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED,
+                                      UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID,
+                                      UPDATE_STATUS_SAME_CHECKSUM,
+                                      UPDATE_STATUS_SAME_CONTENT,
+                                      UPDATE_STATUS_XML_UPDATED)
+from vigilancemeteo.engine import BulletinEngine, parse_checksum
+
+# One hour after the bulletin of the tests
+NOW = timezone("UTC").localize(datetime.datetime(2018, 3, 18, 16, 0, 0))
+CHECKSUM_TEXT = "Fri Mar 15 22:29:02 CET 2019\n1751354976 257915 vigilance.zip\n"
+
+
+@pytest.fixture()
+def xml_payload():
+    """Fixture with the content of the XML bulletin of the tests."""
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        return xml_file.read()
+
+
+def test_parse_checksum():
+    """Test the parsing of the checksum file."""
+    assert parse_checksum(CHECKSUM_TEXT) == ("1751354976", 257915)
+    assert parse_checksum("Fri Mar 15\n1751354976\n") == ("1751354976", None)
+    assert parse_checksum("Not found") == (None, None)
+
+
+def test_update_cycle(xml_payload):
+    """Test the decisions and the status of an update cycle."""
+    engine = BulletinEngine()
+    assert engine.checksum_due(NOW)
+
+    assert engine.checksum_received(CHECKSUM_TEXT, NOW)
+    assert (engine.status, engine.checksum, engine.payload_size) == (
+        UPDATE_STATUS_CHECKSUM_UPDATED,
+        "1751354976",
+        257915,
+    )
+    engine.payloads_received({BULLETIN_TODAY: xml_payload}, NOW)
+    assert (
+        engine.status,
+        engine.bulletin_date.isoformat(),
+        engine.snapshots[BULLETIN_TODAY].checksum,
+    ) == (UPDATE_STATUS_XML_UPDATED, "2018-03-18T16:00:00+01:00", "1751354976")
+
+    # The checksum file is cached 60 secondes
+    assert not engine.checksum_due(NOW + datetime.timedelta(seconds=30))
+    engine.checksum_cached()
+    assert engine.status == UPDATE_STATUS_CHECKSUM_CACHED_60S
+
+    later = NOW + datetime.timedelta(seconds=90)
+    assert engine.checksum_due(later)
+    assert not engine.checksum_received(CHECKSUM_TEXT, later)
+    assert engine.status == UPDATE_STATUS_SAME_CHECKSUM
+
+    # Same data source with a new checksum
+    assert engine.checksum_received(CHECKSUM_TEXT.replace("76", "77"), later)
+    engine.payloads_received({BULLETIN_TODAY: xml_payload}, later)
+    assert engine.status == UPDATE_STATUS_SAME_CONTENT
+
+
+def test_unreachable_files(xml_payload):
+    """Test the status when the files can't be downloaded."""
+    engine = BulletinEngine(bulletins=[BULLETIN_TODAY, BULLETIN_TOMORROW])
+
+    # No bulletin yet
+    with pytest.raises(VigilanceMeteoError):
+        engine.checksum_unreachable(NOW)
+    assert engine.status == UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED
+
+    engine.checksum_received(CHECKSUM_TEXT, NOW)
+    engine.payloads_received(
+        {BULLETIN_TODAY: xml_payload, BULLETIN_TOMORROW: IOError("unreachable")}, NOW
+    )
+    assert (engine.status, sorted(engine.snapshots)) == (
+        UPDATE_STATUS_XML_UPDATED,
+        [BULLETIN_TODAY],
+    )
+
+    # The failed bulletin is downloaded again on the next poll
+    assert (
+        engine.checksum_received(CHECKSUM_TEXT, NOW),
+        engine.status,
+        engine.pending_bulletins(),
+    ) == (True, UPDATE_STATUS_SAME_CHECKSUM, [BULLETIN_TOMORROW])
+    engine.payloads_received({BULLETIN_TOMORROW: xml_payload}, NOW)
+    assert (engine.status, sorted(engine.snapshots), engine.pending_bulletins()) == (
+        UPDATE_STATUS_SAME_CHECKSUM,
+        [BULLETIN_TODAY, BULLETIN_TOMORROW],
+        [],
+    )
+    assert not engine.checksum_received(CHECKSUM_TEXT, NOW)
+
+    # The bulletin is valid 24 hours
+    engine.checksum_unreachable(NOW)
+    assert engine.status == UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID
+    engine.payloads_received(
+        {BULLETIN_TODAY: IOError("unreachable"), BULLETIN_TOMORROW: xml_payload}, NOW
+    )
+    assert (engine.status, sorted(engine.snapshots)) == (
+        UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID,
+        [BULLETIN_TODAY, BULLETIN_TOMORROW],
+    )
+
+    tomorrow = NOW + datetime.timedelta(days=1)
+    with pytest.raises(VigilanceMeteoError):
+        engine.payloads_received(
+            {BULLETIN_TODAY: IOError("unreachable"), BULLETIN_TOMORROW: xml_payload},
+            tomorrow,
+        )
+    assert (engine.status, engine.latest_check_date) == (
+        UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED,
+        None,
+    )
@@ -0,0 +1,105 @@
+# coding: utf-8
+# pylint: disable= redefined-outer-name
+"""tests for vigilance module - BulletinReplay Class"""
+import time
+import zipfile
+
+import pytest
+
+from vigilancemeteo.constants import (UPDATE_STATUS_CHECKSUM_CACHED_60S,
+                                      UPDATE_STATUS_SAME_CHECKSUM,
+                                      UPDATE_STATUS_SAME_CONTENT,
+                                      UPDATE_STATUS_XML_UPDATED)
+from vigilancemeteo.replay import XML_FILE_NAME, BulletinReplay
+
+
+@pytest.fixture()
+def recordings(tmpdir):
+    """Fixture with a storm of 3 bulletins published every hour."""
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        content = xml_file.read()
+    # Same alerts at 16h and 17h, new color for department 32 at 18h
+    for hour, color in [(16, 4), (17, 4), (18, 3)]:
+        tmpdir.join("bulletin_{}.xml".format(hour)).write_binary(
+            content.replace(
+                b'dateinsert="20180318160000"',
+                'dateinsert="20180318{}0000"'.format(hour).encode("utf-8"),
+            ).replace(
+                b'<DV dep="32" coul="4">',
+                '<DV dep="32" coul="{}">'.format(color).encode("utf-8"),
+            )
+        )
+    return tmpdir
+
+
+def test_replay(recordings):
+    """Test the bulletins go through the status machinery of the proxy."""
+    colors = []
+    with BulletinReplay(str(recordings), poll_interval=600) as replay:
+        proxy = replay.proxy()
+        report = replay.run(
+            proxy, lambda proxy: colors.append(proxy.get_alert_list("32")["Orages"])
+        )
+
+    assert (report["bulletins"], report["polls"], report["statuses"]) == (
+        3,
+        13,
+        {
+            UPDATE_STATUS_XML_UPDATED: 2,
+            UPDATE_STATUS_SAME_CONTENT: 1,
+            UPDATE_STATUS_SAME_CHECKSUM: 10,
+        },
+    )
+    assert report["simulated_duration"] == 2 * 3600 + 600
+    assert colors == ["Rouge"] * 12 + ["Orange"]
+    assert proxy.bulletin_date.isoformat() == "2018-03-18T18:00:00+01:00"
+
+
+def test_replay_speedup(recordings):
+    """Test the simulated time runs faster than real time."""
+    with BulletinReplay(str(recordings), speedup=36000, poll_interval=600) as replay:
+        start = time.time()
+        replay.run(replay.proxy(compressed=True))
+
+    # The last poll is 2 simulated hours after the first one: 0.2 secondes
+    assert 0.19 < time.time() - start < 2
+
+
+def test_replay_default_interval(recordings):
+    """Test the default poll interval never uses the cached checksum file."""
+    with BulletinReplay(str(recordings)) as replay:
+        report = replay.run(replay.proxy())
+
+    assert (
+        UPDATE_STATUS_CHECKSUM_CACHED_60S in report["statuses"],
+        report["statuses"][UPDATE_STATUS_XML_UPDATED],
+    ) == (False, 2)
+
+
+@pytest.mark.parametrize("recorded_zip", [False, True])
+def test_recorded_checksum_compressed(recordings, recorded_zip):
+    """Test a recorded checksum file with the compressed data source."""
+    # Recorded checksum file advertising the size of another vigilance.zip
+    with open("./tests/vigilance_controle.txt", "rb") as checksum_file:
+        recordings.join("bulletin_16.txt").write_binary(checksum_file.read())
+    if recorded_zip:
+        xml = recordings.join("bulletin_16.xml").read_binary()
+        with zipfile.ZipFile(
+            str(recordings.join("bulletin_16.zip")), "w", zipfile.ZIP_STORED
+        ) as zip_file:
+            zip_file.writestr(XML_FILE_NAME, xml)
+        size = recordings.join("bulletin_16.zip").size()
+        recordings.join("bulletin_16.txt").write_binary(
+            "Sun Mar 18 16:00:00 CET 2018\n1751354976 {} vigilance.zip".format(
+                size
+            ).encode("utf-8")
+        )
+
+    colors = []
+    with BulletinReplay(str(recordings), poll_interval=600) as replay:
+        report = replay.run(
+            replay.proxy(compressed=True),
+            lambda proxy: colors.append(proxy.get_alert_list("32")["Orages"]),
+        )
+
+    assert (report["statuses"][UPDATE_STATUS_XML_UPDATED], colors[0]) == (2, "Rouge")
@@ -0,0 +1,209 @@
+# coding: utf-8
+"""tests for vigilance module - DepartmentResolver Class"""
+import pytest
+
+from vigilancemeteo import DepartmentResolver
+from vigilancemeteo.constants import VALID_DEPARTMENT_LIST
+
+# Approximate geographic center (latitude, longitude) of each department.
+DEPARTMENT_COORDINATES = {
+    "01": (46.10, 5.35),
+    "02": (49.56, 3.56),
+    "03": (46.39, 3.19),
+    "04": (44.10, 6.24),
+    "05": (44.66, 6.26),
+    "06": (43.94, 7.12),
+    "07": (44.75, 4.42),
+    "08": (49.62, 4.64),
+    "09": (42.92, 1.50),
+    "10": (48.30, 4.16),
+    "11": (43.10, 2.41),
+    "12": (44.28, 2.68),
+    "13": (43.54, 5.09),
+    "14": (49.10, -0.36),
+    "15": (45.05, 2.67),
+    "16": (45.72, 0.20),
+    "17": (45.78, -0.67),
+    "18": (47.06, 2.49),
+    "19": (45.36, 1.88),
+    "2A": (41.86, 8.99),
+    "2B": (42.39, 9.21),
+    "21": (47.42, 4.77),
+    "22": (48.44, -2.86),
+    "23": (46.09, 2.02),
+    "24": (45.10, 0.74),
+    "25": (47.17, 6.36),
+    "26": (44.68, 5.17),
+    "27": (49.11, 1.00),
+    "28": (48.39, 1.37),
+    "29": (48.26, -4.06),
+    "30": (43.99, 4.18),
+    "31": (43.36, 1.17),
+    "32": (43.69, 0.45),
+    "33": (44.83, -0.58),
+    "34": (43.58, 3.37),
+    "35": (48.15, -1.64),
+    "36": (46.78, 1.58),
+    "37": (47.26, 0.69),
+    "38": (45.26, 5.58),
+    "39": (46.73, 5.70),
+    "40": (43.96, -0.78),
+    "41": (47.62, 1.43),
+    "42": (45.73, 4.17),
+    "43": (45.13, 3.81),
+    "44": (47.36, -1.68),
+    "45": (47.91, 2.34),
+    "46": (44.62, 1.60),
+    "47": (44.37, 0.46),
+    "48": (44.52, 3.50),
+    "49": (47.39, -0.56),
+    "50": (49.08, -1.33),
+    "51": (48.95, 4.24),
+    "52": (48.11, 5.23),
+    "53": (48.15, -0.65),
+    "54": (48.79, 6.16),
+    "55": (49.01, 5.38),
+    "56": (47.85, -2.81),
+    "57": (49.04, 6.66),
+    "58": (47.11, 3.50),
+    "59": (50.45, 3.22),
+    "60": (49.41, 2.42),
+    "61": (48.62, 0.13),
+    "62": (50.49, 2.29),
+    "63": (45.73, 3.14),
+    "64": (43.26, -0.76),
+    "65": (43.05, 0.16),
+    "66": (42.60, 2.52),
+    "67": (48.67, 7.55),
+    "68": (47.86, 7.27),
+    "69": (45.87, 4.64),
+    "70": (47.64, 6.09),
+    "71": (46.64, 4.54),
+    "72": (48.00, 0.22),
+    "73": (45.48, 6.44),
+    "74": (46.03, 6.43),
+    "75": (48.86, 2.34),
+    "76": (49.66, 1.03),
+    "77": (48.63, 2.93),
+    "78": (48.81, 1.84),
+    "79": (46.54, -0.32),
+    "80": (49.96, 2.28),
+    "81": (43.79, 2.16),
+    "82": (44.09, 1.28),
+    "83": (43.46, 6.22),
+    "84": (44.01, 5.17),
+    "85": (46.68, -1.30),
+    "86": (46.56, 0.46),
+    "87": (45.89, 1.23),
+    "88": (48.20, 6.38),
+    "89": (47.84, 3.56),
+    "90": (47.63, 6.93),
+    "91": (48.52, 2.24),
+    "92": (48.85, 2.25),
+    "93": (48.92, 2.48),
+    "94": (48.78, 2.47),
+    "95": (49.08, 2.13),
+    "99": (42.54, 1.57),
+}
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    """Fixture to build the indexes only once."""
+    return DepartmentResolver()
+
+
+@pytest.mark.parametrize(
+    "postal_code, department",
+    [
+        ("75008", "75"),
+        ("01000", "01"),
+        (1000, "01"),
+        ("20000", "2A"),
+        ("20200", "2B"),
+        ("92100", "92"),
+        (" ad500 ", "99"),
+        ("97400", None),
+        ("98000", None),
+        ("7500", None),
+        ("bonjour", None),
+    ],
+)
+def test_postal_code(resolver, postal_code, department):
+    """Test postal codes resolution."""
+    assert resolver.from_postal_code(postal_code) == department
+
+
+@pytest.mark.parametrize(
+    "insee_code, department",
+    [
+        ("32013", "32"),
+        ("2A004", "2A"),
+        ("2b033", "2B"),
+        ("20004", None),
+        ("99130", "99"),
+        ("99134", None),
+        ("97411", None),
+        ("320", None),
+    ],
+)
+def test_insee_code(resolver, insee_code, department):
+    """Test INSEE codes resolution."""
+    assert resolver.from_insee_code(insee_code) == department
+
+
+@pytest.mark.parametrize(
+    "latitude, longitude, department",
+    [
+        (48.8566, 2.3522, "75"),
+        (43.2965, 5.3698, "13"),
+        (45.7640, 4.8357, "69"),
+        (48.5734, 7.7521, "67"),
+        (48.3904, -4.4861, "29"),
+        (41.9192, 8.7386, "2A"),
+        (42.6977, 9.4508, "2B"),
+        (42.5063, 1.5218, "99"),
+        (49.1193, 6.1757, "57"),
+        (48.8049, 2.1204, "78"),
+        (49.4944, 0.1079, "76"),
+        (51.0344, 2.3768, "59"),
+        (48.9362, 2.3574, "93"),
+        (48.6239, 2.4289, "91"),
+        (48.9601, 2.8788, "77"),
+        (48.8924, 2.2071, "92"),
+        (48.7904, 2.4556, "94"),
+        (49.0364, 2.0761, "95"),
+        (43.7747, 7.4975, "06"),
+        (44.3833, 4.9906, "84"),
+        (46.2044, 6.1432, None),
+        (47.5596, 7.5886, None),
+        (51.5074, -0.1278, None),
+        (40.4168, -3.7038, None),
+        (float("nan"), 2.0, None),
+        (48.0, float("nan"), None),
+    ],
+)
+def test_coordinates(resolver, latitude, longitude, department):
+    """Test coordinates resolution."""
+    assert resolver.from_coordinates(latitude, longitude) == department
+
+
+def test_department_centers(resolver):
+    """Test each department center is resolved in its department."""
+    departments = [dep for dep in VALID_DEPARTMENT_LIST if dep != "20"]
+    centers = [DEPARTMENT_COORDINATES[dep] for dep in departments]
+    assert resolver.resolve_many(centers, "coordinates") == departments
+
+
+def test_resolve_many(resolver):
+    """Test batch resolution."""
+    assert (
+        resolver.resolve_many(["32000", "20090", "97400"]),
+        resolver.resolve_many(["2A004", "99130"], kind="insee_code"),
+    ) == (["32", "2A", None], ["2A", "99"])
+
+
+def test_resolve_many_wrong_kind(resolver):
+    """Test if we call resolve_many method with a wrong parameter value."""
+    with pytest.raises(ValueError, match=r"kind .*"):
+        resolver.resolve_many(["32000"], kind="address")
@@ -1,7 +1,10 @@
 # coding: utf-8
 # pylint: disable= unused-argument, redefined-outer-name
 """tests for vigilance module - DepartmentWeatherAlert"""
+import copy
 import datetime
+import json
+import pickle
 import sys
 
 import pytest
@@ -9,6 +12,7 @@ from pytz import timezone
 
 from vigilancemeteo import DepartmentWeatherAlert, VigilanceMeteoFranceProxy
 from vigilancemeteo.constants import ALERT_COLOR_LIST
+from vigilancemeteo.sources import BulletinSource
 
 
 # Manage differences beetween python 2.7 and 3.6
@@ -164,3 +168,83 @@ def test_summary_message_error(fix_local_data):
     zone = DepartmentWeatherAlert("32")
     with pytest.raises(ValueError, match=r"msg_format .*"):
         zone.summary_message("wrong_format")
+
+
+def test_shared_snapshot():
+    """Test instances share the immutable snapshot published by the proxy."""
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            )
+        ]
+    )
+    first_zone = DepartmentWeatherAlert("32", client)
+    second_zone = DepartmentWeatherAlert("32", client)
+
+    assert (
+        first_zone.snapshot is second_zone.snapshot is client.snapshot,
+        second_zone.alerts_list == first_zone.alerts_list,
+        first_zone.bulletin_date == client.snapshot.bulletin_date,
+        first_zone.alerts_list["Orages"],
+    ) == (True, True, True, "Rouge")
+
+    # Snapshot can't be modified
+    with pytest.raises(AttributeError):
+        first_zone.snapshot.checksum = "0"
+
+    # Each caller gets its own alerts list
+    alerts_list = first_zone.alerts_list
+    alerts_list["Orages"] = "Vert"
+    assert (
+        first_zone.alerts_list["Orages"],
+        second_zone.alerts_list["Orages"],
+        client.get_alert_list("32")["Orages"],
+    ) == ("Rouge", "Rouge", "Rouge")
+
+
+def test_alerts_list_serializable():
+    """Test the alerts list can be serialized and copied."""
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            )
+        ]
+    )
+    zone = DepartmentWeatherAlert("32", client)
+    alerts_list = zone.alerts_list
+
+    assert (
+        json.loads(json.dumps(alerts_list)),
+        pickle.loads(pickle.dumps(alerts_list)),
+        copy.deepcopy(alerts_list),
+    ) == (alerts_list, alerts_list, alerts_list)
+
+
+def test_unknown_departments_not_memoized():
+    """Test unknown departments don't grow the cache of the snapshot."""
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            )
+        ]
+    )
+    alerts = client.get_snapshot().alerts
+    client.get_alert_list("32")
+    cache_size = len(alerts._cache)  # pylint: disable=protected-access
+    for index in range(1000):
+        client.get_alert_list("unknown-{}".format(index))
+
+    assert (
+        len(alerts._cache),  # pylint: disable=protected-access
+        client.get_alert_list("unknown")["Orages"],
+        ("alert_list", "32") in alerts._cache,  # pylint: disable=protected-access
+    ) == (cache_size, "Vert", True)
@@ -0,0 +1,73 @@
+# coding: utf-8
+"""tests for vigilance module - load-testing harness"""
+import time
+
+import pytest
+
+from vigilancemeteo import VigilanceMeteoFranceProxy
+from vigilancemeteo.loadtest import (
+    CHECKSUM_PATH,
+    XML_PATH,
+    ZIP_PATH,
+    FakeMeteoFranceServer,
+    run_load_test,
+)
+
+
+@pytest.fixture(scope="module")
+def bulletin():
+    """Fixture with the content of the test bulletin."""
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        return xml_file.read()
+
+
+@pytest.mark.parametrize(
+    "compressed, path", [(False, XML_PATH), (True, ZIP_PATH)],
+)
+def test_load_test(bulletin, compressed, path):
+    """Test a shared proxy downloads the bulletin once under concurrency."""
+    with FakeMeteoFranceServer([bulletin], latency=0.01) as server:
+        proxy = VigilanceMeteoFranceProxy(
+            compressed=compressed, sources=[server.source()]
+        )
+        # First update before the load test
+        proxy.update_data()
+        report = run_load_test(proxy, ["32", "2A"], workers=4, duration=0.3)
+
+    assert (report["errors"], report["updates"] > 0, server.request_counts) == (
+        0,
+        True,
+        {CHECKSUM_PATH: 1, path: 1},
+    )
+    assert report["latency_p50"] <= report["latency_p99"] <= report["latency_max"]
+
+
+def test_error_injection(bulletin):
+    """Test the errors of the server are reported."""
+    with FakeMeteoFranceServer([bulletin], error_rate=1) as server:
+        proxy = VigilanceMeteoFranceProxy(sources=[server.source()])
+        report = run_load_test(proxy, ["32"], workers=2, duration=0.2)
+
+    assert report["errors"] == report["updates"] > 0
+
+
+def test_bulletin_rotation(bulletin):
+    """Test the bulletins are published in a loop."""
+    second_bulletin = bulletin.replace(b'coul="4"', b'coul="3"')
+    server = FakeMeteoFranceServer([bulletin, second_bulletin], rotate_every=0.2)
+    server.start()
+    try:
+        proxy = VigilanceMeteoFranceProxy(sources=[server.source()])
+        first_color = proxy.get_alert_list("32")["Orages"]
+        first_checksum = proxy.checksum
+        while server.bulletin_index == 0:
+            time.sleep(0.01)
+
+        # simulate 2 minutes wait
+        proxy._latest_check_date = None
+        proxy.update_data()
+    finally:
+        server.stop()
+
+    assert (first_color, proxy.get_alert_list("32")["Orages"]) == ("Rouge", "Orange")
+    assert proxy.checksum != first_checksum
@@ -0,0 +1,214 @@
+# coding: utf-8
+# pylint: disable= redefined-outer-name
+"""tests for vigilance module - HedgedFetcher and BulletinSource Classes"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from vigilancemeteo import VigilanceMeteoFranceProxy
+from vigilancemeteo.constants import UPDATE_STATUS_XML_UPDATED
+from vigilancemeteo.sources import BulletinSource, HedgedFetcher
+
+# Manage differences beetween python 2.7 and 3.6
+if sys.version_info < (3, 0):
+    from BaseHTTPServer import BaseHTTPRequestHandler  # pylint: disable=import-error
+    from SocketServer import ThreadingMixIn, TCPServer  # pylint: disable=import-error
+else:
+    from http.server import BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn, TCPServer
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+class _ThreadingServer(ThreadingMixIn, TCPServer):
+    """HTTP server answering each request in a thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _start_server(delay):
+    """Start a local stand-in server answering the test files after 'delay'."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve the files of the tests directory."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Answer a GET request."""
+            time.sleep(delay)
+            path = os.path.join(TESTS_DIRECTORY, os.path.basename(self.path))
+            if not os.path.isfile(path):
+                self.send_error(404)
+                return
+            with open(path, "rb") as data_file:
+                body = data_file.read()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Keep the tests output clean."""
+
+    server = _ThreadingServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def _http_source(name, server):
+    """Return a source using a local stand-in server."""
+    base_url = "http://127.0.0.1:{}/".format(server.server_address[1])
+    return BulletinSource(
+        name,
+        base_url + "vigilance_controle.txt",
+        base_url + "NXFR33_LFPW_.xml",
+        base_url + "vigilance.zip",
+    )
+
+
+@pytest.yield_fixture()
+def slow_and_fast_servers():
+    """Fixture to start a slow and a fast local stand-in servers."""
+    threads = set(threading.enumerate())
+    slow_server = _start_server(2)
+    fast_server = _start_server(0)
+    yield slow_server, fast_server
+
+    slow_server.shutdown()
+    fast_server.shutdown()
+    slow_server.server_close()
+    fast_server.server_close()
+    # Wait for the losing requests, so they don't run during the next tests
+    for thread in set(threading.enumerate()) - threads:
+        thread.join(5)
+
+
+def test_hedged_request_wins(slow_and_fast_servers):
+    """Test the mirror answer is used when the first source is slow."""
+    slow_server, fast_server = slow_and_fast_servers
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            _http_source("upstream", slow_server),
+            _http_source("mirror", fast_server),
+        ],
+        hedge_delay=0.1,
+    )
+
+    start = time.time()
+    client.update_data()
+    duration = time.time() - start
+
+    assert (client.status, client.source, client.metrics["hedged_requests"]) == (
+        UPDATE_STATUS_XML_UPDATED,
+        "mirror",
+        2,
+    )
+    assert duration < 2
+
+
+def test_failing_source_is_replaced():
+    """Test the next source is requested as soon as a source fails."""
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "upstream", "file:./tests/fake_file.txt", "./tests/fake_xml.xml"
+            ),
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            ),
+        ],
+        hedge_delay=10,
+    )
+    client.update_data()
+
+    assert (
+        client.metrics["checksum_source"],
+        client.source,
+        client.metrics["hedged_requests"],
+    ) == ("local", "local", 0)
+
+
+def test_all_sources_failing():
+    """Test the error of the latest source is raised if all sources fail."""
+    fetcher = HedgedFetcher(hedge_delay=0.1)
+    sources = [BulletinSource(name, None, None) for name in ["first", "second"]]
+
+    def fetch_function(source):
+        """Fail for all sources."""
+        raise IOError(source.name)
+
+    with pytest.raises(IOError, match="second"):
+        fetcher.fetch(sources, fetch_function)
+
+
+def test_hedge_delay_percentile():
+    """Test the hedge delay follows the percentile of the latest latencies."""
+    fetcher = HedgedFetcher(hedge_percentile=90, hedge_delay=5, min_samples=10)
+    source = BulletinSource("upstream", None, None)
+    initial_delay = fetcher.hedge_delay
+
+    for latency in range(1, 12):
+        fetcher._record(source, latency / 100.0)
+
+    assert (initial_delay, fetcher.hedge_delay, fetcher.wins) == (
+        5,
+        0.10,
+        {"upstream": 11},
+    )
+
+
+def test_invalid_answer_loses(tmpdir):
+    """Test a truncated bulletin doesn't win the request."""
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        truncated_xml = tmpdir.join("truncated.xml")
+        truncated_xml.write(xml_file.read()[:5000], "wb")
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "upstream", "file:./tests/vigilance_controle.txt", str(truncated_xml)
+            ),
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            ),
+        ],
+        hedge_delay=10,
+    )
+    client.update_data()
+
+    assert (client.metrics["checksum_source"], client.source, client.status) == (
+        "upstream",
+        "local",
+        UPDATE_STATUS_XML_UPDATED,
+    )
+
+
+def test_hedge_delay_per_request_kind():
+    """Test the fast checksum requests don't shorten the hedge delay of the bulletins."""
+    client = VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+            )
+        ],
+        hedge_delay=5,
+    )
+    for _ in range(12):
+        client._latest_check_date = None
+        client.update_data()
+
+    assert (
+        client.metrics["hedge_delay"]["checksum"] < 1,
+        client.metrics["hedge_delay"]["payload"],
+        client.metrics["wins"],
+    ) == (True, 5, {"local": 13})
@@ -0,0 +1,120 @@
+# coding: utf-8
+"""tests for vigilance module - PollingCoordinator Class"""
+import os
+import time
+
+import pytest
+
+from vigilancemeteo import VigilanceMeteoFranceProxy
+from vigilancemeteo.constants import (
+    UPDATE_STATUS_SAME_CHECKSUM,
+    UPDATE_STATUS_XML_UPDATED,
+)
+from vigilancemeteo.coordination import CHECKSUM_FILE_NAME, PollingCoordinator
+from vigilancemeteo.sources import BulletinSource
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+LOCAL_SOURCE = BulletinSource(
+    "local",
+    "file:" + os.path.join(TESTS_DIRECTORY, "vigilance_controle.txt"),
+    os.path.join(TESTS_DIRECTORY, "NXFR33_LFPW_.xml"),
+)
+UNREACHABLE_SOURCE = BulletinSource(
+    "unreachable", "file:./tests/not_existing.txt", "./tests/not_existing.xml"
+)
+
+
+def test_single_leader(tmpdir):
+    """Test only one coordinator of a directory is the leader."""
+    first = PollingCoordinator(str(tmpdir))
+    second = PollingCoordinator(str(tmpdir))
+
+    assert (first.try_lead(), second.try_lead()) == (True, False)
+
+    # The follower takes over when the leader stops
+    first.release()
+    assert (second.try_lead(), first.try_lead()) == (True, False)
+    second.release()
+
+
+def test_follower_reads_leader_files(tmpdir):
+    """Test a follower proxy uses the files published by the leader."""
+    leader = VigilanceMeteoFranceProxy(
+        sources=[LOCAL_SOURCE], coordinator=PollingCoordinator(str(tmpdir))
+    )
+    follower = VigilanceMeteoFranceProxy(
+        sources=[UNREACHABLE_SOURCE], coordinator=PollingCoordinator(str(tmpdir))
+    )
+    leader.update_data()
+    follower.update_data()
+
+    assert (leader.metrics["leader"], follower.metrics["leader"]) == (True, False)
+    assert tmpdir.join(CHECKSUM_FILE_NAME).check()
+    assert (follower.status, follower.source, follower.checksum) == (
+        UPDATE_STATUS_XML_UPDATED,
+        "leader",
+        leader.checksum,
+    )
+    assert follower.get_alert_list("32") == leader.get_alert_list("32")
+
+
+def test_follower_polls_without_leader_files(tmpdir):
+    """Test a follower polls the sources when the leader published nothing."""
+    leader = PollingCoordinator(str(tmpdir))
+    leader.try_lead()
+    follower = VigilanceMeteoFranceProxy(
+        sources=[LOCAL_SOURCE], coordinator=PollingCoordinator(str(tmpdir))
+    )
+    follower.update_data()
+    leader.release()
+
+    assert (follower.status, follower.source, follower.metrics["leader"]) == (
+        UPDATE_STATUS_XML_UPDATED,
+        "local",
+        False,
+    )
+
+
+def test_follower_polls_when_leader_stalls(tmpdir):
+    """Test a follower polls the sources when the leader stopped polling."""
+    leader = VigilanceMeteoFranceProxy(
+        sources=[LOCAL_SOURCE], coordinator=PollingCoordinator(str(tmpdir))
+    )
+    follower = VigilanceMeteoFranceProxy(
+        sources=[LOCAL_SOURCE], coordinator=PollingCoordinator(str(tmpdir))
+    )
+    leader.update_data()
+    checksum_file = tmpdir.join(CHECKSUM_FILE_NAME)
+    checksum_file.setmtime(checksum_file.mtime() - 300)
+
+    # Each poll of the leader is a heartbeat, even with the same checksum
+    leader._latest_check_date = None  # pylint: disable=protected-access
+    leader.update_data()
+    assert (leader.status, checksum_file.mtime() > time.time() - 60) == (
+        UPDATE_STATUS_SAME_CHECKSUM,
+        True,
+    )
+
+    # The files of a stalled leader aren't used
+    checksum_file.setmtime(checksum_file.mtime() - 300)
+    follower.update_data()
+    assert (follower.status, follower.source) == (UPDATE_STATUS_XML_UPDATED, "local")
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "register_at_fork"), reason="requires os.register_at_fork()"
+)
+def test_fork_is_follower(tmpdir):
+    """Test a process forked by the leader is a follower."""
+    coordinator = PollingCoordinator(str(tmpdir))
+    coordinator.try_lead()
+
+    pid = os.fork()
+    if pid == 0:
+        follower = not coordinator.leader and not coordinator.try_lead()
+        os._exit(0 if follower else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert (os.WEXITSTATUS(status), coordinator.leader) == (0, True)
+    coordinator.release()
@@ -0,0 +1,116 @@
+# coding: utf-8
+# pylint: disable= redefined-outer-name
+"""tests for vigilance module - Profiler Class"""
+import cProfile
+import json
+import sys
+
+import pytest
+
+from vigilancemeteo import VigilanceMeteoFranceProxy
+from vigilancemeteo.profiling import Profiler
+from vigilancemeteo.sources import BulletinSource
+
+
+@pytest.fixture()
+def proxy():
+    """Fixture with a proxy using the local files."""
+    return VigilanceMeteoFranceProxy(
+        sources=[
+            BulletinSource(
+                "local",
+                "file:./tests/vigilance_controle.txt",
+                "./tests/NXFR33_LFPW_.xml",
+                "file:./tests/vigilance.zip",
+            )
+        ]
+    )
+
+
+def read_reports(path):
+    """Return the list of the reports written in a file."""
+    with open(str(path)) as report_file:
+        return [json.loads(line) for line in report_file]
+
+
+def test_profile_next_calls(proxy, tmpdir):
+    """Test only the next calls are recorded, with the stages of the refresh."""
+    path = tmpdir.join("profile.json")
+    profiler = proxy.start_profiling(str(path), calls=2)
+    proxy.update_data()
+    proxy.get_alert_list("32")
+    proxy.get_alert_list("32")
+    assert profiler.remaining == 0
+
+    reports = read_reports(path)
+    assert [report["call"] for report in reports] == ["update_data", "get_alert_list"]
+    refresh, query = reports
+    assert set(refresh["stages"]) == set(["checksum", "download", "publish", "parse"])
+    assert refresh["duration"] >= refresh["stages"]["publish"]
+    assert refresh["stages"]["publish"] >= refresh["stages"]["parse"]
+    assert any("parse" in function["function"] for function in refresh["functions"])
+    assert "query" in query["stages"]
+    assert "memory" not in refresh
+
+
+def test_stop_profiling(proxy, tmpdir):
+    """Test nothing is recorded once profiling is stopped."""
+    path = tmpdir.join("profile.json")
+    proxy.start_profiling(str(path))
+    proxy.stop_profiling()
+    proxy.update_data()
+    assert not path.check()
+
+
+def test_nested_calls(tmpdir):
+    """Test a call made by a profiled call is not recorded separately."""
+    path = tmpdir.join("profile.json")
+    profiler = Profiler(str(path), calls=5)
+    assert profiler.run("outer", profiler.run, "inner", sum, [1, 2]) == 3
+    assert [report["call"] for report in read_reports(path)] == ["outer"]
+    assert profiler.remaining == 4
+
+
+def test_failing_call(tmpdir):
+    """Test the report of a call raising an exception."""
+    path = tmpdir.join("profile.json")
+    profiler = Profiler(str(path), calls=1)
+    with pytest.raises(ZeroDivisionError):
+        profiler.run("divide", lambda: 1 / 0)
+    assert "ZeroDivisionError" in read_reports(path)[0]["error"]
+
+
+def test_one_profiled_call_per_process(tmpdir):
+    """Test a call made while another profiler records is not recorded."""
+    first = Profiler(str(tmpdir.join("first.json")), calls=5)
+    second = Profiler(str(tmpdir.join("second.json")), calls=5)
+    assert first.run("outer", second.run, "inner", sum, [1, 2]) == 3
+    assert (first.remaining, second.remaining) == (4, 5)
+    assert not tmpdir.join("second.json").check()
+
+
+def test_other_profiler_active(tmpdir, monkeypatch):
+    """Test the call isn't recorded when another tool profiles the process."""
+
+    def enable(profile):
+        """Fail like cProfile on python 3.12+ when another profiler is active."""
+        raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(cProfile.Profile, "enable", enable)
+    path = tmpdir.join("profile.json")
+    profiler = Profiler(str(path), calls=1)
+    assert profiler.run("sum", sum, [1, 2]) == 3
+    assert (profiler.remaining, path.check()) == (1, False)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 4), reason="requires tracemalloc")
+def test_memory_profile(tmpdir):
+    """Test the memory allocated by a profiled call is reported."""
+    path = tmpdir.join("profile.json")
+    profiler = Profiler(str(path), calls=1, memory=True)
+    data = profiler.run("allocate", lambda: [bytearray(1000) for _ in range(100)])
+    memory = read_reports(path)[0]["memory"]
+    assert memory["retained"] >= 100000
+    assert memory["peak"] >= memory["retained"]
+    assert memory["top"][0]["size"] >= 100000
+    del data
@@ -1,17 +1,30 @@
 # coding: utf-8
 """tests for vigilance module - VigilanceMeteoFranceProxy Class"""
 import datetime
+import gc
+import json
+import os
 import sys
+import zipfile
 
 import pytest
 
 from vigilancemeteo import VigilanceMeteoError, VigilanceMeteoFranceProxy
-from vigilancemeteo.constants import (UPDATE_STATUS_CHECKSUM_CACHED_60S,
+from vigilancemeteo.bulletin import MATRIX_DEPARTMENT_LIST
+from vigilancemeteo.constants import (ALERT_COLOR_LIST,
+                                      ALERT_TYPE_LIST,
+                                      BULLETIN_TODAY,
+                                      BULLETIN_TOMORROW,
+                                      COASTAL_DEPARTMENT_LIST,
+                                      UPDATE_STATUS_CHECKSUM_CACHED_60S,
                                       UPDATE_STATUS_CHECKSUM_UPDATED,
                                       UPDATE_STATUS_ERROR_AND_BULLETIN_EXPIRED,
                                       UPDATE_STATUS_ERROR_BUT_PREVIOUS_BULLETIN_VALID,
                                       UPDATE_STATUS_SAME_CHECKSUM,
+                                      UPDATE_STATUS_SAME_CONTENT,
                                       UPDATE_STATUS_XML_UPDATED)
+from vigilancemeteo.export import COLUMNS, export_alerts
+from vigilancemeteo.sources import BulletinSource
 
 
 @pytest.yield_fixture()
@@ -194,3 +207,409 @@ def test_first_try_xml_unreachable(fix_local_data):
     # should raise an error
     with pytest.raises(VigilanceMeteoError):
         client.update_data()
+
+
+@pytest.yield_fixture()
+def fix_local_zip_data():
+    """Fixture to replace webiste compressed answer by a local one."""
+    # Using local answer instead of MeteoFrance website
+    zip_init_value = VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_ZIP
+    checksum_init_value = VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_CHECKSUM
+
+    VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_ZIP = "file:./tests/vigilance.zip"
+    VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_CHECKSUM = (
+        "file:./tests/vigilance_controle_zip.txt"
+    )
+    yield None
+
+    # Set back the initial value(using website instead of local answer)
+    VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_ZIP = zip_init_value
+    VigilanceMeteoFranceProxy.URL_VIGILANCE_METEO_CHECKSUM = checksum_init_value
+
+
+def test_compressed_source(fix_local_zip_data):
+    """Test the bulletin is read from the compressed data source."""
+    client = VigilanceMeteoFranceProxy(compressed=True)
+    client.update_data()
+
+    assert (
+        client.status,
+        client.checksum,
+        client.bulletin_date.isoformat(),
+        client.get_alert_list("32")["Orages"],
+    ) == (UPDATE_STATUS_XML_UPDATED, "1751354976", "2018-03-18T16:00:00+01:00", "Rouge")
+
+
+def test_compressed_source_wrong_size(fix_local_zip_data):
+    """Test behaviour when the archive size differs from the advertised one."""
+    client = VigilanceMeteoFranceProxy(compressed=True)
+
+    # The control file advertises the size of the real Météo France archive
+    client.URL_VIGILANCE_METEO_CHECKSUM = "file:./tests/vigilance_controle.txt"
+
+    # should raise an error
+    with pytest.raises(VigilanceMeteoError):
+        client.update_data()
+
+
+def test_compressed_source_missing_bulletin(fix_local_zip_data):
+    """Test behaviour when the bulletin is not in the compressed data source."""
+    client = VigilanceMeteoFranceProxy(compressed=True)
+
+    # fake the name of the bulletin inside the archive
+    client.ZIP_XML_MEMBER = "NXFR99_LFPW_.xml"
+
+    # should raise an error
+    with pytest.raises(VigilanceMeteoError):
+        client.update_data()
+
+
+def test_same_payload_with_new_checksum(fix_local_data):
+    """Test a new checksum with the same data source doesn't parse it again."""
+    client = VigilanceMeteoFranceProxy()
+    client.update_data()
+    first_xml_tree = client.xml_tree
+
+    # fake the cheksum file to simulate new checksum file
+    client.URL_VIGILANCE_METEO_CHECKSUM = "file:./tests/vigilance_controle_2.txt"
+
+    # simulate 2 minutes wait
+    client._latest_check_date = client._latest_check_date - datetime.timedelta(
+        seconds=120
+    )
+    client.update_data()
+
+    assert (client.status, client.checksum, client.xml_tree) == (
+        UPDATE_STATUS_SAME_CONTENT,
+        "1751354978",
+        first_xml_tree,
+    )
+
+
+def test_same_alerts_with_new_payload(fix_local_data, tmpdir):
+    """Test a new bulletin with the same alerts keeps the previous alerts."""
+    client = VigilanceMeteoFranceProxy()
+    client.update_data()
+    first_snapshot = client.snapshot
+
+    # fake a new bulletin published later with the same alerts
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        content = xml_file.read()
+    new_xml = tmpdir.join("NXFR33_LFPW_.xml")
+    new_xml.write_binary(
+        content.replace(b'dateinsert="20180318160000"', b'dateinsert="20180318170000"')
+    )
+    client.URL_VIGILANCE_METEO_XML = str(new_xml)
+    client.URL_VIGILANCE_METEO_CHECKSUM = "file:./tests/vigilance_controle_2.txt"
+
+    # simulate 2 minutes wait
+    client._latest_check_date = client._latest_check_date - datetime.timedelta(
+        seconds=120
+    )
+    client.update_data()
+
+    assert (
+        client.status,
+        client.bulletin_date.isoformat(),
+        client.snapshot is first_snapshot,
+        client.snapshot.alerts is first_snapshot.alerts,
+    ) == (UPDATE_STATUS_SAME_CONTENT, "2018-03-18T17:00:00+01:00", False, True)
+
+
+def test_metadata_without_xml_tree(fix_local_data):
+    """Test bulletin metadata are available without keeping the XML tree."""
+    client = VigilanceMeteoFranceProxy(keep_xml_tree=False)
+    client.update_data()
+    metadata = client.metadata
+
+    assert (
+        client.xml_tree,
+        metadata.forecast_date.isoformat(),
+        metadata.run_date.isoformat(),
+        metadata.forecast_range,
+        metadata.version,
+        metadata.flood_departments,
+        metadata.advice.startswith("Neige-Verglas/Orange"),
+        metadata.comment,
+        client.get_alert_list("32")["Orages"],
+    ) == (
+        None,
+        "2018-03-19T16:00:00+01:00",
+        "2018-03-18T16:00:00+01:00",
+        24,
+        1,
+        ("99", "2A", "2B", "22", "74"),
+        True,
+        "Petit épisode neigeux dimanche soir et lundi matin de l'Ile de France "
+        "à la Normandie.",
+        "Rouge",
+    )
+    # Converted values are memoized
+    assert metadata.forecast_date is metadata.forecast_date
+
+
+def test_rollups(fix_local_data):
+    """Test national, regional and coastal synthesis of the alerts."""
+    client = VigilanceMeteoFranceProxy()
+    rollups = client.get_rollups()
+
+    assert (
+        rollups["national"]["departments"],
+        rollups["national"]["counts"]["Orages"],
+        rollups["national"]["max"]["Neige-verglas"],
+        rollups["national"]["color"],
+        rollups["regions"]["Occitanie"]["color"],
+        rollups["regions"]["Île-de-France"]["counts"]["Neige-verglas"]["Orange"],
+        rollups["regions"]["Corse"]["max"]["Vagues-submersion"],
+        rollups["coastal"]["departments"],
+        rollups["coastal"]["color"],
+        len(rollups["regions"]),
+    ) == (
+        96,
+        {"Vert": 86, "Jaune": 9, "Orange": 0, "Rouge": 1},
+        "Orange",
+        "Rouge",
+        "Rouge",
+        7,
+        "Jaune",
+        25,
+        "Orange",
+        13,
+    )
+    # Synthesis is computed once per bulletin
+    assert client.get_rollups() is rollups
+
+
+@pytest.fixture()
+def tomorrow_bulletin(tmpdir):
+    """Fixture to build a next day bulletin and a compressed data source."""
+    with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+        today = xml_file.read()
+    tomorrow = today.replace(b'<DV dep="32" coul="4">', b'<DV dep="32" coul="3">')
+    tmpdir.join("NXFR34_LFPW_.xml").write_binary(tomorrow)
+
+    with zipfile.ZipFile(str(tmpdir.join("vigilance.zip")), "w") as archive:
+        archive.writestr("NXFR33_LFPW_.xml", today)
+        archive.writestr("NXFR34_LFPW_.xml", tomorrow)
+    tmpdir.join("vigilance_controle.txt").write(
+        "Fri Mar 15 22:29:02 CET 2019\n1751354976 {} vigilance.zip".format(
+            tmpdir.join("vigilance.zip").size()
+        )
+    )
+    return tmpdir
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_several_bulletins(tomorrow_bulletin, compressed):
+    """Test today and tomorrow bulletins are fetched by the same proxy."""
+    source = BulletinSource(
+        "local",
+        "file:" + str(tomorrow_bulletin.join("vigilance_controle.txt")),
+        {
+            BULLETIN_TODAY: "./tests/NXFR33_LFPW_.xml",
+            BULLETIN_TOMORROW: str(tomorrow_bulletin.join("NXFR34_LFPW_.xml")),
+        },
+        "file:" + str(tomorrow_bulletin.join("vigilance.zip")),
+    )
+    client = VigilanceMeteoFranceProxy(
+        compressed=compressed,
+        sources=[source],
+        bulletins=[BULLETIN_TODAY, BULLETIN_TOMORROW],
+    )
+    client.update_data()
+
+    assert (
+        client.status,
+        client.get_alert_list("32")["Orages"],
+        client.get_alert_list("32", BULLETIN_TODAY)["Orages"],
+        client.get_alert_list("32", BULLETIN_TOMORROW)["Orages"],
+        sorted(client.snapshots),
+    ) == (
+        UPDATE_STATUS_XML_UPDATED,
+        "Rouge",
+        "Rouge",
+        "Orange",
+        [BULLETIN_TODAY, BULLETIN_TOMORROW],
+    )
+
+
+def test_missing_bulletin(fix_local_data):
+    """Test a missing secondary bulletin doesn't prevent the update."""
+    client = VigilanceMeteoFranceProxy(bulletins=[BULLETIN_TODAY, BULLETIN_TOMORROW])
+    client.URL_VIGILANCE_METEO_XML_TOMORROW = "./tests/fake_xml.xml"
+    client.update_data()
+
+    assert client.status == UPDATE_STATUS_XML_UPDATED
+    with pytest.raises(VigilanceMeteoError):
+        client.get_snapshot(BULLETIN_TOMORROW)
+
+
+def test_missing_bulletin_downloaded_again(fix_local_data, tomorrow_bulletin):
+    """Test a failed secondary bulletin is downloaded again on the next poll."""
+    client = VigilanceMeteoFranceProxy(bulletins=[BULLETIN_TODAY, BULLETIN_TOMORROW])
+    client.URL_VIGILANCE_METEO_XML_TOMORROW = "./tests/fake_xml.xml"
+    client.update_data()
+    client.URL_VIGILANCE_METEO_XML_TOMORROW = str(
+        tomorrow_bulletin.join("NXFR34_LFPW_.xml")
+    )
+
+    # Same checksum, but the bulletin of tomorrow is still pending
+    client._latest_check_date = None  # pylint: disable=protected-access
+    client.update_data()
+    assert (
+        client.status,
+        client.get_alert_list("32", BULLETIN_TOMORROW)["Orages"],
+        client.get_snapshot(BULLETIN_TOMORROW).checksum,
+    ) == (UPDATE_STATUS_SAME_CHECKSUM, "Orange", client.checksum)
+
+    # Nothing left to download
+    client._latest_check_date = None  # pylint: disable=protected-access
+    client.URL_VIGILANCE_METEO_XML_TOMORROW = "./tests/fake_xml.xml"
+    client.update_data()
+    assert client.get_alert_list("32", BULLETIN_TOMORROW)["Orages"] == "Orange"
+
+
+def test_departments_at_risk(fix_local_data):
+    """Test the queries of the departments at risk."""
+    client = VigilanceMeteoFranceProxy()
+
+    # 92, 93 and 94 get the alerts of 75 in both queries
+    assert client.get_departments_at_risk("Neige-verglas") == [
+        "14", "27", "75", "78", "91", "92", "93", "94", "95",
+    ]
+    assert [
+        client.get_alert_list(department)["Neige-verglas"]
+        for department in ["75", "92", "93", "94"]
+    ] == ["Orange", "Orange", "Orange", "Orange"]
+
+    assert client.get_departments_at_risk("Orages", "Rouge") == ["32"]
+    assert client.get_departments_at_risk(
+        ["Inondation", "Vagues-submersion"], "Orange"
+    ) == []
+    assert client.get_departments_at_risk(["Neige-verglas", "Orages"]) == [
+        "14", "27", "32", "75", "78", "91", "92", "93", "94", "95",
+    ]
+    # Any iterable of alert types
+    assert client.get_departments_at_risk(
+        frozenset(["Neige-verglas", "Orages"])
+    ) == client.get_departments_at_risk(set(["Orages", "Neige-verglas"]))
+    assert client.get_departments_at_risk(
+        alert_type for alert_type in ["Orages"]
+    ) == ["32"]
+    # Same result as the alert lists of all departments
+    assert client.get_departments_at_risk(["Vent violent"], "Jaune") == [
+        department
+        for department in MATRIX_DEPARTMENT_LIST
+        if client.get_alert_list(department)["Vent violent"] != "Vert"
+    ]
+    with pytest.raises(ValueError):
+        client.get_departments_at_risk("Orages", "Violet")
+
+
+def test_export_alerts(fix_local_data):
+    """Test the columnar export of the alerts."""
+    client = VigilanceMeteoFranceProxy()
+    columns = client.export_alerts()
+
+    rows = len(MATRIX_DEPARTMENT_LIST) * len(ALERT_TYPE_LIST)
+    assert [len(columns[name]) for name in COLUMNS] == [rows] * 4
+    assert columns["color"] == client.snapshot.alerts.color_matrix
+    assert set(columns["bulletin_date"]) == set([1521385200])
+
+    # Row of the 'Orages' alert in department 32
+    row = MATRIX_DEPARTMENT_LIST.index("32") * len(ALERT_TYPE_LIST) + 2
+    assert (
+        MATRIX_DEPARTMENT_LIST[columns["department"][row]],
+        ALERT_TYPE_LIST[columns["alert_type"][row]],
+        ALERT_COLOR_LIST[columns["color"][row]],
+    ) == ("32", "Orages", "Rouge")
+
+    # Batch of bulletins
+    batch = export_alerts([client.snapshot, client.snapshot])
+    assert len(batch["department"]) == 2 * rows
+
+    with pytest.raises(ValueError):
+        client.export_alerts("csv")
+
+
+def test_export_alerts_numpy(fix_local_data):
+    """Test the export of the alerts to NumPy."""
+    numpy = pytest.importorskip("numpy")
+    client = VigilanceMeteoFranceProxy()
+    columns = client.export_alerts("numpy")
+
+    assert columns["color"].dtype == numpy.uint8
+    assert str(columns["bulletin_date"][0]) == "2018-03-18T15:00:00"
+
+
+def test_export_alerts_arrow(fix_local_data):
+    """Test the export of the alerts to pyarrow."""
+    pytest.importorskip("pyarrow")
+    client = VigilanceMeteoFranceProxy()
+    table = client.export_alerts("arrow")
+
+    assert table.column_names == COLUMNS
+    assert table.num_rows == len(MATRIX_DEPARTMENT_LIST) * len(ALERT_TYPE_LIST)
+
+
+def test_map(fix_local_data):
+    """Test the GeoJSON and SVG maps of the alerts."""
+    client = VigilanceMeteoFranceProxy()
+    geojson = client.get_map()
+    features = dict(
+        (feature["id"], feature) for feature in json.loads(geojson)["features"]
+    )
+
+    assert features["32"]["properties"]["color"] == "Rouge"
+    assert features["32"]["properties"]["alerts"]["Orages"] == "Rouge"
+    assert features["32"]["geometry"]["type"] == "Polygon"
+    assert features["85"]["geometry"]["type"] == "MultiPolygon"
+    assert features["2A10"]["properties"]["coastal"] is True
+    assert set(features) == set(
+        MATRIX_DEPARTMENT_LIST
+        + [department + "10" for department in COASTAL_DEPARTMENT_LIST]
+    )
+
+    svg = client.get_map("svg")
+    assert svg.startswith(b"<svg ") and b'id="zone-32" fill="#cc0000"' in svg
+
+    # Maps are rendered once per bulletin
+    assert client.get_map() is geojson
+    with pytest.raises(ValueError):
+        client.get_map("png")
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "register_at_fork"), reason="requires os.register_at_fork()"
+)
+def test_preload_and_fork(fix_local_data):
+    """Test a preloaded proxy is usable in a forked process."""
+    client = VigilanceMeteoFranceProxy(keep_xml_tree=False)
+    freeze_count = gc.get_freeze_count()
+    client.preload()
+    # The garbage collector is left alone by default
+    assert gc.get_freeze_count() == freeze_count
+
+    # Fork while another thread is updating the proxy
+    with client._update_lock:
+        pid = os.fork()
+        if pid == 0:
+            # In the child: the lock is free and the preloaded snapshot is used
+            valid = False
+            try:
+                valid = client.get_alert_list("32")["Orages"] == "Rouge"
+            finally:
+                os._exit(0 if valid else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+
+@pytest.mark.skipif(not hasattr(gc, "freeze"), reason="requires gc.freeze()")
+def test_preload_freeze_gc(fix_local_data):
+    """Test preload() freezes the garbage collector only when asked to."""
+    client = VigilanceMeteoFranceProxy(keep_xml_tree=False)
+    try:
+        client.preload(freeze_gc=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,184 @@
+# coding: utf-8
+# pylint: disable= redefined-outer-name
+"""tests for vigilance module - memory footprint of the proxy and the alerts
+
+Memory is measured with tracemalloc, which only traces the Python allocator:
+the memory of the libxml2 documents is not included but the lxml proxies are.
+The retained memory only counts the allocations of the package and of these
+tests: threads left by other tests may allocate memory meanwhile.
+"""
+import datetime
+import gc
+import os
+
+import pytest
+
+import vigilancemeteo
+from vigilancemeteo import DepartmentWeatherAlert, VigilanceMeteoFranceProxy
+from vigilancemeteo.bulletin import BulletinAlerts, BulletinSnapshot
+from vigilancemeteo.constants import UPDATE_STATUS_XML_UPDATED, VALID_DEPARTMENT_LIST
+from vigilancemeteo.sources import BulletinSource
+
+tracemalloc = pytest.importorskip("tracemalloc")
+etree = pytest.importorskip("lxml.etree")
+
+# Number of different bulletins published in a loop during the rotations
+BULLETIN_VARIANTS = 3
+
+# Files whose allocations are counted in the retained memory
+MEASURED_FILES = [
+    tracemalloc.Filter(
+        True, os.path.join(os.path.dirname(vigilancemeteo.__file__), "*")
+    ),
+    tracemalloc.Filter(True, os.path.splitext(__file__)[0] + ".py"),
+]
+
+
+class _RotatingBulletin(object):
+    """Local source publishing a new bulletin on each call to rotate()."""
+
+    def __init__(self, directory):
+        with open("./tests/NXFR33_LFPW_.xml", "rb") as xml_file:
+            self._content = xml_file.read()
+        self._directory = directory
+        self.rotations = 0
+        self.source = BulletinSource(
+            "local",
+            "file:" + str(directory.join("vigilance_controle.txt")),
+            str(directory.join("NXFR33_LFPW_.xml")),
+        )
+        self.rotate()
+
+    def rotate(self):
+        """Publish the next bulletin: new date, new checksum and new alerts."""
+        variant = self.rotations % BULLETIN_VARIANTS
+        self._directory.join("NXFR33_LFPW_.xml").write_binary(
+            self._content.replace(
+                b'dateinsert="20180318160000"',
+                'dateinsert="201803181{}0000"'.format(6 + variant).encode("utf-8"),
+            ).replace(
+                b'<DV dep="32" coul="4">',
+                '<DV dep="32" coul="{}">'.format(2 + variant).encode("utf-8"),
+            )
+        )
+        self._directory.join("vigilance_controle.txt").write(
+            "Sun Mar 18 16:00:00 CET 2018\n{} 5973 vigilance.zip\n".format(
+                1000 + self.rotations
+            )
+        )
+        self.rotations += 1
+
+
+@pytest.fixture()
+def rotating_bulletin(tmpdir):
+    """Fixture to publish local bulletins, with the lazy imports done."""
+    bulletin = _RotatingBulletin(tmpdir)
+    # Warm up: pytz zone files, lxml and urllib are loaded once per process
+    VigilanceMeteoFranceProxy(sources=[bulletin.source]).update_data()
+    return bulletin
+
+
+def _refresh(proxy, bulletin):
+    """Publish a new bulletin and refresh the proxy without waiting 60s."""
+    bulletin.rotate()
+    proxy._latest_check_date = proxy._latest_check_date - datetime.timedelta(
+        seconds=120
+    )
+    proxy.update_data()
+    assert proxy.status == UPDATE_STATUS_XML_UPDATED
+
+
+def _count_instances(cls):
+    """Return the number of living instances of a class."""
+    gc.collect()
+    return sum(1 for instance in gc.get_objects() if isinstance(instance, cls))
+
+
+def _measure(function):
+    """Return the retained and the peak memory allocated by function()."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        before = tracemalloc.take_snapshot().filter_traces(MEASURED_FILES)
+        result = function()
+        gc.collect()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot().filter_traces(MEASURED_FILES)
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, retained, peak - start
+
+
+@pytest.mark.parametrize("keep_xml_tree", [True, False])
+def test_refresh_footprint(rotating_bulletin, keep_xml_tree):
+    """Test the memory used by an update_data() refresh."""
+    proxy = VigilanceMeteoFranceProxy(
+        sources=[rotating_bulletin.source], keep_xml_tree=keep_xml_tree
+    )
+    _, retained, peak = _measure(proxy.update_data)
+
+    assert retained < 64 * 1024
+    assert peak < 512 * 1024
+
+
+def test_snapshot_footprint(rotating_bulletin):
+    """Test the memory used by a national snapshot and its derived values."""
+    proxy = VigilanceMeteoFranceProxy(
+        sources=[rotating_bulletin.source], keep_xml_tree=False
+    )
+    proxy.update_data()
+
+    def derive_values():
+        """Compute all the values derived from the snapshot."""
+        for department in VALID_DEPARTMENT_LIST:
+            proxy.snapshot.alerts.get_alert_list(department)
+        return proxy.get_rollups()
+
+    _, retained, _ = _measure(derive_values)
+    assert retained < 256 * 1024
+
+
+def test_department_alerts_footprint(rotating_bulletin):
+    """Test the memory used by 10k department alerts sharing a proxy."""
+    proxy = VigilanceMeteoFranceProxy(sources=[rotating_bulletin.source])
+
+    def create_alerts():
+        """Create 10k department alerts."""
+        return [
+            DepartmentWeatherAlert(
+                VALID_DEPARTMENT_LIST[index % len(VALID_DEPARTMENT_LIST)], proxy
+            )
+            for index in range(10000)
+        ]
+
+    alerts, retained, _ = _measure(create_alerts)
+    assert len(alerts) == 10000
+    # About 100 bytes per department alert, list included
+    assert retained < 1024 * 1024
+
+
+@pytest.mark.parametrize("keep_xml_tree", [True, False])
+def test_rotations_release_old_bulletins(rotating_bulletin, keep_xml_tree):
+    """Test old XML trees and snapshots are released over many rotations."""
+    proxy = VigilanceMeteoFranceProxy(
+        sources=[rotating_bulletin.source], keep_xml_tree=keep_xml_tree
+    )
+    alert = DepartmentWeatherAlert("32", proxy)
+    for _ in range(BULLETIN_VARIANTS):
+        _refresh(proxy, rotating_bulletin)
+
+    def rotate_bulletins():
+        """Publish 100 bulletins."""
+        for _ in range(100):
+            _refresh(proxy, rotating_bulletin)
+            alert.update_department_status()
+
+    # Interpreter free lists and caches keep a few KB, a leaked bulletin would
+    # retain more than 640 bytes per rotation.
+    _, retained, _ = _measure(rotate_bulletins)
+    assert retained < 64 * 1024
+    assert _count_instances(BulletinSnapshot) == 1
+    assert _count_instances(BulletinAlerts) == 1
+    assert _count_instances(etree._ElementTree) == (1 if keep_xml_tree else 0)